@@ -0,0 +1,387 @@
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from topics import MIN_INTERVALS
+
+
+def _single(value):
+    """단일 시계열 값 → {series: value}"""
+    return {"": value} if value is not None else {}
+
+
+# 증가 추세가 없어 고갈 예상 시간이 없는 자원의 값 (알림 해제용, 1년)
+NO_EXHAUSTION_HOURS = 24 * 365
+
+
+def _limits_values(snapshot: dict, field: str) -> dict:
+    limits = snapshot.get("limits")
+    if not limits or not limits.get("available"):
+        return {}
+    if field == "hours_to_exhaustion":
+        return {r["resource"]: r["time_to_exhaustion"] / 3600 if r["time_to_exhaustion"] is not None
+                else NO_EXHAUSTION_HOURS for r in limits["resources"]}
+    return {r["resource"]: r[field] for r in limits["resources"]}
+
+
+def _gpu_values(snapshot: dict, field: str) -> dict:
+    gpu = snapshot.get("gpu")
+    if not gpu or not gpu.get("available"):
+        return {}
+    return {str(g["id"]): g[field] for g in gpu["gpus"]}
+
+
+# 메트릭 이름 → (필요 토픽, 스냅샷에서 {시계열 라벨: 값} 추출 함수)
+METRICS = {
+    "cpu.percent": ("cpu", lambda s: _single(s["cpu"]["usage"]["percent"])),
+    "cpu.temperature": ("cpu", lambda s: _single(
+        s["cpu"]["temperature"]["value"] if s["cpu"]["temperature"]["available"] else None)),
+    "memory.percent": ("memory", lambda s: _single(s["memory"]["virtual"]["percent"])),
+    "swap.percent": ("memory", lambda s: _single(s["memory"]["swap"]["percent"])),
+    "memory.pressure": ("memory", lambda s: _single(
+        s["memory"]["pressure"]["psi"]["memory"]["some"]["avg10"])),
+    "memory.major_faults": ("memory", lambda s: _single(
+        s["memory"]["pressure"]["reclaim"].get("major_faults"))),
+    "memory.swap_out": ("memory", lambda s: _single(
+        s["memory"]["pressure"]["reclaim"].get("swap_out_pages"))),
+    "gpu.load": ("gpu", lambda s: _gpu_values(s, "load")),
+    "gpu.temperature": ("gpu", lambda s: _gpu_values(s, "temperature")),
+    "disk.percent": ("disk", lambda s: {p["mountpoint"]: p["percent"] for p in s["disk"]["partitions"]}),
+    "network.upload": ("network", lambda s: _single(s["network"]["speed"]["upload_speed"])),
+    "network.download": ("network", lambda s: _single(s["network"]["speed"]["download_speed"])),
+    "connections.total": ("connections", lambda s: _single(s["connections"]["total"])),
+    "processes.spawn_rate": ("processes", lambda s: _single(s["processes"]["lifecycle"]["spawn_rate"])),
+    "interrupts.irq_imbalance": ("interrupts", lambda s: _single(s["interrupts"]["imbalance"].get("irq"))),
+    "interrupts.net_rx_imbalance": ("interrupts", lambda s: _single(s["interrupts"]["imbalance"].get("net_rx"))),
+    "system.context_switches": ("interrupts", lambda s: _single(s["interrupts"]["context_switches_per_sec"])),
+    "system.run_queue": ("interrupts", lambda s: _single(s["interrupts"]["run_queue_per_cpu"])),
+    "processes.fork_rate": ("processes", lambda s: _single(s["processes"]["lifecycle"]["fork_rate"])),
+    "limits.percent": ("limits", lambda s: _limits_values(s, "percent")),
+    "limits.hours_to_exhaustion": ("limits", lambda s: _limits_values(s, "hours_to_exhaustion")),
+}
+
+# 기본 규칙 (SPECIFICATION 상태 임계값 기준)
+DEFAULT_RULES = {
+    "interval": 5,
+    "rules": [
+        {"name": "cpu_warning", "metric": "cpu.percent", "type": "threshold",
+         "op": ">=", "value": 60, "clear": 55, "for": 30, "severity": "warning"},
+        {"name": "cpu_critical", "metric": "cpu.percent", "type": "threshold",
+         "op": ">=", "value": 85, "clear": 80, "for": 30, "severity": "critical"},
+        {"name": "cpu_temperature_critical", "metric": "cpu.temperature", "type": "threshold",
+         "op": ">=", "value": 80, "clear": 75, "for": 10, "severity": "critical"},
+        {"name": "memory_warning", "metric": "memory.percent", "type": "threshold",
+         "op": ">=", "value": 70, "clear": 65, "for": 30, "severity": "warning"},
+        {"name": "memory_critical", "metric": "memory.percent", "type": "threshold",
+         "op": ">=", "value": 90, "clear": 85, "for": 10, "severity": "critical"},
+        {"name": "memory_pressure", "metric": "memory.pressure", "type": "threshold",
+         "op": ">=", "value": 10, "clear": 5, "for": 30, "severity": "warning"},
+        {"name": "memory_growth", "metric": "memory.percent", "type": "rate",
+         "op": ">=", "value": 0.5, "window": 60, "for": 30, "severity": "warning"},
+        {"name": "gpu_critical", "metric": "gpu.load", "type": "threshold",
+         "op": ">=", "value": 90, "clear": 85, "for": 30, "severity": "critical"},
+        {"name": "disk_critical", "metric": "disk.percent", "type": "threshold",
+         "op": ">=", "value": 90, "clear": 88, "severity": "critical"},
+        # 고갈 예상에는 5초 샘플이 필요 없고 limits 수집은 비용이 크므로 느린 주기로 평가
+        {"name": "resource_exhaustion_warning", "metric": "limits.percent", "type": "threshold",
+         "op": ">=", "value": 80, "clear": 75, "for": 30, "interval": 60, "severity": "warning"},
+        {"name": "resource_exhaustion_critical", "metric": "limits.percent", "type": "threshold",
+         "op": ">=", "value": 95, "clear": 90, "interval": 60, "severity": "critical"},
+        {"name": "resource_exhaustion_imminent", "metric": "limits.hours_to_exhaustion", "type": "threshold",
+         "op": "<", "value": 6, "clear": 12, "for": 60, "interval": 60, "severity": "warning"},
+        {"name": "cpu_anomaly", "metric": "cpu.percent", "type": "anomaly",
+         "zscore": 4.0, "alpha": 0.05, "warmup": 60, "severity": "warning"},
+    ]
+}
+
+def _interval(value, where: str) -> float:
+    """평가 주기 검증 (양의 유한한 초, 아니면 ValueError)"""
+    try:
+        interval = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid interval in {where}: {value!r}")
+    if not math.isfinite(interval) or interval <= 0:
+        raise ValueError(f"Invalid interval in {where}: {value!r}")
+    return interval
+
+
+_OPS = {
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+}
+
+
+class _Check:
+    """정적 임계값 검사 (히스테리시스 + for 지속 시간)"""
+
+    def __init__(self, rule: dict):
+        self.name = rule["name"]
+        self.metric = rule["metric"]
+        self.severity = rule.get("severity", "warning")
+        self.op = rule.get("op", ">=")
+        if self.op not in _OPS:
+            raise ValueError(f"Invalid op in rule {self.name}: {self.op}")
+        self.threshold = float(rule["value"]) if "value" in rule else None
+        self.clear = float(rule.get("clear", self.threshold)) if self.threshold is not None else None
+        self.for_seconds = float(rule.get("for", 0))
+        # 규칙별 평가 주기 (없으면 설정 전체의 interval)
+        self.interval = _interval(rule["interval"], f"rule {self.name}") if rule.get("interval") is not None else None
+        # 시계열 라벨별 상태
+        self.states: Dict[str, dict] = {}
+
+    def derive(self, state: dict, now: float, value: float) -> Optional[float]:
+        """검사 대상 값 계산 (None 이면 판단 보류)"""
+        return value
+
+    def _breached(self, value: float) -> bool:
+        return _OPS[self.op](value, self.threshold)
+
+    def _cleared(self, value: float) -> bool:
+        # 발생 방향의 반대 쪽으로 clear 값을 넘어야 해제 (히스테리시스)
+        if self.op in (">", ">="):
+            return value < self.clear
+        return value > self.clear
+
+    def evaluate(self, series: str, now: float, raw: float) -> Optional[dict]:
+        """상태 전이 시 이벤트 반환"""
+        state = self.states.setdefault(series, {"firing": False, "pending_since": None})
+        value = self.derive(state, now, raw)
+        if value is None:
+            return None
+
+        if state["firing"]:
+            if self._cleared(value):
+                state["firing"] = False
+                state["pending_since"] = None
+                return self._event("resolved", series, value)
+            return None
+
+        if self._breached(value):
+            if state["pending_since"] is None:
+                state["pending_since"] = now
+            if now - state["pending_since"] >= self.for_seconds:
+                state["firing"] = True
+                return self._event("firing", series, value)
+        else:
+            state["pending_since"] = None
+        return None
+
+    def _event(self, status: str, series: str, value: float) -> dict:
+        label = f"{self.metric}[{series}]" if series else self.metric
+        return {
+            "rule": self.name,
+            "metric": self.metric,
+            "series": series,
+            "severity": self.severity,
+            "status": status,
+            "value": round(value, 3),
+            "threshold": self.threshold,
+            "message": f"{self.name}: {label} = {value:.2f} ({status})"
+        }
+
+
+class _RateCheck(_Check):
+    """변화율 검사 (window 초 동안의 초당 변화량)"""
+
+    def __init__(self, rule: dict):
+        super().__init__(rule)
+        self.window = float(rule.get("window", 60))
+
+    def derive(self, state: dict, now: float, value: float) -> Optional[float]:
+        history = state.setdefault("history", deque())
+        history.append((now, value))
+        while history and now - history[0][0] > self.window:
+            history.popleft()
+        if len(history) < 2 or now - history[0][0] < self.window / 2:
+            return None
+        t0, v0 = history[0]
+        return (value - v0) / (now - t0)
+
+
+class _AnomalyCheck(_Check):
+    """EWMA 기반 z-score 이상 탐지"""
+
+    def __init__(self, rule: dict):
+        rule = dict(rule)
+        rule.setdefault("op", ">=")
+        rule["value"] = float(rule.get("zscore", 3.0))
+        rule.setdefault("clear", rule["value"] * 0.5)
+        super().__init__(rule)
+        self.alpha = float(rule.get("alpha", 0.05))
+        self.warmup = int(rule.get("warmup", 30))
+
+    def derive(self, state: dict, now: float, value: float) -> Optional[float]:
+        count = state.get("count", 0)
+        mean = state.get("mean", value)
+        var = state.get("var", 0.0)
+
+        # 갱신 전 기준선과 비교 (이상값이 기준선을 바로 오염시키지 않도록)
+        std = math.sqrt(var)
+        z = abs(value - mean) / std if std > 1e-9 else 0.0
+
+        diff = value - mean
+        state["mean"] = mean + self.alpha * diff
+        state["var"] = (1 - self.alpha) * (var + self.alpha * diff * diff)
+        state["count"] = count + 1
+
+        if count < self.warmup:
+            return None
+        return z
+
+
+_CHECK_TYPES = {
+    "threshold": _Check,
+    "rate": _RateCheck,
+    "anomaly": _AnomalyCheck,
+}
+
+
+def compile_rules(rules: List[dict]) -> Dict[str, List[_Check]]:
+    """규칙 목록을 메트릭별 검사 목록으로 컴파일 (잘못된 규칙은 ValueError)"""
+    compiled: Dict[str, List[_Check]] = {}
+    names = set()
+    for rule in rules:
+        try:
+            name = rule["name"]
+            metric = rule["metric"]
+            check_type = rule.get("type", "threshold")
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid rule: {rule}")
+        if name in names:
+            raise ValueError(f"Duplicate rule name: {name}")
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric in rule {name}: {metric}")
+        if check_type not in _CHECK_TYPES:
+            raise ValueError(f"Unknown rule type in rule {name}: {check_type}")
+        try:
+            check = _CHECK_TYPES[check_type](rule)
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid rule {name}: {e}")
+        if check.threshold is None:
+            raise ValueError(f"Rule {name} has no value")
+        names.add(name)
+        compiled.setdefault(metric, []).append(check)
+    return compiled
+
+
+class AlertEngine:
+    """스냅샷마다 평가되는 임계값/변화율/이상 탐지 알림 엔진"""
+
+    def __init__(self, rules_path: str = None, log_path: str = None, history: int = 200):
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        self.rules_path = rules_path or os.path.join(base_dir, "..", "config", "alert_rules.json")
+        self.log_path = log_path or os.path.join(base_dir, "..", "logs", "alerts.log")
+        self.lock = threading.Lock()
+        self.events = deque(maxlen=history)
+        self.last_event_id = 0
+        self.config = DEFAULT_RULES
+        self.checks: Dict[str, List[_Check]] = {}
+        self.load()
+
+    def load(self):
+        """규칙 파일 로드 (없거나 읽을 수 없는 규칙이면 기본 규칙)"""
+        config = DEFAULT_RULES
+        if os.path.exists(self.rules_path):
+            try:
+                with open(self.rules_path, "r", encoding="utf-8") as f:
+                    config = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Alert rules load error: {e}")
+        try:
+            self.set_rules(config, save=False)
+        except (ValueError, KeyError, TypeError) as e:
+            # 이름이 바뀌거나 제거된 메트릭을 쓰는 예전 규칙 파일 등 - 서버 시작은 막지 않음
+            print(f"Alert rules load error: {e} (using default rules)")
+            self.set_rules(DEFAULT_RULES, save=False)
+
+    def set_rules(self, config: dict, save: bool = True):
+        """규칙 교체 (컴파일 실패 시 ValueError, 기존 규칙 유지)"""
+        if not isinstance(config, dict) or not isinstance(config.get("rules"), list):
+            raise ValueError("Rules config must have a 'rules' list")
+        if config.get("interval") is not None:
+            _interval(config["interval"], "rules config")
+        checks = compile_rules(config["rules"])
+        with self.lock:
+            self.config = config
+            self.checks = checks
+        if save:
+            os.makedirs(os.path.dirname(self.rules_path), exist_ok=True)
+            with open(self.rules_path, "w", encoding="utf-8") as f:
+                json.dump(config, f, indent=2, ensure_ascii=False)
+
+    def required_topics(self) -> Dict[str, float]:
+        """규칙 평가에 필요한 {토픽: 주기} - 토픽별로 규칙 주기 중 가장 짧은 값 (토픽 최소 주기 이상)"""
+        try:
+            default = _interval(self.config.get("interval", 5), "rules config")
+        except ValueError:
+            default = 5.0
+        with self.lock:
+            intervals = [(METRICS[metric][0], check.interval or default)
+                         for metric, checks in self.checks.items() for check in checks]
+        required = {}
+        for topic, interval in intervals:
+            interval = max(interval, MIN_INTERVALS[topic])
+            required[topic] = min(interval, required.get(topic, interval))
+        return required
+
+    def evaluate(self, snapshot: dict, topics=None) -> List[dict]:
+        """스냅샷 평가 - 메트릭별로 값을 한 번만 추출하고 해당 메트릭의 검사만 실행
+
+        topics 지정 시 이번 주기에 새로 수집된 토픽의 메트릭만 평가
+        """
+        now = time.time()
+        fired = []
+        with self.lock:
+            for metric, checks in self.checks.items():
+                topic, extract = METRICS[metric]
+                if (topics is not None and topic not in topics) or not snapshot.get(topic):
+                    continue
+                try:
+                    values = extract(snapshot)
+                except (KeyError, TypeError):
+                    continue
+                for series, value in values.items():
+                    for check in checks:
+                        event = check.evaluate(series, now, value)
+                        if event:
+                            self.last_event_id += 1
+                            event["id"] = self.last_event_id
+                            event["timestamp"] = datetime.now().isoformat()
+                            self.events.append(event)
+                            fired.append(event)
+        if fired:
+            self._append_log(fired)
+        return fired
+
+    def _append_log(self, events: List[dict]):
+        """알림 이벤트를 로컬 로그(JSON Lines)에 추가"""
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                for event in events:
+                    f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"Alert log error: {e}")
+
+    def get_events_since(self, event_id: int) -> List[dict]:
+        """event_id 이후 발생한 이벤트"""
+        with self.lock:
+            return [e for e in self.events if e["id"] > event_id]
+
+    def get_active(self) -> List[dict]:
+        """현재 발생 중인 알림"""
+        with self.lock:
+            return [
+                {"rule": check.name, "metric": metric, "series": series, "severity": check.severity}
+                for metric, checks in self.checks.items()
+                for check in checks
+                for series, state in check.states.items()
+                if state["firing"]
+            ]
@@ -0,0 +1,155 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from typing import Optional
+
+# brotli 는 선택 의존성 (미설치 시 gzip 만 제공)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 압축 대상 (텍스트 형식) 과 최소 크기
+COMPRESSIBLE = {".html", ".css", ".js", ".json", ".svg", ".txt", ".map"}
+MIN_COMPRESS_SIZE = 512
+# 지문이 붙은 URL 은 내용이 바뀌면 URL 도 바뀌므로 영구 캐시
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+# 지문 없는 URL / index.html 은 매번 ETag 로 재검증
+REVALIDATE_CACHE = "no-cache"
+
+_ACCEPT_PATTERN = re.compile(r"\s*([^;,\s]+)\s*(?:;\s*q=([0-9.]+))?")
+
+
+def _fingerprinted(path: str, digest: str) -> str:
+    """css/style.css → css/style.<해시 10자리>.css"""
+    base, ext = os.path.splitext(path)
+    return f"{base}.{digest[:10]}{ext}"
+
+
+def accepted_encodings(header: Optional[str]) -> set:
+    """Accept-Encoding 헤더에서 허용된(q>0) 인코딩"""
+    accepted = set()
+    for match in _ACCEPT_PATTERN.finditer(header or ""):
+        coding, quality = match.group(1).lower(), match.group(2)
+        try:
+            if quality is None or float(quality) > 0:
+                accepted.add(coding)
+        except ValueError:
+            continue
+    return accepted
+
+
+class Asset:
+    """메모리에 올린 정적 파일 하나와 미리 압축한 변형"""
+
+    def __init__(self, path: str, data: bytes, immutable: bool):
+        self.path = path
+        self.media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if self.media_type.startswith("text/") or self.media_type in ("application/javascript", "image/svg+xml"):
+            self.media_type += "; charset=utf-8"
+        self.digest = hashlib.sha256(data).hexdigest()
+        self.cache_control = IMMUTABLE_CACHE if immutable else REVALIDATE_CACHE
+        self.variants = {"identity": data}
+        if os.path.splitext(path)[1] in COMPRESSIBLE and len(data) >= MIN_COMPRESS_SIZE:
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(compressed) < len(data):
+                self.variants["gzip"] = compressed
+            if brotli is not None:
+                compressed = brotli.compress(data, quality=11)
+                if len(compressed) < len(data):
+                    self.variants["br"] = compressed
+
+    def select(self, accept_encoding: Optional[str]) -> tuple:
+        """(인코딩, 본문) - brotli > gzip > 원본 순"""
+        accepted = accepted_encodings(accept_encoding)
+        for coding in ("br", "gzip"):
+            if coding in self.variants and (coding in accepted or "*" in accepted):
+                return coding, self.variants[coding]
+        return "identity", self.variants["identity"]
+
+    def etag(self, coding: str) -> str:
+        return f'"{self.digest[:16]}-{coding}"'
+
+
+class AssetBundle:
+    """프론트엔드 정적 파일 지문 + 사전 압축 (서버 시작 시 1회 구성)
+
+    참조가 없는 파일부터 지문을 붙이고, 다른 파일을 참조하는 파일(CSS/JS/HTML)은
+    참조 URL 을 지문 URL 로 바꾼 뒤 자신의 지문을 계산한다.
+    같은 디렉터리의 파일 이름을 따옴표로 참조하는 경우 (예: new URL('ws-worker.js', ...)) 도 바꾼다.
+    """
+
+    def __init__(self, source_dir: str, url_prefix: str = "/static/"):
+        self.source_dir = os.path.abspath(source_dir)
+        self.url_prefix = url_prefix
+        self.assets = {}
+        self.urls = {}
+        self.index = None
+        self.build()
+
+    def _read_sources(self) -> dict:
+        sources = {}
+        for directory, _, files in os.walk(self.source_dir):
+            for name in files:
+                full = os.path.join(directory, name)
+                rel = os.path.relpath(full, self.source_dir).replace(os.sep, "/")
+                with open(full, "rb") as f:
+                    sources[rel] = f.read()
+        return sources
+
+    def _rewrite(self, rel: str, data: bytes) -> bytes:
+        """다른 에셋 참조를 지문 URL 로 치환 (텍스트 파일만)"""
+        if os.path.splitext(rel)[1] not in COMPRESSIBLE:
+            return data
+        text = data.decode("utf-8")
+        directory = os.path.dirname(rel)
+        for target, fingerprinted in self.urls.items():
+            text = text.replace(self.url_prefix + target, self.url_prefix + fingerprinted)
+            if os.path.dirname(target) == directory:
+                name, new_name = os.path.basename(target), os.path.basename(fingerprinted)
+                for quote in ("'", '"'):
+                    text = text.replace(f"{quote}{name}{quote}", f"{quote}{new_name}{quote}")
+        return text.encode("utf-8")
+
+    def _references(self, rel: str, data: bytes, pending: set) -> set:
+        if os.path.splitext(rel)[1] not in COMPRESSIBLE:
+            return set()
+        text = data.decode("utf-8", errors="replace")
+        directory = os.path.dirname(rel)
+        found = set()
+        for target in pending:
+            if target == rel:
+                continue
+            name = os.path.basename(target)
+            if (self.url_prefix + target) in text or (
+                    os.path.dirname(target) == directory and (f"'{name}'" in text or f'"{name}"' in text)):
+                found.add(target)
+        return found
+
+    def build(self):
+        sources = self._read_sources()
+        pending = set(sources) - {"index.html"}
+        while pending:
+            # 아직 지문이 없는 파일을 참조하지 않는 파일부터 처리 (순환 참조는 그대로 처리)
+            ready = [rel for rel in pending if not self._references(rel, sources[rel], pending)]
+            if not ready:
+                ready = sorted(pending)
+            for rel in ready:
+                data = self._rewrite(rel, sources[rel])
+                digest = hashlib.sha256(data).hexdigest()
+                fingerprinted = _fingerprinted(rel, digest)
+                self.urls[rel] = fingerprinted
+                self.assets[fingerprinted] = Asset(fingerprinted, data, immutable=True)
+                # 지문 없는 기존 URL 도 같은 내용으로 제공 (재검증 캐시)
+                self.assets[rel] = Asset(rel, data, immutable=False)
+                pending.discard(rel)
+        if "index.html" in sources:
+            self.index = Asset("index.html", self._rewrite("index.html", sources["index.html"]), immutable=False)
+
+    def get(self, path: str) -> Optional[Asset]:
+        return self.assets.get(path)
+
+    def url(self, path: str) -> str:
+        return self.url_prefix + self.urls.get(path, path)
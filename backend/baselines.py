@@ -0,0 +1,219 @@
+import json
+import math
+import os
+import re
+import time
+from typing import Optional
+
+import numpy as np
+
+# 비교 대상 지표 (리포트 시계열 키, 라벨)
+COMPARE_METRICS = (
+    ("cpu", "CPU Usage (%)"),
+    ("memory", "Memory Usage (%)"),
+    ("gpu", "GPU Usage (%)"),
+    ("cpu_temp", "CPU Temp (°C)"),
+    ("gpu_temp", "GPU Temp (°C)"),
+    ("network_upload", "Upload (KB/s)"),
+    ("network_download", "Download (KB/s)"),
+)
+EXTENSION = ".baseline.json"
+
+_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+
+def _default_dir() -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "baselines")
+
+
+def validate_name(name: str) -> str:
+    """경로 탈출 방지용 베이스라인 이름 검증"""
+    if not isinstance(name, str) or not _NAME_PATTERN.match(name) or name.startswith("."):
+        raise ValueError("Baseline name must be 1-64 characters of [A-Za-z0-9_.-]")
+    return name
+
+
+def mann_whitney_u(a: list, b: list) -> tuple:
+    """양측 Mann-Whitney U 검정 (정규 근사 + 동순위 보정)
+
+    반환: (U, p-value, rank-biserial 효과 크기 - 양수면 b 가 큰 쪽)
+    """
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return None, None, None
+    values = np.concatenate([np.asarray(a, dtype=float), np.asarray(b, dtype=float)])
+    order = values.argsort(kind="mergesort")
+    ranks = np.empty(len(values))
+    sorted_values = values[order]
+    # 동순위는 평균 순위
+    _, starts, counts = np.unique(sorted_values, return_index=True, return_counts=True)
+    average = starts + (counts + 1) / 2.0
+    ranks[order] = np.repeat(average, counts)
+    u1 = float(ranks[:n1].sum()) - n1 * (n1 + 1) / 2.0
+    u2 = n1 * n2 - u1
+    n = n1 + n2
+    tie_term = float((counts ** 3 - counts).sum()) / (n * (n - 1)) if n > 1 else 0.0
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term)
+    if variance <= 0:
+        # 모든 값이 같음
+        return u1, 1.0, 0.0
+    # 연속성 보정
+    z = (abs(u1 - n1 * n2 / 2.0) - 0.5) / math.sqrt(variance)
+    p = math.erfc(max(z, 0.0) / math.sqrt(2))
+    return u1, min(p, 1.0), (u2 - u1) / (n1 * n2)
+
+
+def _distribution(values: list) -> Optional[dict]:
+    if not values:
+        return None
+    data = np.asarray(values, dtype=float)
+    return {
+        "n": int(data.size),
+        "median": round(float(np.median(data)), 2),
+        "p95": round(float(np.percentile(data, 95)), 2),
+        "mean": round(float(data.mean()), 2)
+    }
+
+
+def _delta(base: float, current: float) -> dict:
+    change = current - base
+    return {"abs": round(change, 2), "pct": round(change / base * 100, 1) if base else None}
+
+
+def compare(baseline: dict, current: dict, alpha: float = 0.05, min_change_pct: float = 5.0) -> dict:
+    """두 실행의 지표별 분포 비교 (baseline/current: ReportBuilder.export() 형식)
+
+    중앙값/p95 변화량과 Mann-Whitney p-value 를 계산하고, 유의하면서 중앙값 또는 p95 가
+    min_change_pct 이상 변한 지표를 regression(증가)/improvement(감소) 로 판정한다.
+    1초 간격 샘플은 자기상관이 있어 p-value 가 낙관적이므로 변화량 기준을 함께 적용한다.
+    """
+    metrics = []
+    for key, label in COMPARE_METRICS:
+        base_values = baseline["samples"].get(key) or []
+        current_values = current["samples"].get(key) or []
+        base_dist = _distribution(base_values)
+        current_dist = _distribution(current_values)
+        if base_dist is None or current_dist is None:
+            continue
+        _, p_value, effect = mann_whitney_u(base_values, current_values)
+        median_delta = _delta(base_dist["median"], current_dist["median"])
+        p95_delta = _delta(base_dist["p95"], current_dist["p95"])
+        changes = [abs(d["pct"]) for d in (median_delta, p95_delta) if d["pct"] is not None]
+        significant = p_value is not None and p_value < alpha
+        verdict = "unchanged"
+        if significant and (not changes or max(changes) >= min_change_pct):
+            verdict = "regression" if median_delta["abs"] + p95_delta["abs"] > 0 else "improvement"
+        metrics.append({
+            "metric": key,
+            "label": label,
+            "baseline": base_dist,
+            "current": current_dist,
+            "median_delta": median_delta,
+            "p95_delta": p95_delta,
+            "p_value": round(p_value, 6) if p_value is not None else None,
+            "effect_size": round(effect, 3) if effect is not None else None,
+            "significant": significant,
+            "verdict": verdict
+        })
+    return {
+        "baseline": baseline.get("name"),
+        "alpha": alpha,
+        "min_change_pct": min_change_pct,
+        "metrics": metrics,
+        "regressions": [m["metric"] for m in metrics if m["verdict"] == "regression"]
+    }
+
+
+def align_offset(baseline: dict, current: dict, label: Optional[str]) -> float:
+    """같은 라벨의 이벤트가 두 실행에 모두 있으면 그 시점을 맞추는 베이스라인 시각 이동량 (초)"""
+    if not label:
+        return 0.0
+    base_time = next((e["offset"] for e in baseline.get("events", []) if e["label"] == label), None)
+    current_time = next((e["offset"] for e in current.get("events", []) if e["label"] == label), None)
+    if base_time is None or current_time is None:
+        return 0.0
+    return current_time - base_time
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def validate_run(data) -> dict:
+    """저장된 실행 데이터 형식 검증 (직접 수정되거나 잘린 파일은 ValueError)"""
+    if not isinstance(data, dict) or not isinstance(data.get("samples"), dict):
+        raise ValueError("Invalid baseline: missing samples")
+    for key, values in data["samples"].items():
+        if not isinstance(values, list) or not all(_is_number(v) for v in values):
+            raise ValueError(f"Invalid baseline samples: {key}")
+    series = data.get("series", {})
+    if not isinstance(series, dict):
+        raise ValueError("Invalid baseline: series must be an object")
+    for key, points in series.items():
+        if not (isinstance(points, list) and len(points) == 2 and all(isinstance(p, list) for p in points)
+                and len(points[0]) == len(points[1]) and all(_is_number(v) for p in points for v in p)):
+            raise ValueError(f"Invalid baseline series: {key}")
+    events = data.get("events", [])
+    if not isinstance(events, list) or not all(
+            isinstance(e, dict) and _is_number(e.get("offset")) and isinstance(e.get("label"), str) for e in events):
+        raise ValueError("Invalid baseline events")
+    return data
+
+
+class BaselineStore:
+    """이름 붙인 모니터링 실행 (분포 표본, 차트 시계열, 이벤트) 을 JSON 으로 보관"""
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or _default_dir()
+
+    def path_for(self, name: str) -> str:
+        return os.path.join(self.directory, validate_name(name) + EXTENSION)
+
+    def save(self, name: str, run: dict, overwrite: bool = False) -> dict:
+        path = self.path_for(name)
+        if os.path.exists(path) and not overwrite:
+            raise RuntimeError(f"Baseline already exists: {name}")
+        os.makedirs(self.directory, exist_ok=True)
+        data = dict(run, name=name, saved=time.time())
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        return self.describe(data)
+
+    def load(self, name: str) -> dict:
+        path = self.path_for(name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(name)
+        with open(path, "r") as f:
+            return validate_run(json.load(f))
+
+    @staticmethod
+    def describe(data: dict) -> dict:
+        return {
+            "name": data["name"],
+            "saved": data.get("saved"),
+            "start": data.get("start"),
+            "duration": data.get("duration"),
+            "samples": {key: len(values) for key, values in data["samples"].items()},
+            "events": data.get("events", [])
+        }
+
+    def list(self) -> list:
+        baselines = []
+        if not os.path.isdir(self.directory):
+            return baselines
+        for filename in sorted(os.listdir(self.directory)):
+            if not filename.endswith(EXTENSION):
+                continue
+            try:
+                baselines.append(self.describe(self.load(filename[:-len(EXTENSION)])))
+            except (OSError, ValueError, KeyError):
+                continue
+        return baselines
+
+    def delete(self, name: str):
+        path = self.path_for(name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(name)
+        os.remove(path)
@@ -0,0 +1,240 @@
+"""핫 패스 벤치마크 실행기
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.bench --label v1.1
+    python -m benchmarks.bench --only process_monitor json_encode --iterations 50
+    python -m benchmarks.bench --compare benchmarks/results/20260101_120000_v1.0.json
+
+결과는 benchmarks/results/ 에 JSON 으로 저장되어 버전 간 비교에 사용된다.
+"""
+import argparse
+import copy
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import psutil
+
+from benchmarks.fixtures import build_fake_procfs, make_recording, make_snapshot
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def _read_syscalls() -> int:
+    """현재 프로세스의 read/write 계열 시스템 콜 수 (Linux /proc/self/io)"""
+    try:
+        with open("/proc/self/io") as f:
+            values = dict(line.split(": ") for line in f.read().splitlines())
+        return int(values["syscr"]) + int(values["syscw"])
+    except (OSError, KeyError, ValueError):
+        return -1
+
+
+def measure(fn, iterations: int, warmup: int = 2) -> dict:
+    """호출당 지연 시간, 메모리 할당, 시스템 콜 측정"""
+    for _ in range(warmup):
+        fn()
+
+    # 지연 시간 (GC 영향 최소화)
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    timings = []
+    sys_before = _read_syscalls()
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    sys_after = _read_syscalls()
+
+    # 할당 (tracemalloc 오버헤드가 크므로 1회만 별도 측정)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    fn()
+    after = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    alloc_blocks = sum(s.count_diff for s in stats if s.count_diff > 0)
+
+    timings.sort()
+    return {
+        "iterations": iterations,
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "p50_ms": round(timings[len(timings) // 2], 3),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+        "max_ms": round(timings[-1], 3),
+        "peak_alloc_kb": round(peak / 1024, 1),
+        "retained_kb": round(current / 1024, 1),
+        "alloc_blocks": alloc_blocks,
+        "syscalls_per_call": round((sys_after - sys_before) / iterations, 1) if sys_before >= 0 else None
+    }
+
+
+class FakeProcfs:
+    """psutil.PROCFS_PATH 를 가짜 /proc 트리로 교체하는 컨텍스트"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.saved = None
+
+    def __enter__(self):
+        self.saved = psutil.PROCFS_PATH
+        psutil.PROCFS_PATH = self.path
+        return self
+
+    def __exit__(self, *exc):
+        psutil.PROCFS_PATH = self.saved
+
+
+def build_cases(args, workdir: str) -> dict:
+    """벤치마크 케이스 {이름: (설정 함수, 측정 함수)}"""
+    procfs = None
+    if sys.platform.startswith("linux"):
+        procfs = build_fake_procfs(os.path.join(workdir, "proc"), args.processes, args.sockets)
+
+    snapshot = make_snapshot()
+    recording = make_recording(args.recording_points)
+    cases = {}
+
+    from monitors.cpu_monitor import CPUMonitor
+    from monitors.process_monitor import ProcessMonitor
+    from monitors.network_monitor import NetworkMonitor
+
+    cpu_monitor = CPUMonitor()
+    cases["cpu_monitor"] = (None, cpu_monitor.get_all)
+
+    process_monitor = ProcessMonitor()
+    cases["process_monitor"] = (procfs, lambda: process_monitor.get_all(limit=5))
+
+    network_monitor = NetworkMonitor()
+    cases["network_monitor"] = (procfs, network_monitor.get_all)
+
+    # get_system_data() 는 main 모듈의 전역 스냅샷을 deepcopy (GPU 모듈 등 의존성 필요)
+    try:
+        import main
+        main.latest_system_data = snapshot
+        cases["get_system_data"] = (None, main.get_system_data)
+    except Exception as e:
+        print(f"[skip] get_system_data: main import failed ({e}); measuring copy.deepcopy directly")
+        cases["get_system_data"] = (None, lambda: copy.deepcopy(snapshot))
+
+    cases["json_encode"] = (None, lambda: json.dumps(snapshot))
+
+    from pdf_generator import PDFGenerator
+    generator = PDFGenerator(output_dir=os.path.join(workdir, "reports"))
+    cases["pdf_generate"] = (None, lambda: generator.generate(recording, duration_minutes=5))
+
+    # 점진 조립: 기록 길이와 무관하게 중지 시 남은 라인 차트 렌더링 + 조립만 수행
+    from report_builder import ReportBuilder
+    builder = ReportBuilder(generator, lambda: {"disk": recording["disk"], "system_info": recording["system_info"]})
+    builder.start_time = time.time() - len(recording["cpu"])
+    for i in range(len(recording["cpu"])):
+        builder.add({key: recording[key][i] for key in ("cpu", "memory", "gpu", "network_upload", "network_download")},
+                    builder.start_time + i)
+    builder._render_static()
+
+    def report_finish():
+        builder.add({"cpu": 50.0, "memory": 40.0, "network_upload": 1.0, "network_download": 1.0})
+        builder.finish(duration_minutes=5)
+    cases["report_finish"] = (None, report_finish)
+
+    return cases
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: dict, baseline_path: str):
+    """기준 결과 파일과 비교 출력"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nComparison with {baseline['label']} ({baseline['revision']}):")
+    print(f"{'case':<20}{'base p50':>12}{'now p50':>12}{'delta':>10}{'base KB':>10}{'now KB':>10}")
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if not base:
+            continue
+        delta = (result["p50_ms"] - base["p50_ms"]) / base["p50_ms"] * 100 if base["p50_ms"] else 0
+        print(f"{name:<20}{base['p50_ms']:>12.3f}{result['p50_ms']:>12.3f}{delta:>+9.1f}%"
+              f"{base['peak_alloc_kb']:>10.1f}{result['peak_alloc_kb']:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="System monitor hot-path benchmarks")
+    parser.add_argument("--label", default="local", help="결과 라벨 (예: 버전)")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--processes", type=int, default=2000, help="가짜 /proc 프로세스 수")
+    parser.add_argument("--sockets", type=int, default=5000, help="가짜 /proc 소켓 수")
+    parser.add_argument("--recording-points", type=int, default=3600, help="PDF 입력 데이터 포인트 수")
+    parser.add_argument("--only", nargs="*", help="실행할 케이스 이름")
+    parser.add_argument("--compare", help="비교할 기준 결과 파일")
+    parser.add_argument("--no-save", action="store_true", help="결과 저장 안 함")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="sysmon-bench-")
+    try:
+        cases = build_cases(args, workdir)
+        results = {}
+        for name, (procfs, fn) in cases.items():
+            if args.only and name not in args.only:
+                continue
+            # PDF 생성은 느리므로 반복 횟수 축소
+            iterations = max(3, args.iterations // 5) if name == "pdf_generate" else args.iterations
+            if procfs:
+                with FakeProcfs(procfs):
+                    results[name] = measure(fn, iterations)
+            else:
+                results[name] = measure(fn, iterations)
+            r = results[name]
+            print(f"{name:<20} p50={r['p50_ms']:>9.3f}ms p95={r['p95_ms']:>9.3f}ms "
+                  f"peak={r['peak_alloc_kb']:>9.1f}KB blocks={r['alloc_blocks']:>7} "
+                  f"syscalls={r['syscalls_per_call']}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "label": args.label,
+        "revision": git_revision(),
+        "timestamp": datetime.now().isoformat(),
+        "platform": f"{platform.system()} {platform.release()}",
+        "python": platform.python_version(),
+        "params": {
+            "processes": args.processes,
+            "sockets": args.sockets,
+            "recording_points": args.recording_points,
+        },
+        "results": results
+    }
+
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{args.label}.json")
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved: {path}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""벤치마크용 합성 픽스처 (가짜 /proc 트리, 스냅샷, 장시간 기록 데이터)"""
+import math
+import os
+import random
+from datetime import datetime, timedelta
+
+NAMES = ["nginx", "gunicorn", "postgres", "python3", "node", "java", "redis-server",
+         "sshd", "systemd-journald", "containerd-shim", "chrome", "kworker/0:1"]
+
+
+def _write(path: str, content: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def build_fake_procfs(root: str, processes: int = 2000, sockets: int = 5000,
+                      cpus: int = 16, seed: int = 42) -> str:
+    """psutil.PROCFS_PATH 로 지정 가능한 가짜 /proc 트리 생성"""
+    rng = random.Random(seed)
+    os.makedirs(root, exist_ok=True)
+
+    # 시스템 전역 파일
+    cpu_lines = ["cpu  %d 100 %d %d 500 0 50 0 0 0" % (cpus * 10000, cpus * 3000, cpus * 90000)]
+    for i in range(cpus):
+        cpu_lines.append("cpu%d 10000 100 3000 90000 500 0 50 0 0 0" % i)
+    _write(os.path.join(root, "stat"), "\n".join(cpu_lines) + "\n" + "\n".join([
+        "intr 123456789",
+        "ctxt 987654321",
+        "btime 1700000000",
+        f"processes {processes * 10}",
+        "procs_running 3",
+        "procs_blocked 0",
+    ]) + "\n")
+    _write(os.path.join(root, "meminfo"), "\n".join([
+        "MemTotal:       65856512 kB",
+        "MemFree:        12345678 kB",
+        "MemAvailable:   40000000 kB",
+        "Buffers:          512000 kB",
+        "Cached:         20000000 kB",
+        "SwapCached:            0 kB",
+        "Active:         30000000 kB",
+        "Inactive:       15000000 kB",
+        "SwapTotal:       8388604 kB",
+        "SwapFree:        8000000 kB",
+        "Shmem:            800000 kB",
+        "Slab:            1500000 kB",
+        "SReclaimable:    1000000 kB",
+    ]) + "\n")
+    _write(os.path.join(root, "uptime"), "123456.78 987654.32\n")
+    _write(os.path.join(root, "loadavg"), f"1.50 1.20 0.90 3/{processes} {processes + 1}\n")
+    _write(os.path.join(root, "net", "dev"), "\n".join([
+        "Inter-|   Receive                                                |  Transmit",
+        " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed",
+        "    lo: 1000000 10000 0 0 0 0 0 0 1000000 10000 0 0 0 0 0 0",
+        "  eth0: 987654321 800000 0 0 0 0 0 0 123456789 600000 0 0 0 0 0 0",
+    ]) + "\n")
+
+    # 소켓 테이블 (inode 는 프로세스 fd 에 라운드로빈 배정)
+    header = "  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode\n"
+    states = ["01", "01", "01", "0A", "06", "08"]
+    tcp_lines = []
+    for i in range(sockets):
+        tcp_lines.append(
+            "%4d: 0100007F:%04X 0A000001:%04X %s 00000000:00000000 00:00000000 00000000  1000        0 %d 1 0 100 0 0 10 0"
+            % (i, 1024 + i % 60000, 443, rng.choice(states), 100000 + i)
+        )
+    _write(os.path.join(root, "net", "tcp"), header + "\n".join(tcp_lines) + "\n")
+    for name in ("tcp6", "udp", "udp6", "unix"):
+        _write(os.path.join(root, "net", name), header)
+
+    # 프로세스 디렉터리
+    for idx in range(processes):
+        pid = idx + 1
+        name = rng.choice(NAMES)
+        ppid = 1 if pid > 1 else 0
+        utime = rng.randint(0, 100000)
+        stime = rng.randint(0, 50000)
+        rss_pages = rng.randint(100, 200000)
+        fields = ["S", str(ppid), str(pid), str(pid), "0", "-1", "4194560", "100", "0", "0", "0",
+                  str(utime), str(stime), "0", "0", "20", "0", "1", "0",
+                  str(rng.randint(100, 10000000)), str(rss_pages * 4096 * 4), str(rss_pages)]
+        fields += ["0"] * (50 - len(fields))
+        pdir = os.path.join(root, str(pid))
+        _write(os.path.join(pdir, "stat"), f"{pid} ({name}) " + " ".join(fields) + "\n")
+        _write(os.path.join(pdir, "statm"), f"{rss_pages * 4} {rss_pages} 100 10 0 {rss_pages} 0\n")
+        _write(os.path.join(pdir, "comm"), name + "\n")
+        _write(os.path.join(pdir, "cmdline"), f"/usr/bin/{name}\0--worker\0{idx}\0")
+        _write(os.path.join(pdir, "status"), "\n".join([
+            f"Name:\t{name}",
+            "State:\tS (sleeping)",
+            f"Tgid:\t{pid}",
+            f"Pid:\t{pid}",
+            f"PPid:\t{ppid}",
+            "Uid:\t1000\t1000\t1000\t1000",
+            "Gid:\t1000\t1000\t1000\t1000",
+            f"VmRSS:\t{rss_pages * 4} kB",
+            "Threads:\t4",
+            "Cpus_allowed_list:\t0-%d" % (cpus - 1),
+            f"voluntary_ctxt_switches:\t{rng.randint(0, 100000)}",
+            f"nonvoluntary_ctxt_switches:\t{rng.randint(0, 1000)}",
+        ]) + "\n")
+        _write(os.path.join(pdir, "io"), "\n".join([
+            f"rchar: {rng.randint(0, 10**9)}",
+            f"wchar: {rng.randint(0, 10**9)}",
+            f"syscr: {rng.randint(0, 10**6)}",
+            f"syscw: {rng.randint(0, 10**6)}",
+            f"read_bytes: {rng.randint(0, 10**9)}",
+            f"write_bytes: {rng.randint(0, 10**9)}",
+            "cancelled_write_bytes: 0",
+        ]) + "\n")
+        fd_dir = os.path.join(pdir, "fd")
+        os.makedirs(fd_dir, exist_ok=True)
+        os.symlink("/dev/null", os.path.join(fd_dir, "0"))
+        for n, inode in enumerate(range(100000 + idx, 100000 + sockets, processes)):
+            os.symlink(f"socket:[{inode}]", os.path.join(fd_dir, str(n + 3)))
+
+    return root
+
+
+def make_snapshot(cores: int = 16, partitions: int = 8, seed: int = 42) -> dict:
+    """/ws 로 전송되는 형태의 합성 스냅샷"""
+    rng = random.Random(seed)
+
+    def top(limit=5):
+        return [{"pid": rng.randint(1, 50000), "name": rng.choice(NAMES),
+                 "value": round(rng.uniform(0, 100), 1)} for _ in range(limit)]
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "cpu": {
+            "usage": {
+                "percent": 37.5,
+                "per_core": [round(rng.uniform(0, 100), 1) for _ in range(cores)],
+                "frequency": {"current": 3200.0, "min": 800.0, "max": 4800.0},
+                "cores": {"logical": cores, "physical": cores // 2}
+            },
+            "temperature": {"available": True, "value": 55.0, "unit": "°C"}
+        },
+        "gpu": {"available": True, "count": 1, "gpus": [{
+            "id": 0, "name": "NVIDIA RTX", "load": 12.0, "memory_total": 24576.0,
+            "memory_used": 2048.0, "temperature": 48.0}]},
+        "memory": {
+            "virtual": {"total": 62.8, "available": 38.1, "used": 24.7, "free": 11.8,
+                        "percent": 39.3, "total_bytes": 67436367872, "used_bytes": 26521133056},
+            "swap": {"total": 8.0, "used": 0.4, "free": 7.6, "percent": 4.6}
+        },
+        "disk": {
+            "partitions": [{
+                "device": f"/dev/sd{chr(97 + i)}1", "mountpoint": f"/mnt/data{i}", "fstype": "ext4",
+                "total": 931.5, "used": round(rng.uniform(10, 900), 2), "free": 100.0,
+                "percent": round(rng.uniform(1, 99), 1)} for i in range(partitions)],
+            "io": {"read_count": 123456, "write_count": 654321, "read_bytes": 98765.4,
+                   "write_bytes": 45678.9, "read_time": 1234, "write_time": 5678}
+        },
+        "network": {
+            "interfaces": {f"eth{i}": {"is_up": True, "speed": 10000, "addresses": [
+                {"family": "AddressFamily.AF_INET", "address": f"10.0.{i}.2", "netmask": "255.255.255.0"}]}
+                for i in range(4)},
+            "io": {"bytes_sent": 123456789, "bytes_recv": 987654321, "packets_sent": 1000,
+                   "packets_recv": 2000, "errin": 0, "errout": 0, "dropin": 0, "dropout": 0,
+                   "bytes_sent_formatted": "117.74 MB", "bytes_recv_formatted": "941.90 MB"},
+            "speed": {"upload_speed": 12345.6, "download_speed": 65432.1,
+                      "upload_speed_formatted": "12.06 KB/s", "download_speed_formatted": "63.90 KB/s"}
+        },
+        "connections": {"total": 1234, "by_status": {"ESTABLISHED": 800, "LISTEN": 34, "TIME_WAIT": 400}},
+        "processes": {"cpu_top": top(), "memory_top": top(), "disk_top": top(), "network_top": top()}
+    }
+
+
+def make_recording(points: int = 3600, seed: int = 42) -> dict:
+    """PDFGenerator.generate 입력 형태의 장시간 기록 데이터"""
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(seconds=points)
+    wave = [50 + 30 * math.sin(i / 60.0) for i in range(points)]
+    return {
+        "cpu": [min(100.0, max(0.0, w + rng.uniform(-10, 10))) for w in wave],
+        "memory": [40 + rng.uniform(-2, 2) for _ in range(points)],
+        "gpu": [rng.uniform(0, 100) for _ in range(points)],
+        "cpu_temp": [55 + rng.uniform(-5, 5) for _ in range(points)],
+        "gpu_temp": [50 + rng.uniform(-5, 5) for _ in range(points)],
+        "network_upload": [rng.uniform(0, 5000) for _ in range(points)],
+        "network_download": [rng.uniform(0, 20000) for _ in range(points)],
+        "timestamps": [(start + timedelta(seconds=i)).isoformat() for i in range(points)],
+        "disk": make_snapshot()["disk"]["partitions"],
+        "system_info": {"Platform": "Linux", "CPU Cores (Logical)": 16, "Total RAM": "62.80 GB"}
+    }
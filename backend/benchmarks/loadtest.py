@@ -0,0 +1,258 @@
+"""WebSocket / REST 부하 테스트 (가상 대시보드)
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.loadtest --spawn --clients 500 --slow 50 --pollers 20 --duration 60
+    python -m benchmarks.loadtest --url http://127.0.0.1:8000 --server-pid 1234 --clients 200
+
+--spawn 은 로컬에 uvicorn 서버를 띄워 측정 후 종료한다.
+프레임 지연 = 클라이언트 수신 시각 - 서버 전송 시각(sent_at), 동일 호스트 시계 기준.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from urllib.parse import urlparse
+
+import psutil
+import websockets
+
+
+def percentiles(values: list) -> dict:
+    """지연 시간 백분위 (ms)"""
+    if not values:
+        return {"count": 0}
+    values = sorted(values)
+
+    def pick(q):
+        return round(values[min(len(values) - 1, int(len(values) * q))], 2)
+
+    return {
+        "count": len(values),
+        "p50": pick(0.50),
+        "p90": pick(0.90),
+        "p99": pick(0.99),
+        "max": round(values[-1], 2)
+    }
+
+
+class ClientStats:
+    """WebSocket 클라이언트 그룹 (빠른/느린 리더) 집계"""
+
+    def __init__(self):
+        self.frame_latencies = []
+        self.frames = 0
+        self.connect_failures = 0
+        self.disconnects = 0
+        self.connected = 0
+
+    def report(self, clients: int, duration: float) -> dict:
+        # 클라이언트당 초당 1프레임 기대 (기본 구독 기준)
+        expected = int(clients * duration)
+        return {
+            "clients": clients,
+            "connected": self.connected,
+            "connect_failures": self.connect_failures,
+            "disconnects": self.disconnects,
+            "frames": self.frames,
+            "expected_frames": expected,
+            "missing_frames": max(0, expected - self.frames),
+            "latency_ms": percentiles(self.frame_latencies)
+        }
+
+
+class Stats:
+    """부하 테스트 집계 (느린 리더가 빠른 클라이언트에 영향을 주는지 보도록 그룹을 나눔)"""
+
+    def __init__(self):
+        self.fast = ClientStats()
+        self.slow = ClientStats()
+        self.rest_latencies = []
+        self.rest_errors = 0
+        self.server_cpu = []
+        self.server_rss = []
+
+
+async def ws_client(url: str, stats: ClientStats, measure_start: float, deadline: float,
+                    slow_delay: float, topics: list):
+    """가상 대시보드 - slow_delay > 0 이면 느린 리더 (측정 구간 내 프레임만 집계)"""
+    try:
+        async with websockets.connect(url, max_size=None, open_timeout=30) as ws:
+            stats.connected += 1
+            if topics:
+                await ws.send(json.dumps({"subscribe": topics}))
+            while time.time() < deadline:
+                try:
+                    raw = await asyncio.wait_for(ws.recv(), timeout=max(0.1, deadline - time.time()))
+                except asyncio.TimeoutError:
+                    break
+                received = time.time()
+                frame = json.loads(raw)
+                if received < measure_start:
+                    continue
+                stats.frames += 1
+                if "sent_at" in frame:
+                    stats.frame_latencies.append((received - frame["sent_at"]) * 1000)
+                if slow_delay:
+                    await asyncio.sleep(slow_delay)
+    except (OSError, asyncio.TimeoutError, websockets.exceptions.InvalidHandshake):
+        stats.connect_failures += 1
+    except websockets.exceptions.ConnectionClosed:
+        stats.disconnects += 1
+
+
+async def rest_poller(host: str, port: int, path: str, stats: Stats, deadline: float, interval: float):
+    """REST 폴러 (의존성 없이 asyncio 스트림으로 HTTP/1.1 요청)"""
+    request = f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode()
+    while time.time() < deadline:
+        start = time.perf_counter()
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(request)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            if not response.startswith(b"HTTP/1.1 200"):
+                stats.rest_errors += 1
+            else:
+                stats.rest_latencies.append((time.perf_counter() - start) * 1000)
+        except OSError:
+            stats.rest_errors += 1
+        await asyncio.sleep(interval)
+
+
+async def sample_server(pid: int, stats: Stats, deadline: float):
+    """서버 프로세스 CPU/메모리 샘플링 (1초 주기)"""
+    try:
+        proc = psutil.Process(pid)
+        proc.cpu_percent()
+        while time.time() < deadline:
+            await asyncio.sleep(1.0)
+            stats.server_cpu.append(proc.cpu_percent())
+            stats.server_rss.append(proc.memory_info().rss / (1024 ** 2))
+    except psutil.Error:
+        pass
+
+
+async def run(args, server_pid: int) -> dict:
+    parsed = urlparse(args.url)
+    host, port = parsed.hostname, parsed.port or 80
+    ws_url = f"{'wss' if parsed.scheme == 'https' else 'ws'}://{host}:{port}/ws"
+
+    stats = Stats()
+    start = time.time()
+    # 모든 클라이언트가 접속한 뒤 측정 구간 시작
+    measure_start = start + args.ramp
+    deadline = measure_start + args.duration
+    topics = args.topics.split(",") if args.topics else None
+
+    tasks = []
+    for i in range(args.clients):
+        slow = i < args.slow
+        client_stats = stats.slow if slow else stats.fast
+        slow_delay = args.slow_delay if slow else 0
+        tasks.append(asyncio.create_task(
+            ws_client(ws_url, client_stats, measure_start, deadline, slow_delay, topics)))
+        if args.ramp:
+            await asyncio.sleep(args.ramp / args.clients)
+    for _ in range(args.pollers):
+        tasks.append(asyncio.create_task(
+            rest_poller(host, port, args.poll_path, stats, deadline, args.poll_interval)))
+    if server_pid:
+        tasks.append(asyncio.create_task(sample_server(server_pid, stats, deadline)))
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    elapsed = time.time() - start
+    fast = stats.fast.report(args.clients - min(args.slow, args.clients), args.duration)
+    slow = stats.slow.report(min(args.slow, args.clients), args.duration)
+    # 빠른 클라이언트의 누락만 드롭 - 느린 리더는 서버가 최신 프레임만 남기고 건너뛰는 것이 의도된 동작
+    fast["dropped_frames"] = fast.pop("missing_frames")
+    slow["frames_coalesced"] = slow.pop("missing_frames")
+    return {
+        "params": {
+            "clients": args.clients,
+            "slow_clients": args.slow,
+            "slow_delay": args.slow_delay,
+            "pollers": args.pollers,
+            "duration": args.duration,
+        },
+        "elapsed_seconds": round(elapsed, 1),
+        "ws": {
+            "fast": fast,
+            "slow": slow
+        },
+        "rest": {
+            "errors": stats.rest_errors,
+            "latency_ms": percentiles(stats.rest_latencies)
+        },
+        "server": {
+            "cpu_percent_avg": round(sum(stats.server_cpu) / len(stats.server_cpu), 1) if stats.server_cpu else None,
+            "cpu_percent_max": max(stats.server_cpu) if stats.server_cpu else None,
+            "rss_mb_max": round(max(stats.server_rss), 1) if stats.server_rss else None
+        }
+    }
+
+
+def spawn_server(port: int) -> subprocess.Popen:
+    """로컬 uvicorn 서버 실행 후 준비될 때까지 대기"""
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=backend_dir
+    )
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/api/monitoring-status", timeout=1).close()
+            return proc
+        except Exception:
+            if proc.poll() is not None:
+                raise RuntimeError("Server exited during startup")
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("Server did not become ready")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="System monitor WebSocket/REST load test")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--spawn", action="store_true", help="로컬 서버를 띄워서 측정")
+    parser.add_argument("--server-pid", type=int, help="CPU/메모리를 샘플링할 서버 PID")
+    parser.add_argument("--clients", type=int, default=100, help="WebSocket 클라이언트 수")
+    parser.add_argument("--slow", type=int, default=0, help="느린 리더 수 (clients 중)")
+    parser.add_argument("--slow-delay", type=float, default=5.0, help="느린 리더의 프레임당 지연 (초)")
+    parser.add_argument("--topics", help="구독 토픽 (예: cpu@1s,memory@1s)")
+    parser.add_argument("--pollers", type=int, default=0, help="REST 폴러 수")
+    parser.add_argument("--poll-path", default="/api/status")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간 (초)")
+    parser.add_argument("--ramp", type=float, default=5.0, help="클라이언트 접속 분산 시간 (초)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    server = None
+    server_pid = args.server_pid
+    if args.spawn:
+        port = urlparse(args.url).port or 8000
+        server = spawn_server(port)
+        server_pid = server.pid
+
+    try:
+        result = asyncio.run(run(args, server_pid))
+    finally:
+        if server:
+            server.terminate()
+            server.wait(timeout=10)
+
+    print(json.dumps(result, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""전용 수집 프로세스
+
+수집기를 API 서버와 분리해 하나의 프로세스에서만 실행하고, 최신 스냅샷을
+공유 메모리 파일에 게시한다. uvicorn 워커는 같은 경로를 읽기만 하므로 여러 개를 띄울 수 있다.
+
+사용법 (backend 디렉터리에서):
+    python collector.py --path /dev/shm/sysmon_snapshot
+    SYSMON_SNAPSHOT_PATH=/dev/shm/sysmon_snapshot uvicorn main:app --workers 4
+
+워커 모드에서는 수집기 상태를 바꾸는 API (5분 모니터링, 스냅샷 기록 시작/중지, 알림 규칙 변경,
+버스트 샘플링, 플릿 수신) 가 409 를 반환한다. 이 기능들은 단일 프로세스 모드에서 사용한다.
+"""
+import argparse
+import os
+import signal
+import tempfile
+
+
+def run():
+    parser = argparse.ArgumentParser(description="System monitor dedicated collector process")
+    parser.add_argument("--path", default=os.environ.get("SYSMON_SNAPSHOT_PATH")
+                        or os.path.join(tempfile.gettempdir(), "sysmon_snapshot"),
+                        help="공유 스냅샷 파일 경로 (워커의 SYSMON_SNAPSHOT_PATH 와 동일해야 함)")
+    parser.add_argument("--topics", help="수집 토픽 (기본: 전체 기본 구독, 예: cpu@1s,memory@1s,processes@5s)")
+    args = parser.parse_args()
+
+    # main 모듈 import 전에 역할 지정 (공유 스냅샷 독자 대신 게시자로 동작)
+    os.environ["SYSMON_ROLE"] = "collector"
+    os.environ["SYSMON_SNAPSHOT_PATH"] = args.path
+    import main as server
+    from topics import parse_subscription
+
+    subscription = parse_subscription(args.topics.split(",") if args.topics else server.DEFAULT_SUBSCRIPTION)
+
+    def handle_signal(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    server.run_collector(args.path, subscription)
+
+
+if __name__ == "__main__":
+    run()
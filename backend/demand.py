@@ -0,0 +1,88 @@
+import threading
+import time
+from typing import Dict, Optional
+
+
+class DemandTracker:
+    """소비자별 토픽 수요 관리
+
+    소비자(WebSocket 구독, 5분 모니터링 기록, /metrics 스크레이프, REST 폴링 등)가
+    필요한 토픽과 주기를 등록하면, 수집기는 토픽별 최소 주기로만 수집하고
+    수요가 없는 토픽은 수집을 멈춘다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.changed = threading.Event()
+        # consumer -> {"kind": str, "topics": {topic: interval}, "expires": float | None}
+        self.consumers: Dict[str, dict] = {}
+
+    def require(self, consumer: str, topics: Dict[str, float],
+                kind: str = "ws", ttl: float = None):
+        """소비자 수요 등록/교체 (ttl 지정 시 갱신이 없으면 만료되는 임대 수요)"""
+        expires = time.time() + ttl if ttl else None
+        with self.lock:
+            previous = self.consumers.get(consumer)
+            self.consumers[consumer] = {
+                "kind": kind,
+                "topics": dict(topics),
+                "expires": expires
+            }
+        # 수요가 늘거나 바뀌면 대기 중인 수집기를 깨움
+        if previous is None or previous["topics"] != topics:
+            self.changed.set()
+
+    def release(self, consumer: str):
+        """소비자 수요 해제"""
+        with self.lock:
+            removed = self.consumers.pop(consumer, None)
+        if removed is not None:
+            self.changed.set()
+
+    def _purge_expired(self, now: float):
+        """만료된 임대 수요 제거 (호출 측에서 lock 보유)"""
+        expired = [key for key, c in self.consumers.items()
+                   if c["expires"] is not None and c["expires"] <= now]
+        for key in expired:
+            del self.consumers[key]
+
+    def effective_intervals(self) -> Dict[str, float]:
+        """토픽별로 필요한 최소 수집 주기 {토픽: 주기}"""
+        now = time.time()
+        with self.lock:
+            self._purge_expired(now)
+            result = {}
+            for consumer in self.consumers.values():
+                for topic, interval in consumer["topics"].items():
+                    result[topic] = min(interval, result.get(topic, interval))
+            return result
+
+    def interval_for(self, topic: str) -> Optional[float]:
+        """토픽에 필요한 최소 수집 주기 (수요가 없으면 None)"""
+        return self.effective_intervals().get(topic)
+
+    def wait(self, timeout: float) -> bool:
+        """수요 변경 또는 timeout 까지 대기"""
+        signaled = self.changed.wait(timeout)
+        self.changed.clear()
+        return signaled
+
+    def describe(self) -> dict:
+        """현재 수요 상태 반환 (진단용)"""
+        intervals = self.effective_intervals()
+        now = time.time()
+        with self.lock:
+            consumers = [
+                {
+                    "consumer": key,
+                    "kind": c["kind"],
+                    "topics": c["topics"],
+                    "expires_in": round(c["expires"] - now, 1) if c["expires"] else None
+                }
+                for key, c in self.consumers.items()
+            ]
+        return {
+            "idle": not intervals,
+            "topics": intervals,
+            "consumers": consumers
+        }
@@ -0,0 +1,286 @@
+import gzip
+import hashlib
+import heapq
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional
+
+import psutil
+
+# 인덱스 파일 (<디렉터리>/<루트 해시>.json.gz) 노드 형식 - 키는 루트 기준 상대 경로 ("" 는 루트)
+#   m: 디렉터리 mtime (ns), s: 직속 파일 크기 합 (바이트), f: 직속 파일 수,
+#   c: 하위 디렉터리 이름 목록, t: 하위 전체 크기, p: 이전 색인 시점의 t
+# mtime 은 항목 생성/삭제/이름 변경 시에만 바뀌므로, 기존 파일이 제자리에서 커지는 경우는
+# FULL_RESCAN_INTERVAL 마다 수행하는 전체 재색인에서 반영된다.
+INDEX_VERSION = 1
+FULL_RESCAN_INTERVAL = 24 * 3600
+DEFAULT_RATE = 5000       # 초당 stat 횟수 상한
+DEFAULT_WORKERS = 4
+
+
+def _default_dir() -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "indexes")
+
+
+def _disk_bytes(stat) -> int:
+    """실제 디스크 점유 크기 (du 기준, 블록 정보가 없으면 파일 크기)"""
+    blocks = getattr(stat, "st_blocks", None)
+    return blocks * 512 if blocks is not None else stat.st_size
+
+
+class RateLimiter:
+    """토큰 버킷 - 색인 스레드 전체의 초당 파일시스템 호출 수 제한"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, count: int = 1):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= count:
+                    self.tokens -= count
+                    return
+                delay = (count - self.tokens) / self.rate
+            time.sleep(delay)
+
+
+class DirectoryIndex:
+    """하나의 루트(마운트)에 대한 디렉터리 크기 트리"""
+
+    def __init__(self, root: str, path: str):
+        self.root = root
+        self.path = path
+        self.nodes = {}
+        self.scanned_at = None
+        self.previous_scanned_at = None
+        self.full_scanned_at = None
+        self.stats = {}
+
+    def load(self) -> bool:
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != INDEX_VERSION or data.get("root") != self.root:
+            return False
+        self.nodes = data["nodes"]
+        self.scanned_at = data.get("scanned_at")
+        self.previous_scanned_at = data.get("previous_scanned_at")
+        self.full_scanned_at = data.get("full_scanned_at")
+        self.stats = data.get("stats", {})
+        return True
+
+    def save(self):
+        """임시 파일에 기록 후 교체 (색인 도중 종료돼도 이전 인덱스 유지)"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=5) as f:
+            json.dump({
+                "version": INDEX_VERSION, "root": self.root, "nodes": self.nodes,
+                "scanned_at": self.scanned_at, "previous_scanned_at": self.previous_scanned_at,
+                "full_scanned_at": self.full_scanned_at, "stats": self.stats,
+            }, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def _child(self, rel: str, name: str) -> str:
+        return os.path.join(rel, name) if rel else name
+
+    def _scan_dir(self, rel: str, device: int, full: bool, limiter: RateLimiter, counters: dict) -> tuple:
+        """디렉터리 하나 처리 - mtime 이 그대로면 직속 파일은 다시 읽지 않음"""
+        path = os.path.join(self.root, rel) if rel else self.root
+        limiter.acquire()
+        st = os.stat(path, follow_symlinks=False)
+        old = self.nodes.get(rel)
+        if old is not None and not full and old["m"] == st.st_mtime_ns:
+            counters["reused"] += 1
+            return rel, {"m": old["m"], "s": old["s"], "f": old["f"], "c": old["c"], "p": old.get("t", 0)}
+
+        size = 0
+        files = 0
+        children = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                limiter.acquire()
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        # 다른 파일시스템(하위 마운트)은 따라가지 않음
+                        if entry.stat(follow_symlinks=False).st_dev == device:
+                            children.append(entry.name)
+                    else:
+                        size += _disk_bytes(entry.stat(follow_symlinks=False))
+                        files += 1
+                except OSError:
+                    continue
+        counters["scanned"] += 1
+        return rel, {"m": st.st_mtime_ns, "s": size, "f": files, "c": children,
+                     "p": old.get("t", 0) if old else 0}
+
+    def scan(self, rate: float = DEFAULT_RATE, workers: int = DEFAULT_WORKERS,
+             stop: threading.Event = None, progress: dict = None):
+        """병렬 색인 - 변경된 디렉터리만 다시 읽고 전체 합계는 트리에서 다시 계산"""
+        now = time.time()
+        full = not self.nodes or not self.full_scanned_at or now - self.full_scanned_at >= FULL_RESCAN_INTERVAL
+        device = os.stat(self.root).st_dev
+        limiter = RateLimiter(rate)
+        counters = progress if progress is not None else {}
+        counters.update({"scanned": 0, "reused": 0, "errors": 0, "full": full})
+        nodes = {}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dir-index",
+                                initializer=_lower_io_priority) as pool:
+            pending = {pool.submit(self._scan_dir, "", device, full, limiter, counters)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        rel, node = future.result()
+                    except OSError:
+                        # 권한 없음 / 색인 도중 삭제됨
+                        counters["errors"] += 1
+                        continue
+                    nodes[rel] = node
+                    if stop is not None and stop.is_set():
+                        continue
+                    for name in node["c"]:
+                        pending.add(pool.submit(self._scan_dir, self._child(rel, name),
+                                                device, full, limiter, counters))
+                if stop is not None and stop.is_set():
+                    for future in pending:
+                        future.cancel()
+                    return False
+
+        # 깊은 경로부터 하위 합계 누적
+        for rel in sorted(nodes, key=lambda r: r.count(os.sep) + (1 if r else 0), reverse=True):
+            node = nodes[rel]
+            node["t"] = node["s"] + sum(nodes[c]["t"] for c in map(lambda n: self._child(rel, n), node["c"])
+                                        if c in nodes)
+
+        self.nodes = nodes
+        self.previous_scanned_at = self.scanned_at
+        self.scanned_at = now
+        if full:
+            self.full_scanned_at = now
+        self.stats = {"directories": len(nodes), "duration": round(time.time() - now, 2), **counters}
+        self.save()
+        return True
+
+    def _entry(self, rel: str, node: dict, elapsed: Optional[float]) -> dict:
+        growth = node["t"] - node.get("p", 0)
+        return {
+            "path": os.path.join(self.root, rel) if rel else self.root,
+            "size_mb": round(node["t"] / (1024 ** 2), 2),
+            "files": node["f"],
+            "growth_mb": round(growth / (1024 ** 2), 2) if elapsed else None,
+            "growth_mb_per_hour": round(growth / (1024 ** 2) / elapsed * 3600, 2) if elapsed else None,
+        }
+
+    def top(self, limit: int = 20, depth: int = None) -> dict:
+        """가장 큰 디렉터리와 직전 색인 대비 가장 빠르게 커진 디렉터리"""
+        elapsed = (self.scanned_at - self.previous_scanned_at) if self.previous_scanned_at else None
+        items = [(rel, node) for rel, node in self.nodes.items()
+                 if rel and (depth is None or rel.count(os.sep) < depth)]
+        largest = heapq.nlargest(limit, items, key=lambda item: item[1]["t"])
+        growing = heapq.nlargest(limit, items, key=lambda item: item[1]["t"] - item[1].get("p", 0)) if elapsed else []
+        root = self.nodes.get("")
+        return {
+            "root": self.root,
+            "scanned_at": self.scanned_at,
+            "previous_scanned_at": self.previous_scanned_at,
+            "total_mb": round(root["t"] / (1024 ** 2), 2) if root else None,
+            "largest": [self._entry(rel, node, elapsed) for rel, node in largest],
+            "growing": [self._entry(rel, node, elapsed) for rel, node in growing
+                        if node["t"] > node.get("p", 0)],
+            "stats": self.stats,
+        }
+
+
+def _lower_io_priority():
+    """색인 스레드 I/O 우선순위를 idle 로 낮춤 (Linux, 실패 시 무시)"""
+    try:
+        native_id = threading.get_native_id()
+        psutil.Process(native_id).ionice(psutil.IOPRIO_CLASS_IDLE)
+    except (AttributeError, psutil.Error, OSError):
+        pass
+
+
+class DirectoryIndexer:
+    """요청 시 백그라운드로 루트별 색인 실행 (한 번에 하나의 색인)"""
+
+    def __init__(self, directory: str = None):
+        self.directory = os.path.abspath(directory or _default_dir())
+        self.lock = threading.Lock()
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.current = None
+        self.progress = {}
+        self.last_error = None
+
+    def _index_path(self, root: str) -> str:
+        digest = hashlib.sha1(root.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, digest + ".json.gz")
+
+    @staticmethod
+    def normalize_root(root: str) -> str:
+        if not isinstance(root, str) or not root:
+            raise ValueError("path is required")
+        root = os.path.realpath(root)
+        if not os.path.isdir(root):
+            raise ValueError(f"Not a directory: {root}")
+        return root
+
+    def start(self, root: str, rate: float = DEFAULT_RATE, workers: int = DEFAULT_WORKERS) -> dict:
+        root = self.normalize_root(root)
+        if not 1 <= workers <= 32:
+            raise ValueError("workers must be between 1 and 32")
+        if not 10 <= rate <= 1_000_000:
+            raise ValueError("rate must be between 10 and 1000000")
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                raise RuntimeError(f"Index already running: {self.current}")
+            self.current = root
+            self.progress = {}
+            self.last_error = None
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, args=(root, rate, workers), daemon=True)
+            self.thread.start()
+        return self.status()
+
+    def _run(self, root: str, rate: float, workers: int):
+        index = DirectoryIndex(root, self._index_path(root))
+        index.load()
+        try:
+            index.scan(rate=rate, workers=workers, stop=self.stop_event, progress=self.progress)
+        except OSError as e:
+            self.last_error = str(e)
+            print(f"Directory index error ({root}): {e}")
+
+    def stop(self) -> bool:
+        with self.lock:
+            if not (self.thread and self.thread.is_alive()):
+                return False
+            self.stop_event.set()
+        self.thread.join(timeout=5)
+        return True
+
+    def status(self) -> dict:
+        running = bool(self.thread and self.thread.is_alive())
+        return {"running": running, "root": self.current, "progress": dict(self.progress),
+                "error": self.last_error}
+
+    def result(self, root: str, limit: int = 20, depth: int = None) -> dict:
+        """저장된 인덱스 조회 (다른 프로세스가 만든 인덱스도 읽을 수 있음)"""
+        root = self.normalize_root(root)
+        index = DirectoryIndex(root, self._index_path(root))
+        if not index.load():
+            raise FileNotFoundError(root)
+        return index.top(limit=limit, depth=depth)
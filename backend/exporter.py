@@ -0,0 +1,204 @@
+import csv
+import io
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from alerts import METRICS
+
+# Parquet/Arrow 내보내기는 pyarrow 가 설치된 경우에만 지원
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+# Arrow/Parquet 배치(행 그룹) 크기
+BATCH_ROWS = 4096
+
+
+class ExportUnavailable(Exception):
+    """선택 의존성(pyarrow) 미설치"""
+
+
+def parse_time(value) -> Optional[float]:
+    """epoch 초 또는 ISO 8601 문자열 → epoch 초"""
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        raise ValueError(f"Invalid time: {value}")
+
+
+def column_name(metric: str, series: str) -> str:
+    """다중 시계열 메트릭은 'disk.percent[/home]' 형식"""
+    return f"{metric}[{series}]" if series else metric
+
+
+def frame_values(snapshot: dict, fresh_only: bool = False) -> dict:
+    """스냅샷 → {컬럼 이름: 값}
+
+    fresh_only: 프레임의 _collected (그 주기에 수집된 토픽) 에 없는 토픽은 이전 값이므로 제외
+    """
+    values = {}
+    collected = snapshot.get("_collected") if fresh_only else None
+    for metric, (topic, extractor) in METRICS.items():
+        if not snapshot.get(topic) or (collected is not None and topic not in collected):
+            continue
+        try:
+            series = extractor(snapshot)
+        except (KeyError, TypeError, IndexError):
+            continue
+        for label, value in series.items():
+            values[column_name(metric, label)] = value
+    return values
+
+
+def resolve_columns(requested: Optional[List[str]], sample: dict) -> List[str]:
+    """요청 컬럼(메트릭 이름 또는 정확한 컬럼 이름)을 첫 프레임 기준 컬럼 목록으로 확장"""
+    available = list(sample)
+    if not requested:
+        return available
+    columns = []
+    for name in requested:
+        if name in sample:
+            columns.append(name)
+        elif name in METRICS:
+            columns.extend(c for c in available if c == name or c.startswith(name + "["))
+        else:
+            raise ValueError(f"Unknown column: {name}")
+    return list(dict.fromkeys(columns))
+
+
+def iter_rows(frames: Iterator[tuple], start: float = None, end: float = None,
+              columns: List[str] = None) -> tuple:
+    """(컬럼 목록, 행 반복자) - 첫 프레임에서 컬럼을 확정하고 이후 프레임은 한 행씩 변환"""
+    frames = iter(frames)
+    first = None
+    for timestamp, snapshot in frames:
+        if start is not None and timestamp < start:
+            continue
+        if end is not None and timestamp > end:
+            break
+        first = (timestamp, snapshot)
+        break
+    if first is None:
+        return list(columns or []), iter(())
+    # 컬럼은 첫 프레임의 모든 토픽 기준, 값은 해당 주기에 새로 수집된 토픽만 (나머지는 빈 칸)
+    resolved = resolve_columns(columns, frame_values(first[1]))
+
+    def rows():
+        timestamp, values = first[0], frame_values(first[1], fresh_only=True)
+        yield timestamp, [values.get(c) for c in resolved]
+        for timestamp, snapshot in frames:
+            if end is not None and timestamp > end:
+                return
+            values = frame_values(snapshot, fresh_only=True)
+            yield timestamp, [values.get(c) for c in resolved]
+
+    return resolved, rows()
+
+
+def stream_csv(columns: List[str], rows: Iterator[tuple]) -> Iterator[bytes]:
+    """CSV 청크 스트리밍 (약 64KB 단위)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["timestamp", "time"] + columns)
+    for timestamp, values in rows:
+        writer.writerow([f"{timestamp:.3f}", datetime.fromtimestamp(timestamp).isoformat(timespec="seconds")]
+                        + ["" if v is None else v for v in values])
+        if buffer.tell() >= 65536:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """pyarrow writer 출력을 모았다가 청크로 내보내는 파일 객체"""
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _record_batches(columns: List[str], rows: Iterator[tuple], schema) -> Iterator:
+    """행 반복자를 BATCH_ROWS 단위 RecordBatch 로 변환"""
+    def build(timestamps, data):
+        return pa.RecordBatch.from_arrays(
+            [pa.array(timestamps, schema.field(0).type)] +
+            [pa.array(column, pa.float64()) for column in data], schema=schema)
+
+    timestamps = []
+    data = [[] for _ in columns]
+    for timestamp, values in rows:
+        timestamps.append(int(timestamp * 1000))
+        for i, value in enumerate(values):
+            data[i].append(value)
+        if len(timestamps) >= BATCH_ROWS:
+            yield build(timestamps, data)
+            timestamps = []
+            data = [[] for _ in columns]
+    if timestamps:
+        yield build(timestamps, data)
+
+
+def stream_columnar(columns: List[str], rows: Iterator[tuple], fmt: str) -> Iterator[bytes]:
+    """Arrow IPC 스트림 또는 Parquet 스트리밍 (배치/행 그룹 단위로 내보내 메모리 사용 일정)"""
+    if pa is None:
+        raise ExportUnavailable("pyarrow is required for Arrow/Parquet export")
+    schema = pa.schema([("timestamp", pa.timestamp("ms", tz="UTC"))] + [(c, pa.float64()) for c in columns])
+    sink = _ChunkSink()
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+    for batch in _record_batches(columns, rows, schema):
+        writer.write_batch(batch)
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+    writer.close()
+    yield sink.drain()
+
+
+def export(frames: Iterator[tuple], fmt: str = "csv", columns: List[str] = None,
+           start: float = None, end: float = None) -> Iterator[bytes]:
+    """기록 프레임 → 내보내기 바이트 스트림"""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format: {fmt} (csv, arrow, parquet)")
+    if fmt != "csv" and pa is None:
+        raise ExportUnavailable("pyarrow is required for Arrow/Parquet export")
+    resolved, rows = iter_rows(frames, start, end, columns)
+    if fmt == "csv":
+        return stream_csv(resolved, rows)
+    return stream_columnar(resolved, rows, fmt)
@@ -0,0 +1,200 @@
+import heapq
+import json
+import math
+import threading
+import time
+import urllib.request
+from typing import Dict, Optional
+
+
+class FleetAggregator:
+    """여러 호스트 스냅샷을 받아 플릿 단위 요약(히스토그램, Top-K)을 계산"""
+
+    # 히스토그램 버킷 경계 (%)
+    BUCKETS = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
+
+    def __init__(self, top_k: int = 5, stale_after: float = 15.0, expire_after: float = None):
+        self.top_k = top_k
+        self.stale_after = stale_after
+        # 폐기/이름 변경된 호스트가 쌓이지 않도록 오래 보고가 없으면 제거 (기본 stale_after 의 10배)
+        self.expire_after = expire_after if expire_after is not None else stale_after * 10
+        self.lock = threading.Lock()
+        # host -> {"received": float, "metrics": dict, "processes": dict, "snapshot": dict}
+        self.hosts: Dict[str, dict] = {}
+        self._summary = None
+        self._dirty = True
+
+    def ingest(self, host: str, snapshot: dict):
+        """호스트 스냅샷 수신 (요약에 필요한 값만 미리 추출)"""
+        entry = {
+            "received": time.time(),
+            "metrics": self._extract_metrics(snapshot),
+            "processes": snapshot.get("processes") or {},
+            "snapshot": snapshot
+        }
+        with self.lock:
+            self.hosts[host] = entry
+            self._dirty = True
+
+    def remove(self, host: str):
+        """호스트 제거"""
+        with self.lock:
+            if self.hosts.pop(host, None) is not None:
+                self._dirty = True
+
+    def _expire(self, now: float):
+        """expire_after 동안 보고가 없는 호스트 제거 (호출 측에서 lock 보유)"""
+        expired = [host for host, entry in self.hosts.items() if now - entry["received"] > self.expire_after]
+        for host in expired:
+            del self.hosts[host]
+        if expired:
+            self._dirty = True
+
+    def _extract_metrics(self, snapshot: dict) -> dict:
+        """스냅샷에서 플릿 집계용 스칼라 메트릭 추출"""
+        metrics = {}
+        try:
+            metrics["cpu"] = snapshot["cpu"]["usage"]["percent"]
+        except (KeyError, TypeError):
+            pass
+        try:
+            metrics["memory"] = snapshot["memory"]["virtual"]["percent"]
+        except (KeyError, TypeError):
+            pass
+        try:
+            speed = snapshot["network"]["speed"]
+            metrics["network"] = speed["upload_speed"] + speed["download_speed"]
+        except (KeyError, TypeError):
+            pass
+        try:
+            partitions = snapshot["disk"]["partitions"]
+            if partitions:
+                metrics["disk"] = max(p["percent"] for p in partitions)
+        except (KeyError, TypeError):
+            pass
+        return metrics
+
+    def _histogram(self, values: list) -> list:
+        """값 목록을 고정 버킷 히스토그램으로 변환"""
+        counts = [0] * len(self.BUCKETS)
+        for v in values:
+            idx = min(max(math.ceil(v / 10) - 1, 0), len(self.BUCKETS) - 1)
+            counts[idx] += 1
+        return [{"le": le, "count": c} for le, c in zip(self.BUCKETS, counts)]
+
+    def _compute_summary(self) -> dict:
+        """플릿 요약 계산 (호출 측에서 lock 보유)"""
+        now = time.time()
+        self._expire(now)
+        live = {}
+        stale = []
+        for host, entry in self.hosts.items():
+            if now - entry["received"] > self.stale_after:
+                stale.append(host)
+            else:
+                live[host] = entry
+
+        # 메트릭별 히스토그램 (네트워크는 퍼센트가 아니므로 제외)
+        histograms = {}
+        for metric in ("cpu", "memory", "disk"):
+            values = [e["metrics"][metric] for e in live.values() if metric in e["metrics"]]
+            histograms[metric] = self._histogram(values)
+
+        # 메트릭별 Top-K 호스트
+        top_hosts = {}
+        for metric in ("cpu", "memory", "network"):
+            candidates = [(e["metrics"][metric], host) for host, e in live.items() if metric in e["metrics"]]
+            top_hosts[metric] = [
+                {"host": host, "value": value}
+                for value, host in heapq.nlargest(self.top_k, candidates)
+            ]
+
+        # 각 호스트의 ProcessMonitor Top-N을 합쳐 플릿 전체 Top-K 프로세스 산출
+        top_processes = {}
+        for key in ("cpu_top", "memory_top", "disk_top", "network_top"):
+            candidates = []
+            for host, e in live.items():
+                for proc in e["processes"].get(key) or []:
+                    candidates.append((proc.get("value", 0), host, proc))
+            top_processes[key] = [
+                {"host": host, "pid": proc.get("pid"), "name": proc.get("name"), "value": value}
+                for value, host, proc in heapq.nlargest(self.top_k, candidates, key=lambda c: c[0])
+            ]
+
+        return {
+            "timestamp": now,
+            "host_count": len(live),
+            "stale_hosts": sorted(stale),
+            "histograms": histograms,
+            "top_hosts": top_hosts,
+            "top_processes": top_processes
+        }
+
+    def get_summary(self) -> dict:
+        """플릿 요약 반환 (변경이 없으면 캐시 재사용)"""
+        with self.lock:
+            if self._dirty or self._summary is None or \
+                    time.time() - self._summary["timestamp"] >= 1.0:
+                self._summary = self._compute_summary()
+                self._dirty = False
+            return self._summary
+
+    def get_hosts(self) -> list:
+        """등록된 호스트 목록 반환"""
+        now = time.time()
+        with self.lock:
+            self._expire(now)
+            return [
+                {
+                    "host": host,
+                    "last_seen": entry["received"],
+                    "stale": now - entry["received"] > self.stale_after,
+                    "metrics": entry["metrics"]
+                }
+                for host, entry in sorted(self.hosts.items())
+            ]
+
+    def get_host_snapshot(self, host: str) -> Optional[dict]:
+        """드릴다운용 개별 호스트 전체 스냅샷 반환"""
+        with self.lock:
+            entry = self.hosts.get(host)
+            return entry["snapshot"] if entry else None
+
+
+class FleetReporter:
+    """로컬 스냅샷을 중앙 집계 서버로 주기적으로 전송"""
+
+    def __init__(self, server_url: str, host: str, get_snapshot,
+                 interval: float = 1.0, token: str = None):
+        self.url = f"{server_url.rstrip('/')}/api/fleet/ingest/{host}"
+        self.get_snapshot = get_snapshot
+        self.interval = interval
+        self.token = token
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread:
+            self.thread.join(timeout=2)
+
+    def _loop(self):
+        """전송 루프 (실패 시 다음 주기에 재시도)"""
+        while self.running:
+            snapshot = self.get_snapshot()
+            if snapshot.get("timestamp"):
+                body = json.dumps(snapshot).encode("utf-8")
+                request = urllib.request.Request(self.url, data=body, method="POST")
+                request.add_header("Content-Type", "application/json")
+                if self.token:
+                    request.add_header("X-Fleet-Token", self.token)
+                try:
+                    urllib.request.urlopen(request, timeout=5).close()
+                except Exception as e:
+                    print(f"Fleet report error: {e}")
+            time.sleep(self.interval)
@@ -1,19 +1,34 @@
 import asyncio
+import copy
 import json
 import os
 import platform
+import threading
 import time
 from datetime import datetime
 from typing import List, Dict, Any
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from monitors import CPUMonitor, GPUMonitor, MemoryMonitor, DiskMonitor, NetworkMonitor, ProcessMonitor
+from monitors import CPUMonitor, GPUMonitor, MemoryMonitor, DiskMonitor, NetworkMonitor, ProcessMonitor, BurstSampler, CgroupMonitor, InterruptMonitor, WatchMonitor, KernelLimitsMonitor
 from pdf_generator import PDFGenerator
+from report_builder import ReportBuilder
+from assets import AssetBundle
+from fleet import FleetAggregator, FleetReporter
+from topics import TOPICS, DEFAULT_SUBSCRIPTION, MIN_INTERVALS, parse_subscription
+from demand import DemandTracker
+from prometheus import METRICS_TOPICS, render_metrics
+from alerts import AlertEngine
+from recorder import SnapshotRecorder
+import exporter
+from shared_snapshot import SnapshotPublisher, SnapshotReader
+from process_table import parse_query, query_rows, diff_page
+from dir_index import DirectoryIndexer
+from process_history import ProcessHistory
+from baselines import BaselineStore, compare
 
 # 모니터 인스턴스
 cpu_monitor = CPUMonitor()
@@ -22,24 +37,50 @@ memory_monitor = MemoryMonitor()
 disk_monitor = DiskMonitor()
 network_monitor = NetworkMonitor()
 process_monitor = ProcessMonitor()
+cgroup_monitor = CgroupMonitor()
+interrupt_monitor = InterruptMonitor()
+watch_monitor = WatchMonitor()
+limits_monitor = KernelLimitsMonitor()
+burst_sampler = BurstSampler()
 pdf_generator = PDFGenerator(output_dir="../reports")
 
-# 모니터링 데이터 저장소
-monitoring_data: Dict[str, List] = {
-    "cpu": [],
-    "memory": [],
-    "gpu": [],
-    "cpu_temp": [],
-    "gpu_temp": [],
-    "network_upload": [],
-    "network_download": [],
-    "disk": [],
-    "timestamps": []
-}
+# 플릿(다중 호스트) 집계
+# FLEET_SERVER_URL 설정 시 로컬 스냅샷을 중앙 서버로 전송
+# FLEET_TOKEN 설정 시 수신 측에서 X-Fleet-Token 헤더 검증
+LOCAL_HOST = platform.node() or "localhost"
+FLEET_SERVER_URL = os.environ.get("FLEET_SERVER_URL")
+FLEET_TOKEN = os.environ.get("FLEET_TOKEN")
+fleet_aggregator = FleetAggregator(top_k=5)
+
+# 알림 엔진 (규칙: ../config/alert_rules.json, 로그: ../logs/alerts.log)
+alert_engine = AlertEngine()
+
+# 스냅샷 기록/재생 (../recordings/<이름>.sysrec)
+snapshot_recorder = SnapshotRecorder()
+REPLAY_MAX_SPEED = 1000.0
+
+# 디렉터리 크기 색인 (../indexes/<루트 해시>.json.gz)
+directory_indexer = DirectoryIndexer()
+
+# 상위 프로세스 시계열 보존 (PROCESS_HISTORY_INTERVAL=0 이면 상시 수집 비활성화)
+process_history = ProcessHistory()
+PROCESS_HISTORY_INTERVAL = float(os.environ.get("PROCESS_HISTORY_INTERVAL", "5"))
+
+# 모니터링 리포트 (샘플마다 요약/차트 시계열 누적, 정적 섹션과 차트는 백그라운드 렌더링)
+report_builder = ReportBuilder(pdf_generator, lambda: {
+    "disk": disk_monitor.get_partitions(),
+    "system_info": get_system_info()
+})
+
+# 모니터링 실행 베이스라인 (회귀 비교용)
+baseline_store = BaselineStore()
 
 # 모니터링 상태
 monitoring_active = False
 monitoring_start_time = None
+monitoring_lock = threading.Lock()
+# 자동 완료된 모니터링 결과 (WebSocket 클라이언트별로 id 변경 시 1회 알림)
+monitoring_result: Dict[str, Any] = {"id": 0}
 
 # 프로세스 CPU 퍼센트 초기화를 위한 더미 호출
 import psutil
@@ -72,20 +113,58 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
-import threading
-import copy
-
 # 전역 데이터 저장소
 system_data_lock = threading.Lock()
-latest_system_data = {
-    "cpu": None, "gpu": None, "memory": None, "disk": None, 
-    "network": None, "processes": None, "timestamp": None
-}
+latest_system_data = {topic: None for topic in TOPICS}
+latest_system_data["timestamp"] = None
+
+# 소비자별 토픽 수요 관리 (수요가 없는 토픽은 수집하지 않음)
+demand_tracker = DemandTracker()
+
+# 5분 모니터링 기록에 필요한 토픽
+MONITORING_SUBSCRIPTION = parse_subscription(["cpu@1s", "gpu@1s", "memory@1s", "network@1s"])
+# 플릿 서버 전송에 필요한 토픽
+FLEET_SUBSCRIPTION = parse_subscription(["cpu@1s", "memory@1s", "network@1s", "disk@10s", "processes@3s"])
+
+# REST 폴링 / 스크레이프 임대 수요 유지 시간 (초)
+REST_DEMAND_TTL = 30.0
+
+# 전용 수집 프로세스 모드: collector.py 가 수집해 공유 메모리(SYSMON_SNAPSHOT_PATH)에 게시하고
+# uvicorn 워커 프로세스들은 잠금 없이 읽기만 한다 (환경 변수가 없으면 기존 단일 프로세스 모드)
+SNAPSHOT_PATH = os.environ.get("SYSMON_SNAPSHOT_PATH")
+COLLECTOR_PROCESS = os.environ.get("SYSMON_ROLE") == "collector"
+snapshot_reader = SnapshotReader(SNAPSHOT_PATH) if SNAPSHOT_PATH and not COLLECTOR_PROCESS else None
+process_table_reader = SnapshotReader(SNAPSHOT_PATH + ".processes") if snapshot_reader else None
+snapshot_publisher = None
+process_table_publisher = None
+# 공유 스냅샷에 포함할 최근 알림 이벤트 수
+SHARED_ALERT_EVENTS = 50
 
 class BackgroundMonitor:
+    # 수요가 전혀 없을 때 최대 대기 시간 (초)
+    IDLE_WAIT = 5.0
+
     def __init__(self):
         self.running = False
         self.thread = None
+        # 토픽별 마지막 수집 시각
+        self.last_collected = {topic: 0.0 for topic in TOPICS}
+        # 토픽별 수집 함수
+        self.collectors = {
+            "cpu": cpu_monitor.get_all,
+            "gpu": gpu_monitor.get_all,
+            "memory": memory_monitor.get_all,
+            "disk": disk_monitor.get_all,
+            "network": lambda: network_monitor.get_all(include_connections=False),
+            "connections": network_monitor.get_connections,
+            # 오버헤드가 큰 작업 (최소 3초 주기)
+            "processes": lambda: process_monitor.get_all(limit=5),
+            "cgroups": lambda: cgroup_monitor.get_all(limit=10),
+            "interrupts": lambda: interrupt_monitor.get_all(limit=10),
+            "limits": limits_monitor.get_all,
+            # 등록된 프로세스만 읽으므로 1초 미만 주기 허용
+            "watch": watch_monitor.get_all
+        }
 
     def start(self):
         self.running = True
@@ -94,84 +173,178 @@ class BackgroundMonitor:
 
     def stop(self):
         self.running = False
+        demand_tracker.changed.set()
         if self.thread:
             self.thread.join(timeout=2)
 
-    def _loop(self):
-        """데이터 수집 루프"""
+    def _collect(self, topics: list):
+        """지정 토픽 수집 후 최신 스냅샷 갱신"""
         global latest_system_data
-        last_process_time = 0
+
+        # 수집하지 않은 토픽은 이전 값 유지
+        payload = dict(latest_system_data)
+        for topic in topics:
+            try:
+                payload[topic] = self.collectors[topic]()
+            except Exception as e:
+                print(f"{topic} monitor error: {e}")
+            self.last_collected[topic] = time.time()
+
+        payload["timestamp"] = datetime.now().isoformat()
         
+        with system_data_lock:
+            latest_system_data = payload
+
+        # 전용 수집 프로세스: API 워커용 공유 스냅샷 게시
+        if snapshot_publisher:
+            try:
+                self._publish_shared(payload, topics)
+            except Exception as e:
+                print(f"Shared snapshot error: {e}")
+
+        # 상위 프로세스 시계열 (프로세스 표가 갱신된 주기에만)
+        if "processes" in topics:
+            try:
+                process_history.update(process_monitor.snapshot)
+            except Exception as e:
+                print(f"Process history error: {e}")
+
+        # 로컬 호스트도 플릿 집계에 포함
+        fleet_aggregator.ingest(LOCAL_HOST, payload)
+
+        # 알림 규칙 평가 (이번 주기에 수집된 토픽만)
+        try:
+            alert_engine.evaluate(payload, topics=topics)
+        except Exception as e:
+            print(f"Alert engine error: {e}")
+
+        # 스냅샷 기록 (지정 시간 경과로 종료되면 수집 수요 해제)
+        try:
+            if snapshot_recorder.write(payload, topics):
+                demand_tracker.release("recording:snapshots")
+        except Exception as e:
+            print(f"Recorder error: {e}")
+
+        # 5분 모니터링 기록
+        record_monitoring_sample(payload, topics)
+
+    def _publish_shared(self, payload: dict, topics: list):
+        """스냅샷 + 토픽별 수집 시각 + 알림 상태 게시 (프로세스 표는 수집된 주기에만 별도 버퍼로)"""
+        shared = dict(payload)
+        shared["_collected"] = dict(self.last_collected)
+        last_id = alert_engine.last_event_id
+        shared["_alerts"] = {
+            "last_id": last_id,
+            "events": alert_engine.get_events_since(max(last_id - SHARED_ALERT_EVENTS, 0)),
+            "active": alert_engine.get_active()
+        }
+        snapshot_publisher.publish(shared)
+        if "processes" in topics:
+            process_table_publisher.publish(process_monitor.snapshot)
+
+    def _loop(self):
+        """데이터 수집 루프 (수요가 있는 토픽만 필요한 주기로 수집, 수요가 없으면 유휴)"""
         while self.running:
+            intervals = demand_tracker.effective_intervals()
             try:
                 now = time.time()
-                
-                # 1. 가벼운 시스템 메트릭 (매초 수집)
-                cpu = cpu_monitor.get_all()
-                mem = memory_monitor.get_all()
-                net = network_monitor.get_all()
-                
-                # 2. 약간 무거운 메트릭 (GPU, Disk - 매초 수집하되 에러 무시)
-                try:
-                    gpu = gpu_monitor.get_all()
-                except: gpu = None
-                    
-                try:
-                   disk = disk_monitor.get_all()
-                except: disk = None
-
-                # 3. 매우 무거운 프로세스 목록 (3초 주기)
-                processes = latest_system_data["processes"]
-                if now - last_process_time >= 3.0 or processes is None:
-                    try:
-                        # 오버헤드가 큰 작업
-                        processes = process_monitor.get_all(limit=5)
-                        last_process_time = now
-                    except Exception as e:
-                        print(f"Process monitor error: {e}")
-                        if processes is None: processes = {}
-
-                # 데이터 업데이트
-                payload = {
-                    "timestamp": datetime.now().isoformat(),
-                    "cpu": cpu,
-                    "gpu": gpu,
-                    "memory": mem,
-                    "disk": disk,
-                    "network": net,
-                    "processes": processes
-                }
-                
-                with system_data_lock:
-                    latest_system_data = payload
-                    
+                due = [topic for topic, interval in intervals.items()
+                       if now - self.last_collected[topic] >= interval - 0.1]
+                if due:
+                    self._collect(due)
             except Exception as e:
                 print(f"Monitor loop error: {e}")
-            
-            # CPU 부하 조절을 위한 슬립
-            time.sleep(1.0)
+
+            # 다음 수집 시각까지 대기 (수요 변경 시 즉시 깨어남)
+            if intervals:
+                next_due = min(self.last_collected[t] + i for t, i in intervals.items())
+                wait = min(max(next_due - time.time(), 0.1), self.IDLE_WAIT)
+            else:
+                wait = self.IDLE_WAIT
+            demand_tracker.wait(wait)
 
 monitor_runner = BackgroundMonitor()
+fleet_reporter = None
+
+def require_process_history():
+    """사후 분석용 프로세스 시계열은 구독자가 없어도 상시 수집"""
+    if PROCESS_HISTORY_INTERVAL > 0:
+        interval = max(PROCESS_HISTORY_INTERVAL, MIN_INTERVALS["processes"])
+        demand_tracker.require("history:processes", {"processes": interval}, kind="history")
+
+def run_collector(path: str, subscription: dict):
+    """전용 수집 프로세스 실행 (collector.py) - 고정 구독으로 수집하며 공유 스냅샷 게시"""
+    global snapshot_publisher, process_table_publisher, fleet_reporter
+
+    snapshot_publisher = SnapshotPublisher(path)
+    process_table_publisher = SnapshotPublisher(path + ".processes")
+    # API 워커의 구독/임대 수요는 이 프로세스에 전달되지 않으므로 고정 구독으로 수집
+    demand_tracker.require("collector:shared", subscription, kind="collector")
+    demand_tracker.require("alerts:engine", alert_engine.required_topics(), kind="alerts")
+    require_process_history()
+    if FLEET_SERVER_URL:
+        demand_tracker.require("fleet:reporter", FLEET_SUBSCRIPTION, kind="fleet")
+        fleet_reporter = FleetReporter(FLEET_SERVER_URL, LOCAL_HOST, get_system_data, token=FLEET_TOKEN)
+        fleet_reporter.start()
+
+    print(f"[*] Collector publishing shared snapshot: {path}")
+    monitor_runner.running = True
+    try:
+        monitor_runner._loop()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        monitor_runner.running = False
+        if fleet_reporter:
+            fleet_reporter.stop()
+        snapshot_recorder.stop()
+        watch_monitor.close()
+        snapshot_publisher.close()
+        process_table_publisher.close()
+        print("[*] Collector stopped")
 
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global fleet_reporter
+
     # Startup
     print("[*] System Resource Monitor Server Starting...")
     print(f"[*] Platform: {platform.system()} {platform.release()}")
     
+    # 공유 스냅샷 워커: 수집은 collector.py 프로세스가 담당
+    if snapshot_reader:
+        print(f"[*] Reading shared snapshot from collector process: {SNAPSHOT_PATH}")
+        yield
+        print("[*] Server shutting down...")
+        return
+
     # 모니터링 스레드 시작
     print("[*] Starting Background Monitor...")
+    demand_tracker.require("alerts:engine", alert_engine.required_topics(), kind="alerts")
+    require_process_history()
     monitor_runner.start()
+
+    # 중앙 플릿 서버로 스냅샷 전송
+    if FLEET_SERVER_URL:
+        print(f"[*] Reporting to fleet server: {FLEET_SERVER_URL}")
+        demand_tracker.require("fleet:reporter", FLEET_SUBSCRIPTION, kind="fleet")
+        fleet_reporter = FleetReporter(FLEET_SERVER_URL, LOCAL_HOST, get_system_data, token=FLEET_TOKEN)
+        fleet_reporter.start()
     
     # Static 파일 서빙 (lifespan 내에서 처리하지 않고 app 생성 후 mount 권장하지만 여기서도 가능)
     
     yield
     
     # Shutdown
+    if fleet_reporter:
+        fleet_reporter.stop()
+    burst_sampler.stop()
+    snapshot_recorder.stop()
     print("[*] Stopping Background Monitor...")
     monitor_runner.stop()
+    watch_monitor.close()
     print("[*] Server shutting down...")
 
 app = FastAPI(
@@ -190,17 +363,173 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Static 파일 서빙
+# Static 파일 서빙 (시작 시 지문 + gzip/brotli 사전 압축, /static/<경로>.<해시>.<확장자> 는 영구 캐시)
 frontend_path = os.path.join(os.path.dirname(__file__), "..", "frontend")
-if os.path.exists(frontend_path):
-    app.mount("/static", StaticFiles(directory=frontend_path), name="static")
+asset_bundle = AssetBundle(frontend_path) if os.path.exists(frontend_path) else None
 
+def asset_response(asset, request: Request) -> Response:
+    """Accept-Encoding 에 맞는 사전 압축 변형 응답 (If-None-Match 일치 시 304)"""
+    coding, body = asset.select(request.headers.get("accept-encoding"))
+    etag = asset.etag(coding)
+    headers = {"Cache-Control": asset.cache_control, "ETag": etag, "Vary": "Accept-Encoding"}
+    if coding != "identity":
+        headers["Content-Encoding"] = coding
+    if etag in (request.headers.get("if-none-match") or ""):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=asset.media_type, headers=headers)
 
+@app.get("/static/{path:path}")
+async def static_asset(path: str, request: Request):
+    """정적 파일 (지문 URL 또는 기존 URL)"""
+    asset = asset_bundle.get(path) if asset_bundle else None
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    return asset_response(asset, request)
+
+
+
+def current_snapshot() -> dict:
+    """최신 스냅샷 (읽기 전용 - 수정하지 말 것)"""
+    if snapshot_reader:
+        return snapshot_reader.get() or latest_system_data
+    with system_data_lock:
+        return latest_system_data
 
 def get_system_data() -> dict:
     """캐시된 최신 시스템 데이터 반환 (Non-blocking)"""
-    with system_data_lock:
-        return copy.deepcopy(latest_system_data)
+    snapshot = current_snapshot()
+    return copy.deepcopy({k: v for k, v in snapshot.items() if not k.startswith("_")})
+
+def collected_times() -> dict:
+    """토픽별 마지막 수집 시각"""
+    if snapshot_reader:
+        return current_snapshot().get("_collected", {})
+    return monitor_runner.last_collected
+
+def process_table_snapshot() -> dict:
+    """이번 주기의 프로세스 표 {"time", "rows"}"""
+    if process_table_reader:
+        return process_table_reader.get() or {"time": 0.0, "rows": []}
+    return process_monitor.snapshot
+
+def alert_last_id() -> int:
+    if snapshot_reader:
+        return current_snapshot().get("_alerts", {}).get("last_id", 0)
+    return alert_engine.last_event_id
+
+def alert_events_since(event_id: int) -> list:
+    if snapshot_reader:
+        events = current_snapshot().get("_alerts", {}).get("events", [])
+        return [e for e in events if e["id"] > event_id]
+    return alert_engine.get_events_since(event_id)
+
+def alert_active() -> list:
+    if snapshot_reader:
+        return current_snapshot().get("_alerts", {}).get("active", [])
+    return alert_engine.get_active()
+
+def require_local_collector():
+    """수집기 상태를 바꾸는 API 는 수집기와 같은 프로세스에서만 가능"""
+    if snapshot_reader:
+        raise HTTPException(status_code=409, detail="Not available in shared-snapshot worker mode; "
+                                                    "collector state lives in the collector process")
+
+async def read_json_object(request: Request) -> dict:
+    """요청 본문 JSON 객체 (본문이 없거나 JSON 이 아니면 빈 dict, 객체가 아닌 JSON 은 400)"""
+    try:
+        params = await request.json()
+    except ValueError:
+        return {}
+    if not isinstance(params, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
+    return params
+
+async def wait_for_topics(topics, timeout: float = 2.0):
+    """수요 등록 직후 아직 한 번도 수집되지 않은 토픽이 수집될 때까지 잠시 대기"""
+    # 공유 스냅샷 워커의 수요는 수집 프로세스의 고정 구독을 바꾸지 못하므로 기다려도 오지 않는 토픽이 있음
+    if snapshot_reader:
+        return
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        collected = collected_times()
+        if all(collected.get(t, 0) > 0 for t in topics):
+            return
+        await asyncio.sleep(0.1)
+
+def get_monitoring_state() -> dict:
+    """5분 모니터링 진행 상태"""
+    elapsed = 0
+    remaining = 300
+    
+    if monitoring_active and monitoring_start_time:
+        elapsed = (datetime.now() - monitoring_start_time).total_seconds()
+        remaining = max(0, 300 - elapsed)
+    
+    return {
+        "active": monitoring_active,
+        "elapsed_seconds": elapsed,
+        "remaining_seconds": remaining,
+        "data_points": report_builder.data_points,
+        "baseline": report_builder.baseline["name"] if report_builder.baseline else None
+    }
+
+def record_monitoring_sample(snapshot: dict, topics: list = TOPICS):
+    """5분 모니터링 데이터 기록 (수집 스레드에서 호출, topics: 이번 주기에 수집된 토픽)"""
+    global monitoring_active
+
+    if not monitoring_active or not monitoring_start_time:
+        return
+
+    # 감시 프로세스는 watch 토픽이 수집된 주기에만 반영
+    if "watch" in topics and snapshot.get("watch"):
+        report_builder.add_watch(snapshot["watch"]["processes"])
+
+    values = {}
+    # 다른 토픽만 수집된 주기 (watch, limits 등) 에 이전 값이 중복 기록되지 않도록 지표별로 해당 토픽이 수집된 주기에만 기록
+    if "cpu" in topics and snapshot["cpu"]:
+        values["cpu"] = snapshot["cpu"]["usage"]["percent"]
+        
+        if snapshot["cpu"]["temperature"]["available"]:
+            values["cpu_temp"] = snapshot["cpu"]["temperature"]["value"]
+
+    if "memory" in topics and snapshot["memory"]:
+        values["memory"] = snapshot["memory"]["virtual"]["percent"]
+    
+    if "gpu" in topics and snapshot["gpu"] and snapshot["gpu"]["available"] and snapshot["gpu"]["gpus"]:
+        values["gpu"] = snapshot["gpu"]["gpus"][0]["load"]
+        values["gpu_temp"] = snapshot["gpu"]["gpus"][0]["temperature"]
+    
+    if "network" in topics and snapshot["network"]:
+        network_speed = snapshot["network"]["speed"]
+        values["network_upload"] = network_speed["upload_speed"] / 1024
+        values["network_download"] = network_speed["download_speed"] / 1024
+    
+    report_builder.add(values)
+
+    # 5분 경과 시 자동 중지 (PDF 생성은 수집을 막지 않도록 별도 스레드)
+    if (datetime.now() - monitoring_start_time).total_seconds() >= 300:
+        with monitoring_lock:
+            if not monitoring_active:
+                return
+            monitoring_active = False
+        demand_tracker.release("recording:monitoring")
+        threading.Thread(target=_complete_monitoring, daemon=True).start()
+
+def finalize_monitoring_report() -> str:
+    """미리 누적/렌더링한 섹션으로 PDF 리포트 조립"""
+    return report_builder.finish(duration_minutes=5)
+
+def _complete_monitoring():
+    """자동 완료된 모니터링의 PDF 생성 후 결과 게시"""
+    global monitoring_result
+
+    result = {"id": monitoring_result["id"] + 1}
+    try:
+        result["pdf_path"] = finalize_monitoring_report()
+        result["comparison"] = report_builder.comparison
+    except Exception as e:
+        result["pdf_error"] = str(e)
+    monitoring_result = result
 
 def get_system_info() -> dict:
     """시스템 정보 반환"""
@@ -218,27 +547,113 @@ def get_system_info() -> dict:
     }
 
 @app.get("/")
-async def root():
-    """메인 페이지"""
-    index_path = os.path.join(frontend_path, "index.html")
-    if os.path.exists(index_path):
-        return FileResponse(index_path)
+async def root(request: Request):
+    """메인 페이지 (에셋 참조는 지문 URL 로 치환됨)"""
+    if asset_bundle and asset_bundle.index:
+        return asset_response(asset_bundle.index, request)
     return {"message": "System Resource Monitor API", "docs": "/docs"}
 
 @app.get("/api/status")
 async def get_status():
-    """현재 시스템 상태 반환"""
+    """현재 시스템 상태 반환 (폴링이 이어지는 동안 전체 토픽 수집 유지)"""
+    subscription = parse_subscription(DEFAULT_SUBSCRIPTION)
+    demand_tracker.require("rest:status", subscription, kind="rest", ttl=REST_DEMAND_TTL)
+    # 기본 구독에 없는 토픽 (cgroups, interrupts, watch) 은 기다리지 않음
+    await wait_for_topics(list(subscription))
     return get_system_data()
 
+last_scrape_time = 0.0
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus 스크레이프 엔드포인트 (스크레이프 주기에 맞춰 수집)"""
+    global last_scrape_time
+
+    now = time.time()
+    interval = min(max(now - last_scrape_time, 1.0), 60.0) if last_scrape_time else 15.0
+    last_scrape_time = now
+    demand_tracker.require("scrape:metrics", {t: interval for t in METRICS_TOPICS},
+                           kind="scrape", ttl=max(interval * 3, REST_DEMAND_TTL))
+    await wait_for_topics(METRICS_TOPICS)
+    text = render_metrics(current_snapshot())
+    return PlainTextResponse(text, media_type="text/plain; version=0.0.4")
+
+@app.get("/api/processes")
+async def get_processes(request: Request):
+    """전체 프로세스 표 (정렬/필터/페이지, 예: ?sort=memory_percent&order=desc&user=www-data&offset=0&limit=50)"""
+    try:
+        query = parse_query(dict(request.query_params))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    demand_tracker.require("rest:processes", {"processes": MIN_INTERVALS["processes"]},
+                           kind="rest", ttl=REST_DEMAND_TTL)
+    await wait_for_topics(["processes"])
+    table = process_table_snapshot()
+    result = query_rows(table["rows"], query)
+    result["timestamp"] = table["time"]
+    return result
+
+@app.get("/api/processes/history")
+async def get_process_history(start: str = None, end: str = None, minutes: float = None,
+                              metric: str = "cpu", limit: int = 10, pid: int = None, points: bool = True):
+    """기간별 상위 프로세스 시계열 (예: ?start=2026-01-01T10:00&end=2026-01-01T10:15&metric=cpu 또는 ?minutes=10)"""
+    require_local_collector()
+    try:
+        start_time = exporter.parse_time(start)
+        end_time = exporter.parse_time(end)
+        if minutes is not None:
+            start_time = time.time() - minutes * 60
+        return process_history.query(start_time, end_time, metric=metric, limit=max(1, min(limit, 100)),
+                                     pid=pid, include_points=points)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/api/watch")
+async def add_watch(request: Request):
+    """프로세스 감시 등록 (예: {"pid": 1234} / {"name": "nginx"} / {"pattern": "gunicorn .*app:api"})
+
+    상세 지표는 WebSocket 'watch' 토픽 (예: "watch@250ms") 또는 GET /api/watch 로 받는다.
+    """
+    require_local_collector()
+    params = await read_json_object(request)
+    try:
+        return watch_monitor.add(pid=params.get("pid"), name=params.get("name"), pattern=params.get("pattern"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/api/watch")
+async def get_watches():
+    """감시 목록과 최신 상세 지표 (폴링이 이어지는 동안 watch 토픽 수집 유지)"""
+    require_local_collector()
+    demand_tracker.require("rest:watch", {"watch": 1.0}, kind="rest", ttl=REST_DEMAND_TTL)
+    await wait_for_topics(["watch"])
+    return {**(get_system_data().get("watch") or {}), "watches": watch_monitor.list()}
+
+@app.delete("/api/watch/{watch_id}")
+async def remove_watch(watch_id: int):
+    """감시 해제 (일치하던 프로세스 핸들도 닫음)"""
+    require_local_collector()
+    try:
+        watch_monitor.remove(watch_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Watch not found")
+    return {"status": "deleted", "id": watch_id}
+
+@app.get("/api/demand")
+async def get_demand():
+    """소비자별 수집 수요 상태"""
+    return demand_tracker.describe()
+
 @app.get("/api/system-info")
 async def get_sys_info():
     """시스템 정보 반환"""
     return get_system_info()
 
 @app.post("/api/start-monitoring")
-async def start_monitoring():
-    """5분 모니터링 시작"""
-    global monitoring_active, monitoring_start_time, monitoring_data
+async def start_monitoring(request: Request):
+    """5분 모니터링 시작 (선택: {"baseline": "release-1.2", "align": "load test start"})"""
+    require_local_collector()
+    global monitoring_active, monitoring_start_time
     
     if monitoring_active:
         return JSONResponse(
@@ -246,51 +661,52 @@ async def start_monitoring():
             content={"error": "Monitoring already in progress"}
         )
     
-    # 데이터 초기화
-    monitoring_data = {
-        "cpu": [],
-        "memory": [],
-        "gpu": [],
-        "cpu_temp": [],
-        "gpu_temp": [],
-        "network_upload": [],
-        "network_download": [],
-        "disk": [],
-        "timestamps": []
-    }
+    params = await read_json_object(request)
+    baseline = None
+    if params.get("baseline"):
+        try:
+            baseline = baseline_store.load(params["baseline"])
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Baseline not found")
+    
+    # 리포트 초기화 (정적 섹션 렌더링 시작)
+    report_builder.start(baseline=baseline, align=params.get("align"))
     
-    monitoring_active = True
     monitoring_start_time = datetime.now()
+    monitoring_active = True
+    subscription = dict(MONITORING_SUBSCRIPTION)
+    if watch_monitor.watches:
+        # 감시 프로세스 요약을 리포트에 포함
+        subscription["watch"] = 1.0
+    demand_tracker.require("recording:monitoring", subscription, kind="recording")
     
     return {"status": "monitoring_started", "start_time": monitoring_start_time.isoformat()}
 
 @app.post("/api/stop-monitoring")
 async def stop_monitoring():
     """모니터링 중지 및 PDF 생성"""
-    global monitoring_active, monitoring_data
+    require_local_collector()
+    global monitoring_active
     
-    if not monitoring_active:
-        return JSONResponse(
-            status_code=400,
-            content={"error": "No monitoring in progress"}
-        )
-    
-    monitoring_active = False
-    
-    # 디스크 정보 추가
-    disk_data = disk_monitor.get_partitions()
-    monitoring_data["disk"] = disk_data
-    
-    # 시스템 정보 추가
-    monitoring_data["system_info"] = get_system_info()
+    with monitoring_lock:
+        if not monitoring_active:
+            return JSONResponse(
+                status_code=400,
+                content={"error": "No monitoring in progress"}
+            )
+        monitoring_active = False
+    demand_tracker.release("recording:monitoring")
     
     # PDF 생성
     try:
-        pdf_path = pdf_generator.generate(monitoring_data, duration_minutes=5)
+        pdf_path = finalize_monitoring_report()
         return {
             "status": "monitoring_stopped",
             "pdf_path": pdf_path,
-            "data_points": len(monitoring_data["cpu"])
+            "data_points": report_builder.data_points,
+            "comparison": report_builder.comparison
         }
     except Exception as e:
         return JSONResponse(
@@ -301,21 +717,93 @@ async def stop_monitoring():
 @app.get("/api/monitoring-status")
 async def get_monitoring_status():
     """모니터링 상태 확인"""
-    global monitoring_active, monitoring_start_time
-    
-    elapsed = 0
-    remaining = 300
-    
-    if monitoring_active and monitoring_start_time:
-        elapsed = (datetime.now() - monitoring_start_time).total_seconds()
-        remaining = max(0, 300 - elapsed)
-    
-    return {
-        "active": monitoring_active,
-        "elapsed_seconds": elapsed,
-        "remaining_seconds": remaining,
-        "data_points": len(monitoring_data["cpu"])
-    }
+    require_local_collector()
+    return get_monitoring_state()
+
+@app.post("/api/monitoring/events")
+async def add_monitoring_event(request: Request):
+    """진행 중인 모니터링 타임라인에 이벤트 표시 (예: {"label": "load test start"})"""
+    require_local_collector()
+    params = await read_json_object(request)
+    label = params.get("label")
+    if not isinstance(label, str) or not label.strip() or len(label) > 80:
+        raise HTTPException(status_code=400, detail="label must be a non-empty string of at most 80 characters")
+    if not monitoring_active:
+        raise HTTPException(status_code=400, detail="No monitoring in progress")
+    try:
+        timestamp = exporter.parse_time(params.get("time"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        return report_builder.mark(label.strip(), timestamp)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+@app.get("/api/monitoring/events")
+async def get_monitoring_events():
+    """진행 중(또는 마지막) 모니터링의 이벤트 목록"""
+    return {"events": list(report_builder.events)}
+
+@app.post("/api/baselines")
+async def save_baseline(request: Request):
+    """마지막으로 완료된 모니터링 실행을 베이스라인으로 저장 (예: {"name": "release-1.2", "overwrite": false})"""
+    require_local_collector()
+    params = await read_json_object(request)
+    if report_builder.last_run is None:
+        raise HTTPException(status_code=409, detail="No completed monitoring run to save")
+    try:
+        return baseline_store.save(params.get("name"), report_builder.last_run, bool(params.get("overwrite")))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+@app.get("/api/baselines")
+async def list_baselines():
+    """저장된 베이스라인 목록"""
+    return {"baselines": baseline_store.list()}
+
+@app.get("/api/baselines/{name}")
+async def get_baseline(name: str):
+    """베이스라인 요약 (지표별 표본 수, 이벤트)"""
+    try:
+        return baseline_store.describe(baseline_store.load(name))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Baseline not found")
+
+@app.get("/api/baselines/{name}/compare")
+async def compare_baseline(name: str, alpha: float = 0.05, min_change: float = 5.0):
+    """진행 중인 모니터링(없으면 마지막 완료 실행)을 베이스라인과 비교"""
+    require_local_collector()
+    if not 0 < alpha < 1:
+        raise HTTPException(status_code=400, detail="alpha must be between 0 and 1")
+    try:
+        baseline = baseline_store.load(name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Baseline not found")
+    run = report_builder.export() if monitoring_active else report_builder.last_run
+    if run is None:
+        raise HTTPException(status_code=409, detail="No monitoring run to compare")
+    try:
+        result = compare(baseline, run, alpha=alpha, min_change_pct=min_change)
+    except (KeyError, TypeError) as e:
+        raise HTTPException(status_code=422, detail=f"Baseline cannot be compared: {e}")
+    return {"live": monitoring_active, **result}
+
+@app.delete("/api/baselines/{name}")
+async def delete_baseline(name: str):
+    """베이스라인 삭제"""
+    try:
+        baseline_store.delete(name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Baseline not found")
+    return {"status": "deleted", "name": name}
 
 @app.get("/api/download-report/{filename}")
 async def download_report(filename: str):
@@ -357,76 +845,500 @@ async def list_reports():
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    """실시간 데이터 WebSocket 엔드포인트"""
-    global monitoring_active, monitoring_data, monitoring_start_time
-    
+    """실시간 데이터 WebSocket 엔드포인트
+
+    클라이언트 메시지:
+        {"subscribe": ["cpu@1s", "processes@5s", "disk@30s"]}  # 구독 교체
+        {"unsubscribe": ["disk"]}  # 일부 토픽 해지
+        {"process_table": {"sort": "cpu_percent", "offset": 0, "limit": 50}}  # 프로세스 표 보기 설정
+        {"process_table": null}  # 프로세스 표 해지
+    구독 메시지를 보내지 않은 클라이언트는 DEFAULT_SUBSCRIPTION 적용
+    프로세스 표는 처음(또는 보기 변경 시) 전체 페이지, 이후 프로세스 수집마다 페이지 변경분만 전송
+    """
     await manager.connect(websocket)
+    consumer = f"ws:{id(websocket)}"
+    subscription = parse_subscription(DEFAULT_SUBSCRIPTION)
+    demand_tracker.require(consumer, subscription, kind="ws")
+    last_sent: Dict[str, float] = {}
+    pending_reply: Dict[str, Any] = {}
+    last_result_id = monitoring_result["id"]
+    last_alert_id = alert_last_id()
+    # 프로세스 표 보기 상태 (query, 마지막으로 보낸 페이지 행, 기준 수집 시각)
+    table: Dict[str, Any] = {"query": None, "rows": [], "collected": 0.0, "full": True}
+
+    def update_demand():
+        topics = dict(subscription)
+        if table["query"]:
+            topics.setdefault("processes", MIN_INTERVALS["processes"])
+        demand_tracker.require(consumer, topics, kind="ws")
+
+    async def receive_loop():
+        while True:
+            message = await websocket.receive_json()
+            if not isinstance(message, dict):
+                continue
+            if "process_table" in message:
+                view = message["process_table"]
+                try:
+                    if view is not None and not isinstance(view, dict):
+                        raise ValueError("process_table must be an object or null")
+                    table["query"] = parse_query(view) if view is not None else None
+                except ValueError as e:
+                    pending_reply["error"] = str(e)
+                    continue
+                table["full"] = True
+                update_demand()
+                continue
+            try:
+                if "subscribe" in message:
+                    updated = parse_subscription(message["subscribe"])
+                elif "unsubscribe" in message:
+                    updated = {t: i for t, i in subscription.items() if t not in message["unsubscribe"]}
+                else:
+                    continue
+            except (ValueError, TypeError) as e:
+                pending_reply["error"] = str(e)
+                continue
+            subscription.clear()
+            subscription.update(updated)
+            update_demand()
+            # 새로 구독한 토픽은 다음 프레임에 바로 전송
+            last_sent.clear()
+            pending_reply["subscribed"] = {t: f"{i:g}s" for t, i in subscription.items()}
+
+    receiver = asyncio.create_task(receive_loop())
     
     try:
-        while True:
+        while not receiver.done():
             # 시스템 데이터 수집
-            data = get_system_data()
+            snapshot = get_system_data()
+            now = time.time()
+
+            # 주기가 도래한 구독 토픽만 전송
+            data = {"timestamp": snapshot["timestamp"]}
+            for topic, interval in subscription.items():
+                if now - last_sent.get(topic, 0) >= interval - 0.1:
+                    data[topic] = snapshot.get(topic)
+                    last_sent[topic] = now
+            if pending_reply:
+                data.update(pending_reply)
+                pending_reply.clear()
+
+            # 프로세스 표: 새 수집 결과가 있을 때만 보이는 페이지의 변경분 전송
+            collected = collected_times().get("processes", 0)
+            if table["query"] and collected and (table["full"] or collected != table["collected"]):
+                page = query_rows(process_table_snapshot()["rows"], table["query"])
+                rows = page.pop("rows")
+                if table["full"]:
+                    page["full"] = True
+                    page["rows"] = rows
+                else:
+                    page.update(diff_page(table["rows"], rows))
+                table.update(rows=rows, collected=collected, full=False)
+                data["process_table"] = page
+
+            # 새 알림 이벤트 전송
+            if alert_last_id() != last_alert_id:
+                data["alerts"] = alert_events_since(last_alert_id)
+                last_alert_id = alert_last_id()
+
+            # 자동 완료된 모니터링 결과 알림
+            if monitoring_result["id"] != last_result_id:
+                last_result_id = monitoring_result["id"]
+                data["monitoring_complete"] = True
+                data.update({k: v for k, v in monitoring_result.items() if k != "id"})
             
             # 모니터링 상태 추가
-            elapsed = 0
-            remaining = 300
+            data["monitoring"] = get_monitoring_state()
             
-            if monitoring_active and monitoring_start_time:
-                elapsed = (datetime.now() - monitoring_start_time).total_seconds()
-                remaining = max(0, 300 - elapsed)
-                
-                # 데이터 저장
-                monitoring_data["cpu"].append(data["cpu"]["usage"]["percent"])
-                monitoring_data["memory"].append(data["memory"]["virtual"]["percent"])
-                monitoring_data["timestamps"].append(data["timestamp"])
-                
-                if data["cpu"]["temperature"]["available"]:
-                    monitoring_data["cpu_temp"].append(data["cpu"]["temperature"]["value"])
-                
-                if data["gpu"]["available"] and data["gpu"]["gpus"]:
-                    monitoring_data["gpu"].append(data["gpu"]["gpus"][0]["load"])
-                    monitoring_data["gpu_temp"].append(data["gpu"]["gpus"][0]["temperature"])
-                
-                network_speed = data["network"]["speed"]
-                monitoring_data["network_upload"].append(network_speed["upload_speed"] / 1024)
-                monitoring_data["network_download"].append(network_speed["download_speed"] / 1024)
-                
-                # 5분 경과 시 자동 중지
-                if elapsed >= 300:
-                    monitoring_active = False
-                    
-                    # PDF 생성
-                    disk_data = disk_monitor.get_partitions()
-                    monitoring_data["disk"] = disk_data
-                    monitoring_data["system_info"] = get_system_info()
-                    
-                    try:
-                        pdf_path = pdf_generator.generate(monitoring_data, duration_minutes=5)
-                        data["monitoring_complete"] = True
-                        data["pdf_path"] = pdf_path
-                    except Exception as e:
-                        data["monitoring_complete"] = True
-                        data["pdf_error"] = str(e)
-            
-            data["monitoring"] = {
-                "active": monitoring_active,
-                "elapsed_seconds": elapsed,
-                "remaining_seconds": remaining,
-                "data_points": len(monitoring_data["cpu"])
-            }
-            
-            # 데이터 전송
+            # 데이터 전송 (sent_at: 부하 테스트 지연 측정용 서버 전송 시각)
+            data["sent_at"] = time.time()
             await websocket.send_json(data)
             
-            # 1초 대기
-            await asyncio.sleep(1)
+            # 구독 중 가장 짧은 주기만큼 대기 (최대 1초, watch@250ms 등 1초 미만 구독 지원)
+            await asyncio.sleep(min([1.0] + list(subscription.values())))
             
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        pass
     except Exception as e:
         print(f"WebSocket error: {e}")
+    finally:
+        receiver.cancel()
+        demand_tracker.release(consumer)
         manager.disconnect(websocket)
 
+@app.get("/api/alerts")
+async def get_alerts():
+    """발생 중인 알림과 최근 알림 이벤트"""
+    return {
+        "active": alert_active(),
+        "recent": alert_events_since(0)
+    }
+
+@app.get("/api/alerts/rules")
+async def get_alert_rules():
+    """알림 규칙 조회"""
+    require_local_collector()
+    return alert_engine.config
+
+@app.put("/api/alerts/rules")
+async def put_alert_rules(request: Request):
+    """알림 규칙 교체 (검증 후 저장)"""
+    require_local_collector()
+    try:
+        config = await request.json()
+        alert_engine.set_rules(config)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    demand_tracker.require("alerts:engine", alert_engine.required_topics(), kind="alerts")
+    return {"status": "ok", "rules": len(config["rules"])}
+
+@app.post("/api/burst")
+async def start_burst(request: Request):
+    """고빈도 버스트 샘플링 시작 (예: {"hz": 50, "duration": 10, "metrics": ["cpu", "net"]})"""
+    require_local_collector()
+    params = await read_json_object(request)
+    try:
+        config = burst_sampler.start(
+            hz=float(params.get("hz", 50)),
+            duration=float(params.get("duration", 10)),
+            metrics=params.get("metrics")
+        )
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "burst_started", "config": config}
+
+@app.get("/api/burst")
+async def get_burst_status():
+    """버스트 샘플링 상태"""
+    require_local_collector()
+    return burst_sampler.status()
+
+@app.delete("/api/burst")
+async def stop_burst():
+    """버스트 샘플링 중지"""
+    require_local_collector()
+    burst_sampler.stop()
+    return burst_sampler.status()
+
+@app.websocket("/ws/burst")
+async def burst_websocket_endpoint(websocket: WebSocket):
+    """버스트 샘플 배치 스트리밍 (실행 중 200ms 마다 새 샘플 전송)"""
+    await websocket.accept()
+    session = burst_sampler.session
+    index = burst_sampler.count if burst_sampler.running else 0
+    try:
+        while True:
+            if burst_sampler.session != session:
+                # 새 버스트 시작 시 처음부터 전송
+                session = burst_sampler.session
+                index = 0
+            if burst_sampler.count > index:
+                frame = burst_sampler.read_since(index)
+                index = frame["end"]
+                await websocket.send_json(frame)
+            await asyncio.sleep(0.2 if burst_sampler.running else 1.0)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        print(f"Burst WebSocket error: {e}")
+
+@app.post("/api/recordings")
+async def start_recording(request: Request):
+    """스냅샷 기록 시작 (예: {"name": "incident-1", "duration": 600, "topics": ["cpu@1s", "processes@3s"]})"""
+    require_local_collector()
+    params = await read_json_object(request)
+    try:
+        topics = parse_subscription(params.get("topics") or DEFAULT_SUBSCRIPTION)
+        duration = params.get("duration")
+        status = snapshot_recorder.start(params.get("name"), float(duration) if duration else None, topics)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    demand_tracker.require("recording:snapshots", topics, kind="recording")
+    return {"status": "recording_started", **status}
+
+@app.delete("/api/recordings")
+async def stop_recording():
+    """진행 중인 스냅샷 기록 중지"""
+    require_local_collector()
+    info = snapshot_recorder.stop()
+    demand_tracker.release("recording:snapshots")
+    if info is None:
+        raise HTTPException(status_code=400, detail="No recording in progress")
+    return {"status": "recording_stopped", **info}
+
+@app.get("/api/recordings")
+async def list_recordings():
+    """기록 목록과 진행 중인 기록 상태"""
+    return {"active": snapshot_recorder.status(), "recordings": snapshot_recorder.list()}
+
+@app.get("/api/recordings/{name}")
+async def get_recording(name: str):
+    """기록 정보와 내보내기 가능한 컬럼 (첫 프레임 기준)"""
+    try:
+        reader = snapshot_recorder.open(name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Recording not found")
+    first = next(reader.iter_frames(), None)
+    return {
+        "name": name,
+        "frames": reader.frames,
+        "start": reader.start,
+        "end": reader.end,
+        "columns": list(exporter.frame_values(first[1])) if first else [],
+        "formats": list(exporter.FORMATS) if exporter.pa is not None else ["csv"]
+    }
+
+@app.get("/api/recordings/{name}/export")
+async def export_recording(name: str, format: str = "csv", columns: str = None,
+                           start: str = None, end: str = None):
+    """기록 메트릭 스트리밍 내보내기 (예: ?format=parquet&columns=cpu.percent,disk.percent&start=2026-01-01T00:00)"""
+    try:
+        reader = snapshot_recorder.open(name)
+        start_time = exporter.parse_time(start)
+        end_time = exporter.parse_time(end)
+        stream = exporter.export(
+            reader.iter_frames(start_time), fmt=format,
+            columns=[c.strip() for c in columns.split(",") if c.strip()] if columns else None,
+            start=start_time, end=end_time
+        )
+    except exporter.ExportUnavailable as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Recording not found")
+    media_type, extension = exporter.FORMATS[format]
+    return StreamingResponse(stream, media_type=media_type, headers={
+        "Content-Disposition": f'attachment; filename="{name}.{extension}"'
+    })
+
+@app.delete("/api/recordings/{name}")
+async def delete_recording(name: str):
+    """기록 파일 삭제"""
+    try:
+        snapshot_recorder.delete(name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Recording not found")
+    return {"status": "deleted", "name": name}
+
+@app.post("/api/disk/index")
+async def start_directory_index(request: Request):
+    """디렉터리 크기 색인 시작 (예: {"path": "/var", "rate": 5000, "workers": 4})"""
+    require_local_collector()
+    params = await read_json_object(request)
+    try:
+        status = directory_indexer.start(
+            params.get("path"),
+            rate=float(params.get("rate", 5000)),
+            workers=int(params.get("workers", 4))
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "index_started", **status}
+
+@app.get("/api/disk/index")
+async def get_directory_index(path: str = None, limit: int = 20, depth: int = None):
+    """색인 진행 상태 (path 지정 시 가장 큰/가장 빠르게 커진 디렉터리 Top N)"""
+    require_local_collector()
+    if not path:
+        return directory_indexer.status()
+    try:
+        result = directory_indexer.result(path, limit=max(1, min(limit, 200)), depth=depth)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="No index for this path yet")
+    return {**result, "indexing": directory_indexer.status()}
+
+@app.delete("/api/disk/index")
+async def stop_directory_index():
+    """진행 중인 색인 중단 (이전 인덱스 유지)"""
+    require_local_collector()
+    # 색인 스레드 종료 대기 (최대 5초) 가 이벤트 루프를 막지 않도록 별도 스레드에서
+    if not await asyncio.to_thread(directory_indexer.stop):
+        raise HTTPException(status_code=400, detail="No index in progress")
+    return {"status": "index_stopped", **directory_indexer.status()}
+
+@app.websocket("/ws/replay")
+async def replay_websocket_endpoint(websocket: WebSocket, name: str, speed: float = 1.0, start: float = 0.0):
+    """기록 재생 (/ws 와 같은 스냅샷 프레임 + replay 상태)
+
+    쿼리: name, speed (1/10/100 배속 등), start (기록 시작 기준 초)
+    클라이언트 메시지:
+        {"speed": 10}      # 배속 변경
+        {"seek": 120}      # 기록 시작 기준 120초 지점으로 이동
+        {"pause": true}    # 일시 정지 / 재개
+    """
+    await websocket.accept()
+    try:
+        reader = snapshot_recorder.open(name)
+    except (ValueError, FileNotFoundError, OSError) as e:
+        await websocket.send_json({"error": f"Cannot open recording: {e}"})
+        await websocket.close()
+        return
+    if not reader.frames:
+        await websocket.send_json({"error": "Recording is empty"})
+        await websocket.close()
+        return
+
+    state = {"speed": min(max(speed, 0.01), REPLAY_MAX_SPEED), "paused": False, "seek": start}
+    changed = asyncio.Event()
+
+    async def receive_loop():
+        while True:
+            message = await websocket.receive_json()
+            if not isinstance(message, dict):
+                continue
+            try:
+                if "speed" in message:
+                    state["speed"] = min(max(float(message["speed"]), 0.01), REPLAY_MAX_SPEED)
+                if "seek" in message:
+                    state["seek"] = max(float(message["seek"]), 0.0)
+                if "pause" in message:
+                    state["paused"] = bool(message["pause"])
+            except (TypeError, ValueError):
+                continue
+            changed.set()
+
+    async def wait_for_change(timeout: float = None):
+        """배속/이동/정지 메시지가 오거나 timeout 이 지날 때까지 대기"""
+        try:
+            await asyncio.wait_for(changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        changed.clear()
+
+    receiver = asyncio.create_task(receive_loop())
+    frames = None
+    previous = None
+    try:
+        while not receiver.done():
+            if state["seek"] is not None:
+                frames = reader.iter_frames(reader.start + state["seek"])
+                state["seek"] = None
+                previous = None
+            if state["paused"]:
+                await wait_for_change()
+                continue
+
+            frame = next(frames, None)
+            if frame is None:
+                await websocket.send_json({"replay": {"name": name, "finished": True, "time": reader.end,
+                                                      "speed": state["speed"]}})
+                # 이동(seek) 요청이 올 때까지 대기
+                while state["seek"] is None and not receiver.done():
+                    await wait_for_change()
+                continue
+
+            timestamp, snapshot = frame
+            if previous is not None:
+                await wait_for_change((timestamp - previous) / state["speed"])
+                if state["seek"] is not None:
+                    continue
+            previous = timestamp
+
+            # 기록 전용 메타데이터 (이번 주기 수집 토픽) 는 /ws 프레임에 없음
+            snapshot.pop("_collected", None)
+            snapshot["replay"] = {
+                "name": name,
+                "time": timestamp,
+                "offset": round(timestamp - reader.start, 3),
+                "duration": round(reader.end - reader.start, 3),
+                "speed": state["speed"],
+                "finished": False
+            }
+            snapshot["sent_at"] = time.time()
+            await websocket.send_json(snapshot)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        print(f"Replay WebSocket error: {e}")
+    finally:
+        receiver.cancel()
+
+@app.post("/api/fleet/ingest/{host}")
+async def fleet_ingest(host: str, request: Request):
+    """원격 호스트 스냅샷 수신"""
+    require_local_collector()
+    if FLEET_TOKEN and request.headers.get("X-Fleet-Token") != FLEET_TOKEN:
+        raise HTTPException(status_code=403, detail="Invalid fleet token")
+    try:
+        snapshot = await request.json()
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid snapshot")
+    if not isinstance(snapshot, dict):
+        raise HTTPException(status_code=400, detail="Invalid snapshot")
+    fleet_aggregator.ingest(host, snapshot)
+    return {"status": "ok"}
+
+@app.get("/api/fleet/summary")
+async def get_fleet_summary():
+    """플릿 요약 (히스토그램, Top-K 호스트/프로세스)"""
+    require_local_collector()
+    return fleet_aggregator.get_summary()
+
+@app.get("/api/fleet/hosts")
+async def get_fleet_hosts():
+    """플릿 호스트 목록"""
+    require_local_collector()
+    return {"hosts": fleet_aggregator.get_hosts()}
+
+@app.get("/api/fleet/hosts/{host}")
+async def get_fleet_host(host: str):
+    """개별 호스트 전체 스냅샷 (드릴다운)"""
+    require_local_collector()
+    snapshot = fleet_aggregator.get_host_snapshot(host)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="Host not found")
+    return snapshot
+
+@app.websocket("/ws/fleet")
+async def fleet_websocket_endpoint(websocket: WebSocket):
+    """플릿 요약 WebSocket 엔드포인트
+
+    클라이언트 메시지:
+        {"drilldown": ["host-a", "host-b"]}  # 전체 스냅샷을 받을 호스트 지정
+    """
+    await websocket.accept()
+    drilldown = set()
+
+    async def receive_loop():
+        while True:
+            message = await websocket.receive_json()
+            hosts = message.get("drilldown") if isinstance(message, dict) else None
+            if isinstance(hosts, list):
+                drilldown.clear()
+                drilldown.update(str(h) for h in hosts)
+
+    receiver = asyncio.create_task(receive_loop())
+    try:
+        while not receiver.done():
+            data = {"summary": fleet_aggregator.get_summary()}
+            if drilldown:
+                data["hosts"] = {
+                    host: fleet_aggregator.get_host_snapshot(host)
+                    for host in list(drilldown)
+                }
+            await websocket.send_json(data)
+            await asyncio.sleep(1)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        print(f"Fleet WebSocket error: {e}")
+    finally:
+        receiver.cancel()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -4,5 +4,11 @@ from .memory_monitor import MemoryMonitor
 from .disk_monitor import DiskMonitor
 from .network_monitor import NetworkMonitor
 from .process_monitor import ProcessMonitor
+from .burst_sampler import BurstSampler
+from .cgroup_monitor import CgroupMonitor
+from .process_lifecycle import ProcessLifecycleTracker
+from .interrupt_monitor import InterruptMonitor
+from .watch_monitor import WatchMonitor
+from .limits_monitor import KernelLimitsMonitor
 
-__all__ = ['CPUMonitor', 'GPUMonitor', 'MemoryMonitor', 'DiskMonitor', 'NetworkMonitor', 'ProcessMonitor']
+__all__ = ['CPUMonitor', 'GPUMonitor', 'MemoryMonitor', 'DiskMonitor', 'NetworkMonitor', 'ProcessMonitor', 'BurstSampler', 'CgroupMonitor', 'ProcessLifecycleTracker', 'InterruptMonitor', 'WatchMonitor', 'KernelLimitsMonitor']
@@ -0,0 +1,274 @@
+import os
+import threading
+import time
+from array import array
+
+import psutil
+
+# 디스크 섹터 크기 (/proc/diskstats 기준)
+SECTOR_SIZE = 512
+# /proc 파일 한 번에 읽는 크기 (더 크면 짧게 읽힐 때까지 이어 읽음)
+READ_SIZE = 1 << 16
+
+
+def _series_key(label: str) -> str:
+    """/proc/stat 의 'cpu' / 'cpuN' → 시계열 키 (오프라인 코어가 있어도 N 그대로 사용)"""
+    return "cpu" if label == "cpu" else f"core{label[3:]}"
+
+
+def cpu_series_keys() -> list:
+    """CPU 시계열 키 목록 ('cpu' + 온라인 코어별 'coreN')"""
+    if os.path.exists("/proc/stat"):
+        with open("/proc/stat", "r") as f:
+            return [_series_key(line.split(None, 1)[0]) for line in f if line.startswith("cpu")]
+    return ["cpu"] + [f"core{i}" for i in range(psutil.cpu_count(logical=True) or 1)]
+
+
+class _ProcSource:
+    """Linux /proc 카운터 직접 읽기 (파일을 열어두고 pread 로 재사용)"""
+
+    def __init__(self):
+        self.fds = {
+            "stat": os.open("/proc/stat", os.O_RDONLY),
+            "net": os.open("/proc/net/dev", os.O_RDONLY),
+            "disk": os.open("/proc/diskstats", os.O_RDONLY),
+        }
+        # 파티션/가상 장치(dm-*, md*, loop 등) 중복 집계를 막기 위해 device 링크가 있는 물리 디스크만 사용
+        self.disks = {
+            name for name in os.listdir("/sys/block")
+            if os.path.exists(f"/sys/block/{name}/device")
+        } if os.path.isdir("/sys/block") else set()
+
+    def _read(self, key: str) -> str:
+        """파일 전체 읽기 (인터페이스/디스크/코어가 많아 READ_SIZE 를 넘어도 잘리지 않도록)"""
+        fd = self.fds[key]
+        chunks = []
+        offset = 0
+        while True:
+            chunk = os.pread(fd, READ_SIZE, offset)
+            chunks.append(chunk)
+            offset += len(chunk)
+            if len(chunk) < READ_SIZE:
+                break
+        return b"".join(chunks).decode("ascii", "replace")
+
+    def read_cpu(self) -> dict:
+        """{시계열 키: (busy, total)} - 'cpu' 는 전체, 'coreN' 은 /proc/stat 의 cpuN"""
+        result = {}
+        for line in self._read("stat").splitlines():
+            if not line.startswith("cpu"):
+                break
+            fields = line.split()
+            values = [int(v) for v in fields[1:9]]
+            total = sum(values)
+            # idle + iowait 제외
+            result[_series_key(fields[0])] = (total - values[3] - values[4], total)
+        return result
+
+    def read_net(self) -> tuple:
+        """(수신 바이트, 송신 바이트) - lo 제외 합계"""
+        rx = tx = 0
+        for line in self._read("net").splitlines()[2:]:
+            name, _, data = line.partition(":")
+            if name.strip() == "lo":
+                continue
+            fields = data.split()
+            rx += int(fields[0])
+            tx += int(fields[8])
+        return rx, tx
+
+    def read_disk(self) -> tuple:
+        """(읽기 바이트, 쓰기 바이트) - 물리 디스크 합계"""
+        read = write = 0
+        for line in self._read("disk").splitlines():
+            fields = line.split()
+            if len(fields) < 10 or fields[2] not in self.disks:
+                continue
+            read += int(fields[5]) * SECTOR_SIZE
+            write += int(fields[9]) * SECTOR_SIZE
+        return read, write
+
+    def close(self):
+        for fd in self.fds.values():
+            os.close(fd)
+
+
+class _PsutilSource:
+    """/proc 가 없는 플랫폼용 psutil 대체 경로"""
+
+    def read_cpu(self) -> dict:
+        result = {}
+        keys = ["cpu"] + [f"core{i}" for i in range(psutil.cpu_count(logical=True) or 1)]
+        for key, times in zip(keys, [psutil.cpu_times()] + psutil.cpu_times(percpu=True)):
+            total = sum(times)
+            idle = times.idle + getattr(times, "iowait", 0)
+            result[key] = (total - idle, total)
+        return result
+
+    def read_net(self) -> tuple:
+        io = psutil.net_io_counters()
+        return io.bytes_recv, io.bytes_sent
+
+    def read_disk(self) -> tuple:
+        io = psutil.disk_io_counters()
+        return (io.read_bytes, io.write_bytes) if io else (0, 0)
+
+    def close(self):
+        pass
+
+
+class BurstSampler:
+    """고빈도(10~100 Hz) 단기 버스트 샘플링
+
+    CPU(전체/코어별), 네트워크, 디스크 카운터를 별도 스레드에서 읽어
+    미리 할당한 배열에 기록한다. 기존 1초 수집 루프와는 독립적으로 동작한다.
+    참고: /proc/stat 은 USER_HZ(보통 100) 단위로 갱신되므로 100 Hz 에서는
+    샘플별 CPU 값이 양자화된다.
+    """
+
+    MAX_HZ = 100
+    MAX_DURATION = 60.0
+    METRICS = ("cpu", "net", "disk")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.thread = None
+        self.running = False
+        self.session = 0
+        self.config = None
+        self.count = 0
+        self.times = array("d")
+        self.series = {}
+
+    def start(self, hz: float = 50, duration: float = 10, metrics=None) -> dict:
+        """버스트 시작 (이미 실행 중이거나 범위를 벗어나면 ValueError)"""
+        metrics = list(metrics or self.METRICS)
+        if not 1 <= hz <= self.MAX_HZ:
+            raise ValueError(f"hz must be between 1 and {self.MAX_HZ}")
+        if not 0 < duration <= self.MAX_DURATION:
+            raise ValueError(f"duration must be between 0 and {self.MAX_DURATION}")
+        unknown = [m for m in metrics if m not in self.METRICS]
+        if unknown:
+            raise ValueError(f"Unknown burst metrics: {unknown}")
+
+        with self.lock:
+            if self.running:
+                raise ValueError("Burst sampling already in progress")
+            capacity = int(hz * duration)
+
+            # 버퍼 사전 할당 (샘플링 중에는 할당 없음)
+            self.times = array("d", bytes(8 * capacity))
+            self.series = {}
+            if "cpu" in metrics:
+                for key in cpu_series_keys():
+                    self.series[key] = array("d", bytes(8 * capacity))
+            if "net" in metrics:
+                self.series["net_rx"] = array("d", bytes(8 * capacity))
+                self.series["net_tx"] = array("d", bytes(8 * capacity))
+            if "disk" in metrics:
+                self.series["disk_read"] = array("d", bytes(8 * capacity))
+                self.series["disk_write"] = array("d", bytes(8 * capacity))
+
+            self.count = 0
+            self.session += 1
+            self.config = {
+                "session": self.session,
+                "hz": hz,
+                "duration": duration,
+                "metrics": metrics,
+                "capacity": capacity,
+                "started": time.time()
+            }
+            self.running = True
+            self.thread = threading.Thread(target=self._loop, args=(hz, capacity, metrics), daemon=True)
+            self.thread.start()
+            return dict(self.config)
+
+    def stop(self):
+        """버스트 중지"""
+        self.running = False
+        if self.thread:
+            self.thread.join(timeout=2)
+
+    def _loop(self, hz: float, capacity: int, metrics: list):
+        """샘플링 루프"""
+        try:
+            source = _ProcSource() if os.path.exists("/proc/stat") else _PsutilSource()
+        except OSError:
+            source = _PsutilSource()
+
+        period = 1.0 / hz
+        series = self.series
+        try:
+            prev_cpu = source.read_cpu() if "cpu" in metrics else None
+            prev_net = source.read_net() if "net" in metrics else None
+            prev_disk = source.read_disk() if "disk" in metrics else None
+            start_wall = time.time()
+            start_perf = prev_t = time.perf_counter()
+            next_t = prev_t + period
+
+            for i in range(capacity):
+                if not self.running:
+                    break
+                delay = next_t - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                now = time.perf_counter()
+                dt = now - prev_t or period
+
+                if prev_cpu is not None:
+                    cpu = source.read_cpu()
+                    for key, (busy, total) in cpu.items():
+                        # 버스트 중 온라인이 된 코어는 시계열이 없으므로 건너뜀
+                        if key not in series or key not in prev_cpu:
+                            continue
+                        busy -= prev_cpu[key][0]
+                        total -= prev_cpu[key][1]
+                        series[key][i] = busy * 100.0 / total if total > 0 else 0.0
+                    prev_cpu = cpu
+                if prev_net is not None:
+                    net = source.read_net()
+                    series["net_rx"][i] = (net[0] - prev_net[0]) / dt
+                    series["net_tx"][i] = (net[1] - prev_net[1]) / dt
+                    prev_net = net
+                if prev_disk is not None:
+                    disk = source.read_disk()
+                    series["disk_read"][i] = (disk[0] - prev_disk[0]) / dt
+                    series["disk_write"][i] = (disk[1] - prev_disk[1]) / dt
+                    prev_disk = disk
+
+                self.times[i] = start_wall + (now - start_perf)
+                # 값 기록 후 카운트 공개 (읽는 쪽은 count 이전 구간만 사용)
+                self.count = i + 1
+
+                prev_t = now
+                next_t += period
+                # 지연된 경우 밀린 샘플을 몰아서 찍지 않음
+                if next_t < now:
+                    next_t = now + period
+        except Exception as e:
+            print(f"Burst sampler error: {e}")
+        finally:
+            source.close()
+            self.running = False
+
+    def status(self) -> dict:
+        """현재 버스트 상태"""
+        return {
+            "running": self.running,
+            "samples": self.count,
+            "config": self.config
+        }
+
+    def read_since(self, index: int) -> dict:
+        """index 이후 기록된 샘플을 배치 프레임으로 반환"""
+        count = self.count
+        frame = {
+            "session": self.session,
+            "start": index,
+            "end": count,
+            "running": self.running,
+            "t": self.times[index:count].tolist(),
+            "series": {key: values[index:count].tolist() for key, values in self.series.items()}
+        }
+        return frame
@@ -0,0 +1,236 @@
+import os
+import time
+
+import psutil
+
+
+def find_cgroup2_root() -> str:
+    """cgroup v2 마운트 위치 탐색 (통합 모드 또는 hybrid 모드의 unified)"""
+    for candidate in ("/sys/fs/cgroup", "/sys/fs/cgroup/unified"):
+        if os.path.exists(os.path.join(candidate, "cgroup.controllers")):
+            return candidate
+    return None
+
+
+def read_pid_cgroup(pid: int, procfs: str = "/proc") -> str:
+    """프로세스의 cgroup v2 경로 반환 (/proc/<pid>/cgroup 의 '0::' 항목)"""
+    try:
+        with open(f"{procfs}/{pid}/cgroup", "r") as f:
+            for line in f:
+                if line.startswith("0::"):
+                    return line[3:].strip() or "/"
+    except OSError:
+        pass
+    return None
+
+
+def display_name(path: str) -> str:
+    """cgroup 경로를 컨테이너/서비스 이름으로 축약 (예: docker-<id>.scope → <id 12자리>)"""
+    name = path.rstrip("/").rsplit("/", 1)[-1] or "/"
+    for prefix in ("docker-", "cri-containerd-", "crio-", "libpod-"):
+        if name.startswith(prefix):
+            return name[len(prefix):].split(".", 1)[0][:12]
+    return name
+
+
+class CgroupMonitor:
+    """cgroup v2 기반 컨테이너/서비스별 리소스 모니터링
+
+    트리는 디렉터리 mtime 이 바뀐 경우에만 다시 탐색하고,
+    매 주기에는 알려진 cgroup 의 cpu.stat, memory.current, memory.stat,
+    io.stat, cpu.pressure 만 읽어 이전 값과의 차이로 속도를 계산한다.
+    """
+
+    # memory.stat 에서 보고할 항목
+    MEMORY_STAT_KEYS = ("anon", "file", "kernel", "sock", "shmem", "pgmajfault")
+    # 변경 감지와 무관하게 전체 트리를 다시 탐색하는 주기 (초)
+    RESCAN_INTERVAL = 30.0
+
+    def __init__(self, root: str = None, max_depth: int = 4):
+        self.root = root if root is not None else find_cgroup2_root()
+        self.available = bool(self.root) and os.path.isdir(self.root)
+        self.max_depth = max_depth
+        self.cpu_count = psutil.cpu_count(logical=True) or 1
+        # 상대 경로 목록 및 탐색 시점의 디렉터리 mtime
+        self.cgroups = []
+        self.dir_mtimes = {}
+        self.descendants = None
+        self.scanned_at = 0.0
+        # 읽기 실패(삭제된 cgroup) 시 다음 주기에 재탐색
+        self.stale = False
+        # 상대 경로 → 이전 카운터
+        self.last = {}
+
+    def _scan(self):
+        """cgroup 트리 전체 탐색"""
+        cgroups = []
+        mtimes = {}
+        stack = [("", 0)]
+        while stack:
+            rel, depth = stack.pop()
+            path = os.path.join(self.root, rel)
+            try:
+                mtimes[rel] = os.stat(path).st_mtime_ns
+                entries = list(os.scandir(path))
+            except OSError:
+                continue
+            if rel:
+                cgroups.append(rel)
+            if depth >= self.max_depth:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((os.path.join(rel, entry.name), depth + 1))
+        self.cgroups = sorted(cgroups)
+        self.dir_mtimes = mtimes
+        self.descendants = self._descendants()
+        self.scanned_at = time.time()
+        self.stale = False
+        # 사라진 cgroup 의 이전 카운터 정리
+        self.last = {k: v for k, v in self.last.items() if k in mtimes}
+
+    def _descendants(self):
+        """루트 cgroup.stat 의 nr_descendants (트리 변경 감지용)"""
+        return self._read_kv("", "cgroup.stat").get("nr_descendants")
+
+    def _tree_changed(self) -> bool:
+        """하위 cgroup 생성/삭제 여부
+
+        nr_descendants, 부모 디렉터리 mtime 을 비교하고, 교체(생성+삭제)처럼
+        둘 다 놓칠 수 있는 경우를 위해 일정 주기마다 전체 재탐색한다.
+        """
+        if not self.dir_mtimes or self.stale:
+            return True
+        if time.time() - self.scanned_at > self.RESCAN_INTERVAL:
+            return True
+        if self._descendants() != self.descendants:
+            return True
+        for rel, mtime in self.dir_mtimes.items():
+            try:
+                if os.stat(os.path.join(self.root, rel)).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _read(self, rel: str, name: str):
+        try:
+            with open(os.path.join(self.root, rel, name), "r") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _read_kv(self, rel: str, name: str) -> dict:
+        """'key value' 형식 파일 파싱"""
+        content = self._read(rel, name)
+        result = {}
+        if content:
+            for line in content.splitlines():
+                key, _, value = line.partition(" ")
+                try:
+                    result[key] = int(value)
+                except ValueError:
+                    continue
+        return result
+
+    def _read_io(self, rel: str) -> tuple:
+        """io.stat 의 장치별 rbytes/wbytes 합계"""
+        content = self._read(rel, "io.stat")
+        rbytes = wbytes = 0
+        if content:
+            for line in content.splitlines():
+                for field in line.split()[1:]:
+                    key, _, value = field.partition("=")
+                    if key == "rbytes":
+                        rbytes += int(value)
+                    elif key == "wbytes":
+                        wbytes += int(value)
+        return rbytes, wbytes
+
+    def _read_pressure(self, rel: str):
+        """cpu.pressure 의 some avg10"""
+        content = self._read(rel, "cpu.pressure")
+        if content:
+            for line in content.splitlines():
+                if line.startswith("some "):
+                    for field in line.split()[1:]:
+                        key, _, value = field.partition("=")
+                        if key == "avg10":
+                            return float(value)
+        return None
+
+    def _sample(self, rel: str, now: float) -> dict:
+        """cgroup 하나의 현재 값과 이전 값 대비 속도 계산"""
+        cpu = self._read_kv(rel, "cpu.stat")
+        if not cpu:
+            return None
+        memory_current = self._read(rel, "memory.current")
+        memory_bytes = int(memory_current) if memory_current and memory_current.strip().isdigit() else None
+        memory_stat = self._read_kv(rel, "memory.stat")
+        rbytes, wbytes = self._read_io(rel)
+
+        current = {
+            "time": now,
+            "usage_usec": cpu.get("usage_usec", 0),
+            "nr_periods": cpu.get("nr_periods", 0),
+            "nr_throttled": cpu.get("nr_throttled", 0),
+            "throttled_usec": cpu.get("throttled_usec", 0),
+            "rbytes": rbytes,
+            "wbytes": wbytes
+        }
+        prev = self.last.get(rel)
+        self.last[rel] = current
+
+        result = {
+            "path": "/" + rel,
+            "name": display_name(rel),
+            "cpu_percent": 0.0,
+            "throttled_percent": 0.0,
+            "throttled_ms_per_sec": 0.0,
+            "memory_bytes": memory_bytes,
+            "memory_mb": round(memory_bytes / (1024 ** 2), 1) if memory_bytes is not None else None,
+            "memory_stat": {k: memory_stat[k] for k in self.MEMORY_STAT_KEYS if k in memory_stat},
+            "io_read_bps": 0.0,
+            "io_write_bps": 0.0,
+            "cpu_pressure": self._read_pressure(rel)
+        }
+        if prev:
+            dt = now - prev["time"] or 1
+            # 전체 CPU 대비 비율 (psutil.cpu_percent 와 동일 기준)
+            result["cpu_percent"] = round(
+                (current["usage_usec"] - prev["usage_usec"]) / (dt * 1e6 * self.cpu_count) * 100, 2)
+            periods = current["nr_periods"] - prev["nr_periods"]
+            if periods > 0:
+                result["throttled_percent"] = round(
+                    (current["nr_throttled"] - prev["nr_throttled"]) / periods * 100, 1)
+            result["throttled_ms_per_sec"] = round(
+                (current["throttled_usec"] - prev["throttled_usec"]) / dt / 1000, 2)
+            result["io_read_bps"] = round((rbytes - prev["rbytes"]) / dt, 1)
+            result["io_write_bps"] = round((wbytes - prev["wbytes"]) / dt, 1)
+        return result
+
+    def get_cgroups(self) -> list:
+        """모든 cgroup 의 사용량 반환"""
+        if not self.available:
+            return []
+        if self._tree_changed():
+            self._scan()
+        now = time.time()
+        results = []
+        for rel in self.cgroups:
+            sample = self._sample(rel, now)
+            if sample:
+                results.append(sample)
+            elif not os.path.isdir(os.path.join(self.root, rel)):
+                self.stale = True
+        return results
+
+    def get_all(self, limit: int = 10) -> dict:
+        """CPU 사용률 상위 cgroup 반환"""
+        cgroups = self.get_cgroups()
+        top = sorted(cgroups, key=lambda c: c["cpu_percent"], reverse=True)[:limit]
+        return {
+            "available": self.available,
+            "count": len(cgroups),
+            "cgroups": top
+        }
@@ -1,29 +1,168 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
 import psutil
 
+# 사용량 집계 대상이 아닌 가상/의사 파일시스템
+PSEUDO_FSTYPES = {
+    "proc", "sysfs", "devtmpfs", "devpts", "tmpfs", "cgroup", "cgroup2", "pstore", "bpf",
+    "tracefs", "debugfs", "securityfs", "configfs", "fusectl", "mqueue", "hugetlbfs",
+    "autofs", "binfmt_misc", "rpc_pipefs", "nsfs", "efivarfs", "ramfs", "squashfs",
+    "overlay", "aufs", "selinuxfs", "fuse.lxcfs", "fuse.gvfsd-fuse", "fuse.portal",
+}
+
+
 class DiskMonitor:
-    """디스크 사용량 모니터링"""
+    """디스크 사용량 모니터링
+    
+    마운트별 disk_usage 를 제한된 스레드 풀에서 병렬로 수행하고 마운트당 제한 시간을 둔다.
+    제한 시간을 넘긴 마운트(응답 없는 NFS/FUSE 등)는 차단기를 열어 일정 시간 건너뛰며,
+    이전 호출이 아직 끝나지 않은 마운트는 다시 제출하지 않는다. 멈춘 호출은 풀 스레드를
+    계속 점유하므로 현재 풀의 절반 이상이 멈추면 풀을 새로 만들고 (멈춘 스레드는 버림),
+    전체 멈춘 호출이 max_hung 개에 이르면 새 마운트를 더 제출하지 않는다.
+    """
+    
+    def __init__(self, max_workers: int = 8, timeout: float = 1.0,
+                 backoff: float = 30.0, max_backoff: float = 600.0, max_hung: int = 32):
+        self.timeout = timeout
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_workers = max_workers
+        self.max_hung = max_hung
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="disk-usage")
+        self.lock = threading.Lock()
+        # 멈춘 future → 제출된 풀
+        self.hung = {}
+        # 마운트 포인트 → 진행 중인 future / 차단기 상태 / 마지막 결과
+        self.inflight = {}
+        self.breakers = {}
+        self.last = {}
+        self.unavailable = []
+    
+    def _candidates(self) -> list:
+        """의사 파일시스템 제외, 같은 장치의 bind 마운트는 가장 짧은 경로 하나만"""
+        by_device = {}
+        for partition in psutil.disk_partitions():
+            if partition.fstype in PSEUDO_FSTYPES or not partition.fstype:
+                continue
+            key = partition.device if partition.device.startswith("/") or os.name == "nt" else None
+            if key is None:
+                key = (partition.device, partition.mountpoint)
+            current = by_device.get(key)
+            if current is None or len(partition.mountpoint) < len(current.mountpoint):
+                by_device[key] = partition
+        return list(by_device.values())
+    
+    @staticmethod
+    def _sample(mountpoint: str) -> tuple:
+        """워커 스레드에서 실행 - (st_dev, disk_usage)"""
+        return os.stat(mountpoint).st_dev, psutil.disk_usage(mountpoint)
+    
+    def _trip(self, mountpoint: str, now: float):
+        """차단기 열기 - 연속 실패 시 대기 시간을 두 배씩 늘림"""
+        failures, _ = self.breakers.get(mountpoint, (0, 0))
+        failures += 1
+        delay = min(self.backoff * (2 ** (failures - 1)), self.max_backoff)
+        self.breakers[mountpoint] = (failures, now + delay)
+    
+    def _ensure_pool(self):
+        """끝난 멈춤 호출 정리, 현재 풀의 절반 이상이 멈춰 있으면 새 풀로 교체"""
+        for future in [f for f in self.hung if f.done()]:
+            del self.hung[future]
+        stuck = sum(1 for pool in self.hung.values() if pool is self.pool)
+        if stuck >= max(self.max_workers // 2, 1):
+            old = self.pool
+            self.pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="disk-usage")
+            # 멈춘 스레드는 호출이 끝나면 스스로 종료됨
+            old.shutdown(wait=False)
     
     def get_partitions(self) -> list:
         """모든 디스크 파티션 정보 반환"""
-        partitions = []
+        with self.lock:
+            return self._get_partitions()
+    
+    def _get_partitions(self) -> list:
+        now = time.time()
+        candidates = self._candidates()
+        self._ensure_pool()
+        futures = {}
+        unavailable = []
         
-        for partition in psutil.disk_partitions():
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                partitions.append({
-                    "device": partition.device,
-                    "mountpoint": partition.mountpoint,
-                    "fstype": partition.fstype,
-                    "total": self._bytes_to_gb(usage.total),
-                    "used": self._bytes_to_gb(usage.used),
-                    "free": self._bytes_to_gb(usage.free),
-                    "percent": usage.percent
-                })
-            except PermissionError:
+        for partition in candidates:
+            mountpoint = partition.mountpoint
+            pending = self.inflight.get(mountpoint)
+            if pending is not None:
+                if not pending.done():
+                    # 이전 호출이 아직 멈춰 있음 - 재제출하지 않음
+                    unavailable.append({"mountpoint": mountpoint, "fstype": partition.fstype, "reason": "hung"})
+                    continue
+                del self.inflight[mountpoint]
+            breaker = self.breakers.get(mountpoint)
+            if breaker and breaker[1] > now:
+                unavailable.append({"mountpoint": mountpoint, "fstype": partition.fstype, "reason": "circuit_open",
+                                    "retry_in": round(breaker[1] - now, 1)})
                 continue
-            except Exception:
+            if len(self.hung) >= self.max_hung:
+                # 멈춘 호출이 너무 많음 - 스레드가 더 쌓이지 않도록 제출 보류
+                unavailable.append({"mountpoint": mountpoint, "fstype": partition.fstype, "reason": "hung_limit"})
                 continue
+            futures[self.pool.submit(self._sample, mountpoint)] = partition
+        
+        wait(futures, timeout=self.timeout)
+        
+        partitions = []
+        seen_devices = set()
+        for future, partition in futures.items():
+            mountpoint = partition.mountpoint
+            if not future.done():
+                if future.cancel():
+                    # 풀 대기열에서 시작도 못 함 - 이전 결과가 있으면 사용 (stale)
+                    usage = self.last.get(mountpoint)
+                    unavailable.append({"mountpoint": mountpoint, "fstype": partition.fstype, "reason": "queued",
+                                        "stale": usage is not None})
+                    if usage is None:
+                        continue
+                    st_dev, usage = usage
+                else:
+                    self.inflight[mountpoint] = future
+                    self.hung[future] = self.pool
+                    self._trip(mountpoint, now)
+                    unavailable.append({"mountpoint": mountpoint, "fstype": partition.fstype, "reason": "timeout"})
+                    continue
+            else:
+                try:
+                    st_dev, usage = future.result()
+                except PermissionError:
+                    continue
+                except Exception:
+                    self._trip(mountpoint, now)
+                    continue
+                self.breakers.pop(mountpoint, None)
+                self.last[mountpoint] = (st_dev, usage)
+            
+            # 장치 이름이 달라도 같은 파일시스템(bind 마운트 등)이면 한 번만
+            if st_dev in seen_devices:
+                continue
+            seen_devices.add(st_dev)
+            partitions.append({
+                "device": partition.device,
+                "mountpoint": mountpoint,
+                "fstype": partition.fstype,
+                "total": self._bytes_to_gb(usage.total),
+                "used": self._bytes_to_gb(usage.used),
+                "free": self._bytes_to_gb(usage.free),
+                "percent": usage.percent
+            })
+        
+        # 사라진 마운트 정리
+        mounted = {p.mountpoint for p in candidates}
+        for state in (self.last, self.breakers, self.inflight):
+            for mountpoint in [m for m in state if m not in mounted]:
+                del state[mountpoint]
         
+        self.unavailable = unavailable
         return partitions
     
     def get_io_counters(self) -> dict:
@@ -53,5 +192,6 @@ class DiskMonitor:
         """모든 디스크 정보 반환"""
         return {
             "partitions": self.get_partitions(),
-            "io": self.get_io_counters()
+            "io": self.get_io_counters(),
+            "unavailable": self.unavailable
         }
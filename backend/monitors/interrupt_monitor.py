@@ -0,0 +1,252 @@
+import os
+import time
+
+import numpy as np
+import psutil
+
+
+def _read(path: str) -> str:
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def parse_cpu_list(text: str) -> list:
+    """'0-3,8,10-11' → [0, 1, 2, 3, 8, 10, 11]"""
+    cpus = []
+    for part in (text or "").strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-")
+            cpus.extend(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def read_topology(sysfs: str = "/sys") -> dict:
+    """CPU 토폴로지 (소켓, 코어, NUMA 노드, SMT 형제) - 변하지 않으므로 시작 시 1회"""
+    base = f"{sysfs}/devices/system/cpu"
+    node_of = {}
+    node_base = f"{sysfs}/devices/system/node"
+    if os.path.isdir(node_base):
+        for name in os.listdir(node_base):
+            if name.startswith("node") and name[4:].isdigit():
+                for cpu in parse_cpu_list(_read(f"{node_base}/{name}/cpulist")):
+                    node_of[cpu] = int(name[4:])
+    cpus = []
+    for cpu in parse_cpu_list(_read(f"{base}/online")) or range(psutil.cpu_count() or 1):
+        topology = f"{base}/cpu{cpu}/topology"
+        socket = _read(f"{topology}/physical_package_id")
+        core = _read(f"{topology}/core_id")
+        siblings = _read(f"{topology}/thread_siblings_list") or _read(f"{topology}/core_cpus_list")
+        cpus.append({
+            "cpu": cpu,
+            "socket": int(socket) if socket else 0,
+            "core": int(core) if core else cpu,
+            "node": node_of.get(cpu, 0),
+            "siblings": parse_cpu_list(siblings) or [cpu]
+        })
+    return {
+        "sockets": len({c["socket"] for c in cpus}),
+        "numa_nodes": len({c["node"] for c in cpus}),
+        "cores": len({(c["socket"], c["core"]) for c in cpus}),
+        "threads_per_core": max((len(c["siblings"]) for c in cpus), default=1),
+        "cpus": cpus
+    }
+
+
+class CounterTable:
+    """/proc/interrupts, /proc/softirqs 형식 (행: 이름, 열: CPU) 파서
+
+    행 이름 목록을 인덱스로 한 번 만들어 두고, 이후에는 숫자 열만 읽어 int64 행렬로 변환한다.
+    행 구성이 바뀌면(장치 핫플러그 등) 인덱스를 다시 만든다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.columns = None
+        self.names = None
+        self.descriptions = None
+
+    def read(self):
+        """(카운터 행렬, 인덱스 재구성 여부) - 파일이 없으면 (None, False)"""
+        text = _read(self.path)
+        if not text:
+            return None, False
+        lines = text.splitlines()
+        header = lines[0].split()
+        width = len(header)
+        names = []
+        rows = []
+        descriptions = []
+        for line in lines[1:]:
+            parts = line.split()
+            if not parts:
+                continue
+            counts = parts[1:1 + width]
+            # ERR/MIS 등 CPU 별 값이 하나뿐인 행은 첫 열에만 기록
+            numeric = [int(v) for v in counts if v.isdigit()]
+            if len(numeric) < width:
+                numeric += [0] * (width - len(numeric))
+            names.append(parts[0].rstrip(":"))
+            rows.append(numeric)
+            descriptions.append(parts[1 + width:] if len(counts) == width else [])
+        rebuilt = names != self.names or header != self.columns
+        if rebuilt:
+            self.columns = header
+            self.names = names
+            self.descriptions = [" ".join(d) for d in descriptions]
+        return np.array(rows, dtype=np.int64).reshape(len(rows), width), rebuilt
+
+    @property
+    def cpus(self) -> list:
+        """열 → CPU 번호 (오프라인 CPU 는 열에서 빠짐)"""
+        return [int(c[3:]) for c in self.columns]
+
+
+class InterruptMonitor:
+    """IRQ / softirq / 컨텍스트 스위치 / 실행 큐 모니터링 (Linux)
+
+    코어별 IRQ·softirq 초당 발생 수는 이전 행렬과의 벡터 차분으로 계산하고,
+    코어 간 편중(최대/평균)과 NUMA 노드별 합계로 IRQ 불균형을 드러낸다.
+    """
+
+    def __init__(self, procfs: str = "/proc", sysfs: str = "/sys"):
+        self.procfs = procfs
+        self.available = os.path.exists(f"{procfs}/interrupts")
+        self.topology = read_topology(sysfs) if self.available else None
+        self.interrupts = CounterTable(f"{procfs}/interrupts")
+        self.softirqs = CounterTable(f"{procfs}/softirqs")
+        self.previous = {}
+        self.time = None
+
+    def _read_stat(self) -> dict:
+        """/proc/stat 의 ctxt, intr 합계, procs_running, procs_blocked"""
+        values = {}
+        for line in (_read(f"{self.procfs}/stat") or "").splitlines():
+            key, _, rest = line.partition(" ")
+            if key in ("ctxt", "intr", "procs_running", "procs_blocked"):
+                values[key] = int(rest.split(None, 1)[0])
+        return values
+
+    def _read_loadavg(self) -> dict:
+        parts = (_read(f"{self.procfs}/loadavg") or "").split()
+        if len(parts) < 4:
+            return {}
+        running, total = parts[3].split("/")
+        return {"load1": float(parts[0]), "load5": float(parts[1]), "load15": float(parts[2]),
+                "runnable_threads": int(running), "total_threads": int(total)}
+
+    def _rates(self, key: str, matrix, rebuilt: bool, elapsed: float):
+        """이전 행렬과의 차분 / 경과 시간 (카운터 리셋은 0 으로)"""
+        previous = self.previous.get(key)
+        self.previous[key] = matrix
+        if matrix is None or previous is None or rebuilt or previous.shape != matrix.shape or not elapsed:
+            return None
+        return np.clip(matrix - previous, 0, None) / elapsed
+
+    @staticmethod
+    def _imbalance(per_core) -> float:
+        """코어별 비율의 최대/평균 (1.0 = 균등, 코어 수 = 한 코어 집중)"""
+        mean = float(per_core.mean()) if per_core.size else 0.0
+        return round(float(per_core.max()) / mean, 2) if mean > 0 else None
+
+    def get_all(self, limit: int = 10) -> dict:
+        """코어별 IRQ/softirq 비율, 상위 IRQ, 불균형, 컨텍스트 스위치, 실행 큐"""
+        if not self.available:
+            return {"available": False}
+        now = time.time()
+        elapsed = now - self.time if self.time else None
+        self.time = now
+
+        irq_matrix, irq_rebuilt = self.interrupts.read()
+        soft_matrix, soft_rebuilt = self.softirqs.read()
+        irq = self._rates("irq", irq_matrix, irq_rebuilt, elapsed)
+        soft = self._rates("softirq", soft_matrix, soft_rebuilt, elapsed)
+
+        stat = self._read_stat()
+        previous_stat = self.previous.get("stat")
+        self.previous["stat"] = stat
+
+        def stat_rate(key):
+            if not elapsed or not previous_stat or key not in stat or key not in previous_stat:
+                return None
+            return round(max(stat[key] - previous_stat[key], 0) / elapsed, 1)
+
+        result = {
+            "available": True,
+            "interval": round(elapsed, 2) if elapsed else None,
+            "topology": {k: v for k, v in self.topology.items() if k != "cpus"},
+            "context_switches_per_sec": stat_rate("ctxt"),
+            "interrupts_per_sec": stat_rate("intr"),
+            "procs_running": stat.get("procs_running"),
+            "procs_blocked": stat.get("procs_blocked"),
+            "load": self._read_loadavg(),
+            "per_core": [],
+            "numa": [],
+            "softirq": {},
+            "top_irqs": [],
+            "imbalance": {}
+        }
+        cpu_count = len(self.topology["cpus"]) or 1
+        result["run_queue_per_cpu"] = round(stat["procs_running"] / cpu_count, 2) if "procs_running" in stat else None
+        if irq is None and soft is None:
+            # 첫 주기 (기준값만 저장)
+            return result
+
+        columns = self.interrupts.cpus if irq is not None else self.softirqs.cpus
+        irq_per_core = irq.sum(axis=0) if irq is not None else np.zeros(len(columns))
+        soft_names = self.softirqs.names or []
+        soft_per_core = soft.sum(axis=0) if soft is not None else np.zeros(len(columns))
+
+        def soft_row(name):
+            if soft is None or name not in soft_names:
+                return np.zeros(len(columns))
+            return soft[soft_names.index(name)]
+
+        net_rx = soft_row("NET_RX")
+        net_tx = soft_row("NET_TX")
+        cpu_info = {c["cpu"]: c for c in self.topology["cpus"]}
+        same_width = len(soft_per_core) == len(columns)
+        for i, cpu in enumerate(columns):
+            result["per_core"].append({
+                "cpu": cpu,
+                "node": cpu_info.get(cpu, {}).get("node", 0),
+                "irq_rate": round(float(irq_per_core[i]), 1),
+                "softirq_rate": round(float(soft_per_core[i]), 1) if same_width else None,
+                "net_rx_rate": round(float(net_rx[i]), 1) if same_width else None,
+                "net_tx_rate": round(float(net_tx[i]), 1) if same_width else None
+            })
+
+        nodes = {}
+        for core in result["per_core"]:
+            node = nodes.setdefault(core["node"], {"node": core["node"], "irq_rate": 0.0, "softirq_rate": 0.0})
+            node["irq_rate"] += core["irq_rate"]
+            node["softirq_rate"] += core["softirq_rate"] or 0.0
+        result["numa"] = [{k: round(v, 1) if isinstance(v, float) else v for k, v in n.items()}
+                          for n in sorted(nodes.values(), key=lambda n: n["node"])]
+
+        if soft is not None:
+            result["softirq"] = {name: round(float(rate), 1) for name, rate in zip(soft_names, soft.sum(axis=1))}
+            result["imbalance"]["net_rx"] = self._imbalance(net_rx)
+        if irq is not None:
+            totals = irq.sum(axis=1)
+            result["imbalance"]["irq"] = self._imbalance(irq_per_core)
+            for row in np.argsort(totals)[::-1][:limit]:
+                if totals[row] <= 0:
+                    break
+                per_core = irq[row]
+                busiest = int(per_core.argmax())
+                result["top_irqs"].append({
+                    "irq": self.interrupts.names[row],
+                    "description": self.interrupts.descriptions[row],
+                    "rate": round(float(totals[row]), 1),
+                    "busiest_cpu": columns[busiest],
+                    "busiest_share": round(float(per_core[busiest] / totals[row]) * 100, 1),
+                    "cpus_used": int((per_core > 0).sum())
+                })
+        return result
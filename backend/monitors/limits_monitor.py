@@ -0,0 +1,307 @@
+import os
+import time
+from collections import Counter, deque
+
+import psutil
+
+from .disk_monitor import PSEUDO_FSTYPES
+
+# statvfs 가 멈출 수 있는 네트워크/FUSE 파일시스템은 inode 검사에서 제외 (DiskMonitor 가 제한 시간으로 처리)
+REMOTE_FSTYPES = {"nfs", "nfs4", "cifs", "smbfs", "smb3", "9p", "ceph", "glusterfs", "afs", "sshfs"}
+
+# TCP 상태 코드 (/proc/net/tcp st 열)
+TCP_TIME_WAIT = "06"
+TCP_LISTEN = "0A"
+
+
+def _read(path: str) -> str:
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _read_int(path: str):
+    text = _read(path)
+    try:
+        return int(text.split()[0]) if text else None
+    except ValueError:
+        return None
+
+
+def _hex_address(value: str) -> str:
+    """/proc/net/tcp 주소 (리틀 엔디언 16진수) → 문자열"""
+    try:
+        raw = bytes.fromhex(value)
+    except ValueError:
+        return value
+    if len(raw) == 4:
+        return ".".join(str(b) for b in raw[::-1])
+    # IPv6: 4바이트 단위 리틀 엔디언
+    words = b"".join(raw[i:i + 4][::-1] for i in range(0, 16, 4))
+    if words[:12] == b"\0" * 10 + b"\xff\xff":
+        return ".".join(str(b) for b in words[12:])
+    return ":".join(words[i:i + 2].hex() for i in range(0, 16, 2))
+
+
+class GrowthEstimator:
+    """최근 window 초 동안의 (시각, 사용량) 최소제곱 기울기로 고갈 예상 시간 추정"""
+
+    def __init__(self, window: float = 600.0, max_points: int = 240):
+        self.window = window
+        self.points = deque(maxlen=max_points)
+
+    def add(self, now: float, value: float):
+        self.points.append((now, value))
+        while self.points and now - self.points[0][0] > self.window:
+            self.points.popleft()
+
+    def slope(self):
+        """초당 증가량 (점이 3개 미만이거나 30초 미만이면 None)"""
+        if len(self.points) < 3 or self.points[-1][0] - self.points[0][0] < 30:
+            return None
+        n = len(self.points)
+        mean_t = sum(t for t, _ in self.points) / n
+        mean_v = sum(v for _, v in self.points) / n
+        var = sum((t - mean_t) ** 2 for t, _ in self.points)
+        if var == 0:
+            return None
+        return sum((t - mean_t) * (v - mean_v) for t, v in self.points) / var
+
+    def time_to_exhaustion(self, used: float, limit: float):
+        """현재 증가 추세가 이어질 때 limit 도달까지 남은 초 (감소/정체 시 None)"""
+        slope = self.slope()
+        if slope is None or slope <= 0 or limit is None:
+            return None
+        return max(limit - used, 0) / slope
+
+
+class KernelLimitsMonitor:
+    """커널 자원 고갈 모니터링 (Linux)
+
+    파일 핸들(file-nr), PID/스레드(pid_max, threads-max), conntrack, 임시 포트, inode,
+    프로세스별 열린 fd 를 한도 대비로 읽고, 자원별 최근 증가율로 고갈 예상 시간을 계산한다.
+    모두 /proc 카운터나 statvfs 한 번으로 읽으며, 프로세스별 fd 수는 /proc/<pid>/fd 의
+    st_size (Linux 6.2+) 를 사용하고 지원하지 않는 커널에서만 디렉터리를 나열한다.
+    """
+
+    def __init__(self, procfs: str = "/proc", window: float = 600.0, fd_top: int = 10):
+        self.procfs = procfs
+        self.available = psutil.LINUX and os.path.exists(f"{procfs}/sys/fs/file-nr")
+        self.window = window
+        self.fd_top = fd_top
+        self.growth = {}
+        self.fd_stat_size = None
+
+    def _estimate(self, key: str, used, limit, now: float) -> dict:
+        """자원 항목 (사용량, 한도, 비율, 여유분, 분당 증가량, 고갈 예상 초)"""
+        if used is None or not limit:
+            return None
+        estimator = self.growth.get(key)
+        if estimator is None:
+            estimator = self.growth[key] = GrowthEstimator(self.window)
+        estimator.add(now, used)
+        slope = estimator.slope()
+        tte = estimator.time_to_exhaustion(used, limit)
+        return {
+            "resource": key,
+            "used": used,
+            "limit": limit,
+            "percent": round(used / limit * 100, 2),
+            "headroom": limit - used,
+            "rate_per_min": round(slope * 60, 2) if slope is not None else None,
+            "time_to_exhaustion": round(tte) if tte is not None else None
+        }
+
+    def _file_handles(self):
+        """/proc/sys/fs/file-nr: 할당된 핸들, 미사용(할당됐지만 비어 있음), 최대"""
+        parts = (_read(f"{self.procfs}/sys/fs/file-nr") or "").split()
+        if len(parts) < 3:
+            return None, None
+        return int(parts[0]) - int(parts[1]), int(parts[2])
+
+    def _tasks(self):
+        """(프로세스 수, 스레드 수) - 스레드도 PID 공간을 사용하므로 pid_max 는 스레드 수와 비교"""
+        loadavg = (_read(f"{self.procfs}/loadavg") or "").split()
+        threads = int(loadavg[3].split("/")[1]) if len(loadavg) > 3 else None
+        processes = sum(1 for entry in os.scandir(self.procfs) if entry.name.isdigit())
+        return processes, threads
+
+    def _ephemeral_ports(self) -> dict:
+        """임시 포트 범위 안의 로컬 포트 사용량 (TCP/UDP, IPv4/IPv6 소켓 테이블)
+
+        connect() 고갈은 같은 목적지(주소:포트) 로 가는 연결이 범위를 다 쓸 때 생기므로
+        목적지별 사용량도 함께 계산한다.
+        """
+        port_range = (_read(f"{self.procfs}/sys/net/ipv4/ip_local_port_range") or "").split()
+        if len(port_range) != 2:
+            return None
+        low, high = int(port_range[0]), int(port_range[1])
+        size = high - low + 1
+        reserved = set()
+        for part in (_read(f"{self.procfs}/sys/net/ipv4/ip_local_reserved_ports") or "").strip().split(","):
+            if "-" in part:
+                start, end = part.split("-")
+                reserved.update(range(int(start), int(end) + 1))
+            elif part:
+                reserved.add(int(part))
+        size -= sum(1 for port in reserved if low <= port <= high)
+
+        sockets = []
+        listening = set()
+        for table in ("tcp", "tcp6", "udp", "udp6"):
+            text = _read(f"{self.procfs}/net/{table}")
+            if not text:
+                continue
+            tcp = table.startswith("tcp")
+            for line in text.splitlines()[1:]:
+                fields = line.split(None, 4)
+                if len(fields) < 4:
+                    continue
+                port = int(fields[1].rpartition(":")[2], 16)
+                if not low <= port <= high:
+                    continue
+                if tcp and fields[3] == TCP_LISTEN:
+                    listening.add(port)
+                    continue
+                sockets.append((port, fields[2], fields[3], tcp))
+
+        local_ports = set()
+        destinations = Counter()
+        time_wait = 0
+        for port, remote, state, tcp in sockets:
+            # 범위 안의 포트로 listen 중인 서버가 accept 한 연결은 임시 포트를 쓰지 않음
+            if port in listening:
+                continue
+            local_ports.add(port)
+            if tcp:
+                destinations[remote] += 1
+                if state == TCP_TIME_WAIT:
+                    time_wait += 1
+        top = []
+        for remote, count in destinations.most_common(5):
+            address, _, port = remote.rpartition(":")
+            top.append({"destination": f"{_hex_address(address)}:{int(port, 16)}", "ports": count,
+                        "percent": round(count / size * 100, 2) if size > 0 else None})
+        return {
+            "range": [low, high],
+            "size": size,
+            "in_use": len(local_ports),
+            "time_wait": time_wait,
+            "top_destinations": top,
+            "busiest_destination": top[0]["ports"] if top else 0
+        }
+
+    def _inodes(self) -> list:
+        """로컬 파일시스템별 inode 사용량 (statvfs, inode 개념이 없는 파일시스템 제외)"""
+        results = []
+        seen = set()
+        for part in psutil.disk_partitions(all=False):
+            fstype = part.fstype.lower()
+            if fstype in PSEUDO_FSTYPES or fstype in REMOTE_FSTYPES or fstype.startswith("fuse"):
+                continue
+            if part.device in seen:
+                continue
+            seen.add(part.device)
+            try:
+                st = os.statvfs(part.mountpoint)
+            except OSError:
+                continue
+            if st.f_files == 0:
+                continue
+            results.append((part.mountpoint, st.f_files - st.f_ffree, st.f_files))
+        return results
+
+    def _process_fds(self) -> list:
+        """열린 fd 수 상위 프로세스와 각자의 RLIMIT_NOFILE (soft) 대비 비율"""
+        counts = []
+        for entry in os.scandir(self.procfs):
+            if not entry.name.isdigit():
+                continue
+            try:
+                if self.fd_stat_size is not False:
+                    count = os.stat(f"{entry.path}/fd").st_size
+                    if self.fd_stat_size is None:
+                        # 구버전 커널은 st_size 가 0 (열린 fd 가 없는 프로세스는 없으므로 판별 가능)
+                        self.fd_stat_size = count > 0
+                        if not self.fd_stat_size:
+                            count = len(os.listdir(f"{entry.path}/fd"))
+                else:
+                    count = len(os.listdir(f"{entry.path}/fd"))
+            except OSError:
+                # 권한 없음 / 측정 중 종료
+                continue
+            counts.append((count, int(entry.name)))
+        counts.sort(reverse=True)
+        top = []
+        for count, pid in counts[:self.fd_top]:
+            limit = None
+            for line in (_read(f"{self.procfs}/{pid}/limits") or "").splitlines():
+                if line.startswith("Max open files"):
+                    value = line.split()[3]
+                    limit = int(value) if value.isdigit() else None
+                    break
+            name = (_read(f"{self.procfs}/{pid}/comm") or "").strip()
+            top.append({
+                "pid": pid,
+                "name": name,
+                "fds": count,
+                "limit": limit,
+                "percent": round(count / limit * 100, 2) if limit else None
+            })
+        return top
+
+    def get_all(self) -> dict:
+        """자원별 사용량/한도/고갈 예상 시간, 임시 포트, 상위 fd 프로세스"""
+        if not self.available:
+            return {"available": False}
+        now = time.time()
+        resources = []
+
+        def add(key, used, limit):
+            item = self._estimate(key, used, limit, now)
+            if item:
+                resources.append(item)
+
+        used, limit = self._file_handles()
+        add("file_handles", used, limit)
+
+        processes, threads = self._tasks()
+        pid_max = _read_int(f"{self.procfs}/sys/kernel/pid_max")
+        add("pids", threads, pid_max)
+        add("threads", threads, _read_int(f"{self.procfs}/sys/kernel/threads-max"))
+
+        add("conntrack", _read_int(f"{self.procfs}/sys/net/netfilter/nf_conntrack_count"),
+            _read_int(f"{self.procfs}/sys/net/netfilter/nf_conntrack_max"))
+
+        ports = self._ephemeral_ports()
+        if ports:
+            add("ephemeral_ports", ports["in_use"], ports["size"])
+            # 단일 목적지로의 연결이 가장 먼저 고갈됨
+            add("ephemeral_ports_per_destination", ports["busiest_destination"], ports["size"])
+
+        for mountpoint, used, total in self._inodes():
+            add(f"inodes:{mountpoint}", used, total)
+
+        fd_processes = self._process_fds()
+        for process in fd_processes[:3]:
+            if process["limit"]:
+                add(f"process_fds:{process['pid']}", process["fds"], process["limit"])
+
+        # 사라진 자원(종료된 프로세스, 언마운트) 의 추정기 정리
+        current = {r["resource"] for r in resources}
+        for key in [k for k in self.growth if k not in current]:
+            del self.growth[key]
+
+        return {
+            "available": True,
+            "processes": processes,
+            "resources": resources,
+            "ephemeral_ports": ports,
+            "top_fd_processes": fd_processes,
+            # 고갈 예상 시간이 있는 자원 중 가장 임박한 것
+            "soonest": min((r for r in resources if r["time_to_exhaustion"] is not None),
+                           key=lambda r: r["time_to_exhaustion"], default=None)
+        }
+
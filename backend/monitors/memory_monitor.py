@@ -1,31 +1,183 @@
 import psutil
+import time
+
+# 속도(초당)로 보고할 /proc/vmstat 카운터
+VMSTAT_RATE_KEYS = {
+    "pgfault": "page_faults",
+    "pgmajfault": "major_faults",
+    "pswpin": "swap_in_pages",
+    "pswpout": "swap_out_pages",
+    "pgscan_kswapd": "scan_kswapd",
+    "pgscan_direct": "scan_direct",
+    "pgsteal_kswapd": "steal_kswapd",
+    "pgsteal_direct": "steal_direct",
+    "compact_stall": "compact_stall",
+    "oom_kill": "oom_kill",
+}
+
+# 보고할 /proc/meminfo 항목 (kB)
+MEMINFO_KEYS = (
+    "Dirty", "Writeback", "AnonPages", "Cached", "Shmem", "Slab", "SReclaimable",
+    "SUnreclaim", "PageTables", "Committed_AS", "CommitLimit", "AnonHugePages"
+)
 
 class MemoryMonitor:
     """메모리 사용량 모니터링"""
     
-    def get_virtual_memory(self) -> dict:
-        """가상 메모리(RAM) 정보 반환"""
-        mem = psutil.virtual_memory()
+    def __init__(self):
+        # 속도 계산용 이전 카운터
+        self.last_vmstat = None
+        self.last_psi = None
+        self.last_time = None
+    
+    def get_virtual_memory(self, meminfo: dict = None) -> dict:
+        """가상 메모리(RAM) 정보 반환 (meminfo 지정 시 psutil 과 같은 계산식으로 재사용)"""
+        if meminfo and "MemTotal" in meminfo:
+            total = meminfo["MemTotal"]
+            free = meminfo.get("MemFree", 0)
+            buffers = meminfo.get("Buffers", 0)
+            cached = meminfo.get("Cached", 0) + meminfo.get("SReclaimable", 0)
+            available = meminfo.get("MemAvailable", free + buffers + cached)
+            # requirements 의 psutil 5.9.x 와 같은 used (버퍼/캐시 제외, 음수면 total - free)
+            used = total - free - buffers - cached
+            if used < 0:
+                used = total - free
+            percent = round((total - available) / total * 100, 1) if total else 0.0
+        else:
+            mem = psutil.virtual_memory()
+            total, available, used, free, percent = mem.total, mem.available, mem.used, mem.free, mem.percent
         
         return {
-            "total": self._bytes_to_gb(mem.total),
-            "available": self._bytes_to_gb(mem.available),
-            "used": self._bytes_to_gb(mem.used),
-            "free": self._bytes_to_gb(mem.free),
-            "percent": mem.percent,
-            "total_bytes": mem.total,
-            "used_bytes": mem.used
+            "total": self._bytes_to_gb(total),
+            "available": self._bytes_to_gb(available),
+            "used": self._bytes_to_gb(used),
+            "free": self._bytes_to_gb(free),
+            "percent": percent,
+            "total_bytes": total,
+            "used_bytes": used
         }
     
-    def get_swap_memory(self) -> dict:
+    def get_swap_memory(self, meminfo: dict = None) -> dict:
         """스왑 메모리 정보 반환"""
-        swap = psutil.swap_memory()
+        if meminfo and "SwapTotal" in meminfo:
+            total = meminfo["SwapTotal"]
+            free = meminfo.get("SwapFree", 0)
+            used = total - free
+            percent = round(used / total * 100, 1) if total else 0.0
+        else:
+            swap = psutil.swap_memory()
+            total, used, free, percent = swap.total, swap.used, swap.free, swap.percent
+        
+        return {
+            "total": self._bytes_to_gb(total),
+            "used": self._bytes_to_gb(used),
+            "free": self._bytes_to_gb(free),
+            "percent": percent
+        }
+    
+    def _read_proc(self, path: str):
+        """/proc 파일 읽기 (없으면 None)"""
+        try:
+            with open(path, "r") as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _read_psi(self) -> dict:
+        """/proc/pressure/{memory,cpu,io} 파싱 (PSI 미지원 커널이면 빈 dict)"""
+        psi = {}
+        for resource in ("memory", "cpu", "io"):
+            content = self._read_proc(f"/proc/pressure/{resource}")
+            if content is None:
+                continue
+            psi[resource] = {}
+            for line in content.splitlines():
+                kind, _, fields = line.partition(" ")
+                values = dict(field.split("=") for field in fields.split())
+                psi[resource][kind] = {
+                    "avg10": float(values["avg10"]),
+                    "avg60": float(values["avg60"]),
+                    "avg300": float(values["avg300"]),
+                    "total": int(values["total"])
+                }
+        return psi
+    
+    def _read_vmstat(self) -> dict:
+        """/proc/vmstat 에서 필요한 카운터만 추출"""
+        content = self._read_proc("/proc/vmstat")
+        if content is None:
+            return {}
+        counters = {}
+        allocstall = 0
+        for line in content.splitlines():
+            key, _, value = line.partition(" ")
+            if key in VMSTAT_RATE_KEYS:
+                counters[key] = int(value)
+            elif key.startswith("allocstall"):
+                allocstall += int(value)
+        counters["allocstall"] = allocstall
+        return counters
+    
+    def _read_meminfo(self) -> dict:
+        """/proc/meminfo 전체 (바이트, 없으면 빈 dict)"""
+        content = self._read_proc("/proc/meminfo")
+        if content is None:
+            return {}
+        meminfo = {}
+        for line in content.splitlines():
+            key, _, value = line.partition(":")
+            fields = value.split()
+            if fields and fields[0].isdigit():
+                # HugePages_* 는 단위 없는 개수
+                meminfo[key] = int(fields[0]) * 1024 if len(fields) > 1 else int(fields[0])
+        return meminfo
+    
+    def get_pressure(self, meminfo: dict = None) -> dict:
+        """메모리 압력/회수 지표 반환 (Linux 전용)
+        
+        PSI 평균값과 함께, 이전 호출 대비 PSI 누적 stall 시간 및
+        /proc/vmstat 카운터의 초당 변화량을 계산한다.
+        """
+        psi = self._read_psi()
+        vmstat = self._read_vmstat()
+        current_time = time.time()
+        
+        if not psi and not vmstat:
+            return {"available": False}
+        
+        rates = {}
+        if self.last_time is not None:
+            time_diff = current_time - self.last_time
+            if time_diff == 0:
+                time_diff = 1
+            
+            # vmstat 초당 변화량
+            if self.last_vmstat:
+                for key, name in list(VMSTAT_RATE_KEYS.items()) + [("allocstall", "allocstall")]:
+                    if key in vmstat and key in self.last_vmstat:
+                        # 카운터 리셋 시 음수 속도 방지
+                        rates[name] = round(max(vmstat[key] - self.last_vmstat[key], 0) / time_diff, 1)
+            
+            # PSI total(µs) 변화량 → 구간 stall 비율(%)
+            if self.last_psi:
+                for resource, kinds in psi.items():
+                    for kind, values in kinds.items():
+                        prev = self.last_psi.get(resource, {}).get(kind)
+                        if prev:
+                            stall = (values["total"] - prev["total"]) / (time_diff * 1e6) * 100
+                            values["stall_percent"] = round(min(max(stall, 0.0), 100.0), 2)
+        
+        self.last_vmstat = vmstat
+        self.last_psi = {r: {k: {"total": v["total"]} for k, v in kinds.items()} for r, kinds in psi.items()}
+        self.last_time = current_time
         
+        if meminfo is None:
+            meminfo = self._read_meminfo()
         return {
-            "total": self._bytes_to_gb(swap.total),
-            "used": self._bytes_to_gb(swap.used),
-            "free": self._bytes_to_gb(swap.free),
-            "percent": swap.percent
+            "available": True,
+            "psi": psi,
+            "reclaim": rates,
+            "details": {key: round(meminfo[key] / (1024 ** 2), 1) for key in MEMINFO_KEYS if key in meminfo}
         }
     
     def _bytes_to_gb(self, bytes_value: int) -> float:
@@ -33,8 +185,10 @@ class MemoryMonitor:
         return round(bytes_value / (1024 ** 3), 2)
     
     def get_all(self) -> dict:
-        """모든 메모리 정보 반환"""
+        """모든 메모리 정보 반환 (Linux 는 /proc/meminfo 를 한 번만 읽어 RAM/스왑/상세 항목에 공유)"""
+        meminfo = self._read_meminfo() if psutil.LINUX else {}
         return {
-            "virtual": self.get_virtual_memory(),
-            "swap": self.get_swap_memory()
+            "virtual": self.get_virtual_memory(meminfo),
+            "swap": self.get_swap_memory(meminfo),
+            "pressure": self.get_pressure(meminfo)
         }
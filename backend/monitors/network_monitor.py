@@ -113,11 +113,13 @@ class NetworkMonitor:
             "by_status": status_count
         }
     
-    def get_all(self) -> dict:
-        """모든 네트워크 정보 반환"""
-        return {
+    def get_all(self, include_connections: bool = True) -> dict:
+        """모든 네트워크 정보 반환 (연결 목록 조회는 비용이 커서 선택 가능)"""
+        result = {
             "interfaces": self.get_interfaces(),
             "io": self.get_io_counters(),
-            "speed": self.get_speed(),
-            "connections": self.get_connections()
+            "speed": self.get_speed()
         }
+        if include_connections:
+            result["connections"] = self.get_connections()
+        return result
@@ -0,0 +1,117 @@
+import time
+from collections import deque
+
+import psutil
+
+
+def read_proc_stat_counters(procfs: str = "/proc") -> dict:
+    """/proc/stat 의 processes(부팅 후 fork 수), procs_running, procs_blocked"""
+    counters = {}
+    try:
+        with open(f"{procfs}/stat", "r") as f:
+            for line in f:
+                if line.startswith(("processes ", "procs_running ", "procs_blocked ")):
+                    key, value = line.split()[:2]
+                    counters[key] = int(value)
+    except (OSError, ValueError):
+        pass
+    return counters
+
+
+class ProcessLifecycleTracker:
+    """프로세스 생성/종료 추적
+
+    ProcessMonitor 가 만든 프로세스 표를 주기마다 받아 (pid, 생성 시각) 집합을 비교한다.
+    샘플 사이에 생겼다 사라진 단명 프로세스는 /proc/stat 의 fork 카운터와 관측된 생성 수의
+    차이로 추정하고, 종료된 자식이 쓴 CPU 는 부모의 cutime/cstime 증가분으로 귀속한다 (Linux).
+    """
+
+    def __init__(self, window: float = 60.0, max_events: int = 10000):
+        # 이름별 생성/종료 집계 구간 (초)
+        self.window = window
+        self.events = deque(maxlen=max_events)
+        self.known = {}
+        self.children_cpu = {}
+        self.forks = None
+        self.time = None
+        self.last = None
+        self.linux = psutil.LINUX
+
+    def update(self, rows: list, children_times: dict = None, now: float = None) -> dict:
+        """이번 주기 프로세스 표로 갱신 (children_times: {pid: 종료된 자식 누적 CPU 초})"""
+        now = time.time() if now is None else now
+        current = {(r["pid"], r["create_time"]): r["name"] for r in rows}
+        counters = read_proc_stat_counters(psutil.PROCFS_PATH) if self.linux else {}
+
+        if self.time is None:
+            # 첫 주기는 기준값만 저장
+            self.known = current
+            self.children_cpu = dict(children_times or {})
+            self.forks = counters.get("processes")
+            self.time = now
+            return self.summary(counters)
+
+        elapsed = max(now - self.time, 1e-6)
+        spawned = [key for key in current if key not in self.known]
+        exited = [key for key in self.known if key not in current]
+        for key in spawned:
+            self.events.append((now, current[key], 1))
+        for key in exited:
+            self.events.append((now, self.known[key], -1))
+
+        forks = counters.get("processes")
+        fork_delta = forks - self.forks if forks is not None and self.forks is not None else None
+
+        # 부모별 종료된 자식 CPU 증가분 (같은 pid 가 계속 살아 있는 경우만)
+        names = {r["pid"]: r["name"] for r in rows}
+        reaped = []
+        if children_times:
+            for pid, total in children_times.items():
+                previous = self.children_cpu.get(pid)
+                if previous is not None and total > previous:
+                    reaped.append((pid, total - previous))
+
+        self.last = {
+            "interval": round(elapsed, 2),
+            "spawned": len(spawned),
+            "exited": len(exited),
+            "spawn_rate": round(len(spawned) / elapsed, 2),
+            "exit_rate": round(len(exited) / elapsed, 2),
+            "forks": fork_delta,
+            "fork_rate": round(fork_delta / elapsed, 2) if fork_delta is not None else None,
+            # fork 되었지만 어느 샘플에도 보이지 않은 프로세스 (단명 프로세스 추정치, 스레드 생성 포함)
+            "unseen": max(fork_delta - len(spawned), 0) if fork_delta is not None else None,
+            "children_cpu": [
+                {"pid": pid, "name": names.get(pid, "?"), "value": round(seconds / elapsed * 100, 1)}
+                for pid, seconds in sorted(reaped, key=lambda item: item[1], reverse=True)[:5]
+            ],
+        }
+        self.known = current
+        self.children_cpu = dict(children_times or {})
+        self.forks = forks
+        self.time = now
+        return self.summary(counters)
+
+    def churn(self, now: float = None, limit: int = 5) -> list:
+        """최근 window 초 동안 이름별 생성/종료 횟수 Top N"""
+        now = time.time() if now is None else now
+        while self.events and self.events[0][0] < now - self.window:
+            self.events.popleft()
+        totals = {}
+        for _, name, kind in self.events:
+            counts = totals.setdefault(name, [0, 0])
+            counts[0 if kind > 0 else 1] += 1
+        ranked = sorted(totals.items(), key=lambda item: item[1][0] + item[1][1], reverse=True)[:limit]
+        return [{"name": name, "spawned": s, "exited": e} for name, (s, e) in ranked]
+
+    def summary(self, counters: dict = None) -> dict:
+        counters = counters or {}
+        result = dict(self.last) if self.last else {
+            "interval": None, "spawned": 0, "exited": 0, "spawn_rate": 0.0, "exit_rate": 0.0,
+            "forks": None, "fork_rate": None, "unseen": None, "children_cpu": [],
+        }
+        result["procs_running"] = counters.get("procs_running")
+        result["procs_blocked"] = counters.get("procs_blocked")
+        result["window"] = self.window
+        result["churn_top"] = self.churn(self.time)
+        return result
@@ -1,106 +1,281 @@
+import os
+import re
+import time
+
 import psutil
 
+from .cgroup_monitor import find_cgroup2_root, read_pid_cgroup, display_name
+from .process_lifecycle import ProcessLifecycleTracker
+
+# 한 번의 process_iter 로 읽는 속성
+PROCESS_ATTRS = ['pid', 'ppid', 'name', 'cmdline', 'status', 'cpu_percent',
+                 'memory_percent', 'memory_info', 'num_threads', 'io_counters', 'create_time']
+# POSIX 는 uid 로 읽고 이름은 캐시 (Windows 는 uids 미지원)
+PROCESS_ATTRS.append('uids' if psutil.POSIX else 'username')
+# Linux 는 종료된 자식 CPU(cutime/cstime) 추적용으로 cpu_times 도 읽음 (같은 /proc/<pid>/stat)
+if psutil.LINUX:
+    PROCESS_ATTRS.append('cpu_times')
+
+# 그룹 집계 기준
+GROUP_KINDS = ("name", "cmdline", "user", "tree", "cgroup")
+
+# cmdline 그룹에서 첫 번째 인자(스크립트/모듈)까지 보는 인터프리터
+INTERPRETERS = re.compile(r"^(python[\d.]*|node|java|ruby|perl|php[\d.]*|bash|sh|dotnet)$")
+
+
+def cmdline_key(name: str, cmdline: list) -> str:
+    """cmdline 을 애플리케이션 단위 키로 축약 (예: 'python3 manage.py runserver' → 'python3 manage.py')"""
+    if not cmdline:
+        return name
+    exe = os.path.basename(cmdline[0])
+    if not INTERPRETERS.match(exe):
+        return exe
+    args = iter(cmdline[1:])
+    for arg in args:
+        if arg == "-c":
+            # 인라인 코드는 내용 대신 '-c' 로 묶음
+            return f"{exe} -c"
+        if arg in ("-m", "-jar"):
+            target = next(args, "")
+            return f"{exe} {arg} {os.path.basename(target)}"
+        if not arg.startswith("-"):
+            return f"{exe} {os.path.basename(arg)}"
+    return exe
+
+
 class ProcessMonitor:
-    """프로세스 모니터링 모듈"""
+    """프로세스 모니터링 모듈
     
-    def get_top_cpu(self, limit: int = 5) -> list:
-        """CPU 사용률 상위 프로세스 반환"""
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
+    한 주기에 process_iter 를 한 번만 돌려 프로세스 표(스냅샷)를 만들고,
+    PID 별 Top N 과 이름/cmdline/사용자/부모 트리/cgroup 별 그룹 집계를
+    같은 스냅샷에서 계산한다. 생성/종료 추적도 같은 스냅샷의 증분으로 갱신한다.
+    """
+    
+    def __init__(self, cmdline_patterns: dict = None, max_age: float = 1.0):
+        # cgroup v2 사용 여부 (최초 호출 시 확인)
+        self.cgroup_v2 = None
+        # {그룹 라벨: 정규식} - cmdline 이 일치하면 해당 라벨로 묶음
+        self.cmdline_patterns = [(label, re.compile(pattern))
+                                 for label, pattern in (cmdline_patterns or {}).items()]
+        # 스냅샷 재사용 허용 시간 (초)
+        self.max_age = max_age
+        self.snapshot = {"time": 0.0, "rows": []}
+        self.user_names = {}
+        # 생성/종료 추적 (프로세스 표 갱신마다 증분 계산)
+        self.lifecycle = ProcessLifecycleTracker()
+        self.lifecycle_summary = self.lifecycle.summary()
+    
+    def _user_name(self, info: dict) -> str:
+        """UID → 사용자 이름 (캐시)"""
+        uids = info.get('uids')
+        if uids is None:
+            return info.get('username')
+        uid = uids.real
+        if uid not in self.user_names:
             try:
-                # cpu_percent 호출 시 interval=None이어야 blocking되지 않음
-                # 최초 호출 시 0.0을 반환할 수 있으므로, 메인 루프에서 지속 호출 필요
-                proc.cpu_percent(interval=None) 
-                processes.append(proc)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                pass
-        
-        # 정렬 (내림차순)
-        top_cpu = sorted(processes, key=lambda p: p.info['cpu_percent'], reverse=True)[:limit]
-        
+                import pwd
+                self.user_names[uid] = pwd.getpwuid(uid).pw_name
+            except (ImportError, KeyError):
+                self.user_names[uid] = str(uid)
+        return self.user_names[uid]
+    
+    def _connection_counts(self) -> dict:
+        """PID 별 네트워크 연결 수 (전역 테이블 1회 조회, 권한이 없으면 None)"""
+        counts = {}
+        try:
+            for conn in psutil.net_connections(kind='inet'):
+                if conn.pid:
+                    counts[conn.pid] = counts.get(conn.pid, 0) + 1
+        except (psutil.AccessDenied, OSError):
+            return None
+        return counts
+    
+    def _per_process_connections(self, proc) -> int:
+        """프로세스별 연결 수 (전역 조회가 불가한 플랫폼용, 오버헤드 큼)"""
+        try:
+            getter = getattr(proc, "net_connections", None) or proc.connections
+            return len(getter())
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, Exception):
+            return 0
+    
+    def _cmdline_group(self, name: str, cmdline: list) -> str:
+        if self.cmdline_patterns and cmdline:
+            joined = " ".join(cmdline)
+            for label, pattern in self.cmdline_patterns:
+                if pattern.search(joined):
+                    return label
+        return cmdline_key(name, cmdline)
+    
+    def refresh(self) -> list:
+        """프로세스 표 갱신 (process_iter 1회)"""
+        if self.cgroup_v2 is None:
+            self.cgroup_v2 = find_cgroup2_root() is not None
+        connections = self._connection_counts()
+        rows = []
+        children_times = {}
+        for proc in psutil.process_iter(PROCESS_ATTRS, ad_value=None):
+            info = proc.info
+            if info['pid'] is None:
+                continue
+            memory_info = info['memory_info']
+            io = info['io_counters']
+            cmdline = info['cmdline'] or []
+            name = info['name'] or ""
+            if connections is not None:
+                conns = connections.get(info['pid'], 0)
+            else:
+                conns = self._per_process_connections(proc)
+            cgroup = None
+            if self.cgroup_v2:
+                path = read_pid_cgroup(info['pid'], psutil.PROCFS_PATH)
+                cgroup = display_name(path) if path else None
+            cpu_times = info.get('cpu_times')
+            if cpu_times is not None:
+                children_times[info['pid']] = cpu_times.children_user + cpu_times.children_system
+            rows.append({
+                "pid": info['pid'],
+                "ppid": info['ppid'],
+                "name": name,
+                "user": self._user_name(info),
+                "status": info['status'],
+                "cpu_percent": info['cpu_percent'] or 0.0,
+                "memory_percent": round(info['memory_percent'] or 0.0, 2),
+                "rss_mb": round(memory_info.rss / (1024 * 1024), 1) if memory_info else 0.0,
+                "threads": info['num_threads'] or 0,
+                # 읽기+쓰기 바이트 합계 (MB 단위 환산)
+                "io_mb": round((io.read_bytes + io.write_bytes) / (1024 * 1024), 2) if io else 0.0,
+                "connections": conns,
+                "cgroup": cgroup,
+                "create_time": info['create_time'],
+                "command": " ".join(cmdline)[:256] or name,
+                "app": self._cmdline_group(name, cmdline)
+            })
+        now = time.time()
+        self.snapshot = {"time": now, "rows": rows}
+        self.lifecycle_summary = self.lifecycle.update(rows, children_times, now)
+        return rows
+    
+    def get_rows(self, max_age: float = None) -> list:
+        """이번 주기의 프로세스 표 (max_age 이내면 재사용)"""
+        max_age = self.max_age if max_age is None else max_age
+        if time.time() - self.snapshot["time"] > max_age:
+            return self.refresh()
+        return self.snapshot["rows"]
+    
+    def _top(self, rows: list, column: str, limit: int, include_zero: bool = True) -> list:
+        """column 기준 Top N (기존 응답 형식 {pid, name, value, cgroup})"""
+        if not include_zero:
+            rows = [r for r in rows if r[column] > 0]
+        top = sorted(rows, key=lambda r: r[column], reverse=True)[:limit]
         return [
             {
-                "pid": p.info['pid'],
-                "name": p.info['name'],
-                "value": p.info['cpu_percent']
-            } 
-            for p in top_cpu
+                "pid": r["pid"],
+                "name": r["name"],
+                "value": r[column],
+                "cgroup": r["cgroup"]
+            }
+            for r in top
         ]
-        
+    
+    def get_top_cpu(self, limit: int = 5) -> list:
+        """CPU 사용률 상위 프로세스 반환"""
+        return self._top(self.get_rows(), "cpu_percent", limit)
+    
     def get_top_memory(self, limit: int = 5) -> list:
         """메모리 사용률 상위 프로세스 반환"""
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'memory_percent']):
-            try:
-                processes.append(proc)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                pass
-                
-        # 정렬 (내림차순)
-        top_mem = sorted(processes, key=lambda p: p.info['memory_percent'], reverse=True)[:limit]
-        
-        return [
-            {
-                "pid": p.info['pid'],
-                "name": p.info['name'],
-                "value": round(p.info['memory_percent'], 1)
-            } 
-            for p in top_mem
-        ]
-        
+        top = self._top(self.get_rows(), "memory_percent", limit)
+        for entry in top:
+            entry["value"] = round(entry["value"], 1)
+        return top
+    
     def get_top_network(self, limit: int = 5) -> list:
         """네트워크 연결 수 상위 프로세스 반환"""
-        processes = []
-        try:
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    # 연결 수 가져오기 (오버헤드 주의, 권한 에러 가능성 높음)
-                    conns = len(proc.connections())
-                    if conns > 0:
-                        processes.append({
-                            "pid": proc.info['pid'],
-                            "name": proc.info['name'],
-                            "value": conns
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, Exception):
-                    continue
-        except Exception:
-            pass
-        
-        # 정렬 (내림차순)
-        top_net = sorted(processes, key=lambda p: p['value'], reverse=True)[:limit]
-        return top_net
-
+        return self._top(self.get_rows(), "connections", limit, include_zero=False)
+    
     def get_top_disk(self, limit: int = 5) -> list:
         """디스크 I/O 상위 프로세스 반환"""
-        processes = []
-        try:
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    io = proc.io_counters()
-                    if io:
-                        # 읽기+쓰기 바이트 합계 (MB 단위 환산)
-                        total_io = (io.read_bytes + io.write_bytes) / (1024 * 1024)
-                        if total_io > 0:
-                            processes.append({
-                                "pid": proc.info['pid'],
-                                "name": proc.info['name'],
-                                "value": round(total_io, 2)
-                            })
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, Exception):
-                    continue
-        except Exception:
-            pass
+        return self._top(self.get_rows(), "io_mb", limit, include_zero=False)
+    
+    def _group_key(self, row: dict, kind: str, roots: dict, parents: dict):
+        if kind == "name":
+            return row["name"]
+        if kind == "cmdline":
+            return row["app"]
+        if kind == "user":
+            return row["user"]
+        if kind == "cgroup":
+            return row["cgroup"]
+        # tree: init(1)/kthreadd(2) 바로 아래 조상 프로세스 기준
+        pid = row["pid"]
+        chain = []
+        while pid not in roots:
+            chain.append(pid)
+            parent = parents.get(pid)
+            if parent is None or parent in (0, 1, 2) or parent == pid or len(chain) > 64:
+                roots[pid] = pid
+                break
+            pid = parent
+        root = roots[pid]
+        for p in chain:
+            roots[p] = root
+        return root
+    
+    def get_groups(self, limit: int = 5, kinds: tuple = GROUP_KINDS) -> dict:
+        """그룹별 합계의 Top N (CPU/메모리/디스크/연결 수)"""
+        rows = self.get_rows()
+        names = {r["pid"]: r["name"] for r in rows}
+        parents = {r["pid"]: r["ppid"] for r in rows}
+        roots = {}
         
-        # 정렬 (내림차순)
-        top_disk = sorted(processes, key=lambda p: p['value'], reverse=True)[:limit]
-        return top_disk
+        # 한 번의 순회로 모든 그룹 기준 집계
+        totals = {kind: {} for kind in kinds}
+        for row in rows:
+            for kind in kinds:
+                key = self._group_key(row, kind, roots, parents)
+                if key is None:
+                    continue
+                group = totals[kind].get(key)
+                if group is None:
+                    group = totals[kind][key] = {"count": 0, "cpu_percent": 0.0, "memory_percent": 0.0,
+                                                 "rss_mb": 0.0, "io_mb": 0.0, "connections": 0}
+                group["count"] += 1
+                group["cpu_percent"] += row["cpu_percent"]
+                group["memory_percent"] += row["memory_percent"]
+                group["rss_mb"] += row["rss_mb"]
+                group["io_mb"] += row["io_mb"]
+                group["connections"] += row["connections"]
         
+        result = {}
+        for kind, groups in totals.items():
+            def label(key):
+                # tree 그룹은 루트 PID 를 이름과 함께 표시
+                return f"{names.get(key, '?')} ({key})" if kind == "tree" else key
+            
+            def top(column, digits):
+                ranked = sorted(groups.items(), key=lambda item: item[1][column], reverse=True)[:limit]
+                return [
+                    {"name": label(key), "count": g["count"], "value": round(g[column], digits)}
+                    for key, g in ranked if g[column] > 0
+                ]
+            
+            result[kind] = {
+                "count": len(groups),
+                "cpu_top": top("cpu_percent", 1),
+                "memory_top": top("memory_percent", 1),
+                "disk_top": top("io_mb", 2),
+                "network_top": top("connections", 0)
+            }
+        return result
+    
     def get_all(self, limit: int = 5) -> dict:
         """모든 Top 프로세스 정보 반환"""
+        rows = self.refresh()
         return {
             "cpu_top": self.get_top_cpu(limit),
             "memory_top": self.get_top_memory(limit),
             "disk_top": self.get_top_disk(limit),
-            "network_top": self.get_top_network(limit)
+            "network_top": self.get_top_network(limit),
+            "total": len(rows),
+            "groups": self.get_groups(limit),
+            "lifecycle": self.lifecycle_summary
         }
@@ -0,0 +1,435 @@
+import itertools
+import os
+import re
+import threading
+import time
+
+import psutil
+
+# RLIMIT_NOFILE 조회 (Windows 에는 resource 모듈 없음)
+try:
+    import resource
+except ImportError:
+    resource = None
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+MB = 1024 * 1024
+
+
+def _pread(fd: int, size: int = 65536) -> str:
+    """열어 둔 /proc 파일을 처음부터 다시 읽음 (seq_file 은 오프셋 0 읽기 시 내용 갱신)"""
+    return os.pread(fd, size, 0).decode("utf-8", errors="replace")
+
+
+def _parse_stat(text: str) -> dict:
+    """/proc/<pid>/stat (comm 에 공백/괄호가 있을 수 있어 마지막 ')' 기준으로 분리)"""
+    head, _, rest = text.rpartition(")")
+    fields = rest.split()
+    return {
+        "comm": head.partition("(")[2],
+        "ticks": int(fields[11]) + int(fields[12]),
+        "threads": int(fields[17]),
+        "starttime": int(fields[19]),
+        "rss": int(fields[21]) * PAGE_SIZE
+    }
+
+
+def _parse_keyed(text: str) -> dict:
+    """'Key: value kB' / 'key: value' 형식 → {키: 정수}"""
+    values = {}
+    for line in text.splitlines():
+        key, _, rest = line.partition(":")
+        parts = rest.split()
+        if parts and parts[0].isdigit():
+            values[key] = int(parts[0])
+    return values
+
+
+def _default_thread_fd_limit(fraction: float = 0.25, cap: int = 65536) -> int:
+    """열어 둘 스레드 stat fd 총량 - 서버 자신의 accept()/open() 이 EMFILE 로 실패하지 않도록 soft 한도의 일부만"""
+    if resource is None:
+        return 0
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        soft = cap
+    return int(min(soft, cap) * fraction)
+
+
+class FdBudget:
+    """핸들들이 나눠 쓰는 열어 둘 fd 한도 (WatchMonitor.lock 안에서만 사용)"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+
+    def acquire(self) -> bool:
+        if self.used >= self.limit:
+            return False
+        self.used += 1
+        return True
+
+    def release(self, count: int = 1):
+        self.used = max(self.used - count, 0)
+
+
+class ProcHandle:
+    """/proc/<pid> 디렉터리와 자주 읽는 파일을 열어 둔 핸들 (Linux)
+
+    디렉터리 fd 를 기준으로 상대 경로를 열기 때문에 매번 경로를 탐색하지 않고,
+    프로세스가 종료되면 PID 가 재사용되더라도 이 핸들로는 새 프로세스를 읽지 않는다 (ESRCH).
+    스레드 stat fd 는 모든 핸들이 공유하는 budget 안에서만 열어 두고, 넘치면 매번 열고 닫는다.
+    """
+
+    FILES = ("stat", "status", "io", "smaps_rollup")
+
+    def __init__(self, pid: int, procfs: str = "/proc", budget: FdBudget = None):
+        self.pid = pid
+        self.dir_fd = os.open(f"{procfs}/{pid}", os.O_RDONLY | os.O_DIRECTORY)
+        self.fds = {}
+        self.thread_fds = {}
+        self.budget = budget or FdBudget(0)
+        try:
+            for name in self.FILES:
+                try:
+                    self.fds[name] = os.open(name, os.O_RDONLY, dir_fd=self.dir_fd)
+                except PermissionError:
+                    # 다른 사용자 프로세스의 io/smaps_rollup 은 권한 없음
+                    continue
+                except FileNotFoundError:
+                    # smaps_rollup 미지원 커널
+                    continue
+            self.task_fd = os.open("task", os.O_RDONLY | os.O_DIRECTORY, dir_fd=self.dir_fd)
+            self.fd_dir = os.open("fd", os.O_RDONLY | os.O_DIRECTORY, dir_fd=self.dir_fd)
+            # 여는 도중 종료되면 (ESRCH/ENOENT, 빈 stat) 이미 연 fd 를 모두 닫음
+            self.starttime = _parse_stat(_pread(self.fds["stat"]))["starttime"]
+            with open(os.open("cmdline", os.O_RDONLY, dir_fd=self.dir_fd), "rb") as f:
+                self.cmdline = f.read().replace(b"\0", b" ").decode("utf-8", errors="replace").strip()
+        except (OSError, ValueError, IndexError, KeyError):
+            self.close()
+            raise
+
+    def close(self):
+        for fd in list(self.fds.values()) + list(self.thread_fds.values()):
+            os.close(fd)
+        self.budget.release(len(self.thread_fds))
+        self.fds.clear()
+        self.thread_fds.clear()
+        for name in ("task_fd", "fd_dir", "dir_fd"):
+            fd = getattr(self, name, None)
+            if fd is not None:
+                os.close(fd)
+                setattr(self, name, None)
+
+    def read(self, name: str):
+        fd = self.fds.get(name)
+        return _pread(fd) if fd is not None else None
+
+    def thread_stats(self) -> dict:
+        """{tid: (이름, CPU 틱)} - 스레드 stat fd 는 공유 budget 이 허락하는 만큼 열어 둠"""
+        stats = {}
+        tids = os.listdir(self.task_fd)
+        alive = set(tids)
+        for tid in [t for t in self.thread_fds if t not in alive]:
+            os.close(self.thread_fds.pop(tid))
+            self.budget.release()
+        for tid in tids:
+            try:
+                fd = self.thread_fds.get(tid)
+                if fd is None:
+                    fd = os.open(f"{tid}/stat", os.O_RDONLY, dir_fd=self.task_fd)
+                    if self.budget.acquire():
+                        self.thread_fds[tid] = fd
+                    else:
+                        try:
+                            text = _pread(fd)
+                        finally:
+                            os.close(fd)
+                        stat = _parse_stat(text)
+                        stats[int(tid)] = (stat["comm"], stat["ticks"])
+                        continue
+                stat = _parse_stat(_pread(fd))
+                stats[int(tid)] = (stat["comm"], stat["ticks"])
+            except (OSError, ValueError, IndexError):
+                # 측정 중 종료된 스레드
+                continue
+        return stats
+
+    def fd_counts(self, max_scan: int) -> tuple:
+        """(열린 fd 수, 소켓 수 - fd 가 max_scan 보다 많으면 None)"""
+        names = os.listdir(self.fd_dir)
+        if len(names) > max_scan:
+            return len(names), None
+        sockets = 0
+        for name in names:
+            try:
+                if os.readlink(name, dir_fd=self.fd_dir).startswith("socket:"):
+                    sockets += 1
+            except OSError:
+                continue
+        return len(names), sockets
+
+
+class WatchMonitor:
+    """지정 프로세스 상세 모니터링 (PID, 이름, cmdline 정규식으로 등록)
+
+    일치하는 프로세스마다 /proc/<pid> 핸들을 열어 두고 스레드별 CPU, RSS/PSS, 열린 fd,
+    컨텍스트 스위치, I/O 속도, 소켓 수를 읽는다. 이름/정규식 감시는 rescan_interval 마다
+    프로세스 목록을 다시 훑어 새로 뜬 프로세스를 붙잡는다. Linux 외에는 psutil 로 대체한다.
+    """
+
+    def __init__(self, procfs: str = "/proc", max_processes: int = 32, rescan_interval: float = 2.0,
+                 thread_limit: int = 10, max_fd_scan: int = 4096, thread_fd_limit: int = None):
+        self.procfs = procfs
+        self.linux = psutil.LINUX and os.path.isdir(procfs)
+        self.max_processes = max_processes
+        self.rescan_interval = rescan_interval
+        self.thread_limit = thread_limit
+        self.max_fd_scan = max_fd_scan
+        # 모든 핸들의 열어 둔 스레드 stat fd 총량
+        self.thread_fds = FdBudget(_default_thread_fd_limit() if thread_fd_limit is None else thread_fd_limit)
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.watches = {}
+        # pid → {"handle", "watches", "previous", "name"}
+        self.targets = {}
+        self.exited = []
+        self.last_scan = 0.0
+
+    def add(self, pid: int = None, name: str = None, pattern: str = None) -> dict:
+        """감시 등록 (pid / 프로세스 이름 / cmdline 정규식 중 하나)"""
+        if sum(v is not None for v in (pid, name, pattern)) != 1:
+            raise ValueError("Specify exactly one of pid, name or pattern")
+        # JSON true 는 int 로 취급되므로 bool 제외
+        if pid is not None and (not isinstance(pid, int) or isinstance(pid, bool) or pid <= 0):
+            raise ValueError("pid must be a positive integer")
+        create_time = None
+        if pid is not None:
+            # PID 감시는 (PID, 생성 시각) 으로 고정 - 종료 후 PID 를 재사용한 다른 프로세스는 붙잡지 않음
+            try:
+                create_time = psutil.Process(pid).create_time()
+            except psutil.NoSuchProcess:
+                raise ValueError(f"No such process: {pid}")
+            except psutil.Error as e:
+                raise ValueError(f"Cannot watch pid {pid}: {e}")
+        regex = None
+        if pattern is not None:
+            try:
+                regex = re.compile(pattern)
+            except (re.error, TypeError) as e:
+                raise ValueError(f"Invalid pattern: {e}")
+        watch = {"id": next(self.ids), "pid": pid, "name": name, "pattern": pattern, "created": time.time(),
+                 "create_time": create_time, "exited": None}
+        with self.lock:
+            self.watches[watch["id"]] = dict(watch, regex=regex)
+            # 다음 수집에서 바로 매칭
+            self.last_scan = 0.0
+        return watch
+
+    def remove(self, watch_id: int):
+        with self.lock:
+            if watch_id not in self.watches:
+                raise KeyError(watch_id)
+            del self.watches[watch_id]
+            for pid in list(self.targets):
+                self.targets[pid]["watches"].discard(watch_id)
+                if not self.targets[pid]["watches"]:
+                    self._drop(pid)
+
+    def list(self) -> list:
+        with self.lock:
+            watches = []
+            for w in self.watches.values():
+                watch = {k: v for k, v in w.items() if k != "regex"}
+                watch["matched"] = sorted(pid for pid, t in self.targets.items() if w["id"] in t["watches"])
+                watches.append(watch)
+            return watches
+
+    def _drop(self, pid: int):
+        target = self.targets.pop(pid)
+        if target["handle"] is not None and self.linux:
+            target["handle"].close()
+
+    def _match(self, watch: dict, proc: dict) -> bool:
+        if watch["pid"] is not None:
+            return proc["pid"] == watch["pid"] and proc["create_time"] == watch["create_time"]
+        if watch["name"] is not None:
+            return proc["name"] == watch["name"]
+        return bool(watch["regex"].search(" ".join(proc["cmdline"] or [])))
+
+    def _rescan(self):
+        """감시 조건에 맞는 프로세스를 찾아 핸들을 엶 (max_processes 개까지, 대상이 종료된 PID 감시 제외)"""
+        watches = [w for w in self.watches.values() if w["exited"] is None]
+        if not watches:
+            return
+        pid_only = all(w["pid"] is not None for w in watches)
+        if pid_only:
+            candidates = []
+            for w in watches:
+                try:
+                    p = psutil.Process(w["pid"])
+                    candidates.append({"pid": p.pid, "name": p.name(), "cmdline": None,
+                                       "create_time": p.create_time()})
+                except psutil.Error:
+                    continue
+        else:
+            candidates = [p.info for p in psutil.process_iter(["pid", "name", "cmdline", "create_time"])]
+        for proc in candidates:
+            matched = {w["id"] for w in watches if self._match(w, proc)}
+            if not matched:
+                continue
+            target = self.targets.get(proc["pid"])
+            if target is not None:
+                target["watches"] |= matched
+                continue
+            if len(self.targets) >= self.max_processes:
+                break
+            try:
+                handle = ProcHandle(proc["pid"], self.procfs, self.thread_fds) if self.linux else psutil.Process(proc["pid"])
+            except (OSError, ValueError, IndexError, KeyError, psutil.Error):
+                continue
+            self.targets[proc["pid"]] = {"handle": handle, "watches": matched, "previous": None,
+                                         "name": proc["name"]}
+
+    def _sample_linux(self, target: dict) -> dict:
+        handle = target["handle"]
+        stat = _parse_stat(handle.read("stat"))
+        if stat["starttime"] != handle.starttime:
+            raise ProcessLookupError(handle.pid)
+        status = _parse_keyed(handle.read("status"))
+        io_text = handle.read("io")
+        io = _parse_keyed(io_text) if io_text else {}
+        rollup_text = handle.read("smaps_rollup")
+        rollup = _parse_keyed(rollup_text) if rollup_text else {}
+        fds, sockets = handle.fd_counts(self.max_fd_scan)
+        return {
+            "name": stat["comm"],
+            "cmdline": handle.cmdline,
+            "ticks": stat["ticks"],
+            "cpu_seconds": stat["ticks"] / CLOCK_TICKS,
+            "threads": stat["threads"],
+            "thread_times": {tid: (name, ticks / CLOCK_TICKS)
+                             for tid, (name, ticks) in handle.thread_stats().items()},
+            "rss": status.get("VmRSS", 0) * 1024 or stat["rss"],
+            "pss": rollup["Pss"] * 1024 if "Pss" in rollup else None,
+            "fds": fds,
+            "sockets": sockets,
+            "ctx": (status.get("voluntary_ctxt_switches"), status.get("nonvoluntary_ctxt_switches")),
+            "io": {k: io.get(k) for k in ("read_bytes", "write_bytes", "rchar", "wchar")}
+        }
+
+    def _sample_psutil(self, target: dict) -> dict:
+        p = target["handle"]
+        with p.oneshot():
+            times = p.cpu_times()
+            memory = p.memory_full_info() if hasattr(p, "memory_full_info") else p.memory_info()
+            try:
+                io = p.io_counters()
+            except (psutil.AccessDenied, AttributeError):
+                io = None
+            ctx = p.num_ctx_switches()
+            fds = p.num_fds() if psutil.POSIX else p.num_handles()
+            try:
+                sockets = len(p.net_connections(kind="all")) if hasattr(p, "net_connections") \
+                    else len(p.connections(kind="all"))
+            except psutil.AccessDenied:
+                sockets = None
+            return {
+                "name": p.name(),
+                "cmdline": " ".join(p.cmdline()),
+                "cpu_seconds": times.user + times.system,
+                "threads": p.num_threads(),
+                "thread_times": {t.id: ("", t.user_time + t.system_time) for t in p.threads()},
+                "rss": memory.rss,
+                "pss": getattr(memory, "pss", None),
+                "fds": fds,
+                "sockets": sockets,
+                "ctx": (ctx.voluntary, ctx.involuntary),
+                "io": {"read_bytes": io.read_bytes, "write_bytes": io.write_bytes,
+                       "rchar": getattr(io, "read_chars", None), "wchar": getattr(io, "write_chars", None)}
+                if io else {}
+            }
+
+    @staticmethod
+    def _rate(current, previous, elapsed, scale: float = 1.0):
+        if current is None or previous is None or not elapsed:
+            return None
+        return round(max(current - previous, 0) / elapsed / scale, 2)
+
+    def _describe(self, pid: int, target: dict, sample: dict, now: float) -> dict:
+        previous = target["previous"]
+        elapsed = now - previous["time"] if previous else None
+        prev = previous["sample"] if previous else {}
+        threads = []
+        if previous:
+            for tid, (name, seconds) in sample["thread_times"].items():
+                before = prev["thread_times"].get(tid)
+                used = seconds - before[1] if before else None
+                if used is not None and used > 0:
+                    threads.append({"tid": tid, "name": name, "cpu_percent": round(used / elapsed * 100, 1)})
+            threads.sort(key=lambda t: t["cpu_percent"], reverse=True)
+        io = sample["io"]
+        prev_io = prev.get("io", {})
+        return {
+            "pid": pid,
+            "name": sample["name"],
+            "cmdline": sample["cmdline"],
+            "watches": sorted(target["watches"]),
+            "cpu_percent": self._rate(sample["cpu_seconds"], prev.get("cpu_seconds"), elapsed, 0.01),
+            "threads": sample["threads"],
+            "top_threads": threads[:self.thread_limit],
+            "rss_mb": round(sample["rss"] / MB, 1),
+            "pss_mb": round(sample["pss"] / MB, 1) if sample["pss"] is not None else None,
+            "fds": sample["fds"],
+            "sockets": sample["sockets"],
+            "ctx_switches_per_sec": {
+                "voluntary": self._rate(sample["ctx"][0], (prev.get("ctx") or (None, None))[0], elapsed),
+                "involuntary": self._rate(sample["ctx"][1], (prev.get("ctx") or (None, None))[1], elapsed)
+            },
+            "io": {
+                "read_mb_s": self._rate(io.get("read_bytes"), prev_io.get("read_bytes"), elapsed, MB),
+                "write_mb_s": self._rate(io.get("write_bytes"), prev_io.get("write_bytes"), elapsed, MB),
+                "rchar_mb_s": self._rate(io.get("rchar"), prev_io.get("rchar"), elapsed, MB),
+                "wchar_mb_s": self._rate(io.get("wchar"), prev_io.get("wchar"), elapsed, MB)
+            }
+        }
+
+    def get_all(self) -> dict:
+        """감시 중인 프로세스별 상세 지표 (첫 측정은 비율 항목이 None)"""
+        with self.lock:
+            now = time.time()
+            if self.watches and now - self.last_scan >= self.rescan_interval:
+                self.last_scan = now
+                try:
+                    self._rescan()
+                except psutil.Error as e:
+                    print(f"Watch rescan error: {e}")
+            processes = []
+            exited = []
+            for pid, target in list(self.targets.items()):
+                try:
+                    sample = self._sample_linux(target) if self.linux else self._sample_psutil(target)
+                except (OSError, ValueError, IndexError, psutil.Error):
+                    exited.append({"pid": pid, "name": target["name"], "time": now})
+                    # PID 감시는 대상이 종료되면 끝남 (재사용된 PID 에 다시 붙지 않음)
+                    for watch_id in target["watches"]:
+                        watch = self.watches.get(watch_id)
+                        if watch is not None and watch["pid"] is not None:
+                            watch["exited"] = now
+                    self._drop(pid)
+                    continue
+                processes.append(self._describe(pid, target, sample, now))
+                target["previous"] = {"time": now, "sample": sample}
+                target["name"] = sample["name"]
+            self.exited = (self.exited + exited)[-20:]
+            return {
+                "watches": len(self.watches),
+                "processes": processes,
+                "exited": list(self.exited),
+                "limit_reached": len(self.targets) >= self.max_processes
+            }
+
+    def close(self):
+        with self.lock:
+            for pid in list(self.targets):
+                self._drop(pid)
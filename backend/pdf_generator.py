@@ -9,11 +9,32 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from matplotlib.figure import Figure
 import numpy as np
 
+# 요약 테이블 행 (키, 라벨, (경고, 위험) 평균 임계값)
+SUMMARY_ROWS = (
+    ("cpu", "CPU Usage (%)", (60, 85)),
+    ("memory", "Memory Usage (%)", (70, 90)),
+    ("gpu", "GPU Usage (%)", (70, 90)),
+)
+SUMMARY_METRICS = tuple(key for key, _, _ in SUMMARY_ROWS)
+
+# 차트별 입력 키와 제목
+CHART_INPUTS = {
+    "cpu": ("cpu",),
+    "memory": ("memory",),
+    "network": ("network_upload", "network_download"),
+    "disk": ("disk",),
+}
+CHART_HEADINGS = (
+    ("cpu", "🖥️ CPU Usage Over Time"),
+    ("memory", "💾 Memory Usage Over Time"),
+    ("network", "🌐 Network Traffic Over Time"),
+    ("disk", "💿 Disk Usage"),
+)
+
 class PDFGenerator:
     """PDF 리포트 생성기"""
     
@@ -63,14 +84,31 @@ class PDFGenerator:
             textColor=colors.HexColor('#374151')
         ))
     
+    def _draw_events(self, ax, events: list, baseline_events: list = None):
+        """이벤트 표시 (현재 실행: 실선, 베이스라인: 점선)"""
+        for items, style in ((baseline_events or [], ':'), (events or [], '-')):
+            for event in items:
+                ax.axvline(event['offset'], color='#6B7280', linestyle=style, linewidth=1)
+                ax.annotate(event['label'], xy=(event['offset'], 1), xycoords=('data', 'axes fraction'),
+                            xytext=(3, -3), textcoords='offset points', rotation=90,
+                            fontsize=7, color='#6B7280', va='top')
+    
     def _create_line_chart(self, data: list, title: str, ylabel: str, 
-                           color: str = '#3B82F6', figsize=(8, 3)) -> io.BytesIO:
-        """라인 차트 생성"""
-        fig, ax = plt.subplots(figsize=figsize)
-        
-        x = list(range(len(data)))
-        ax.plot(x, data, color=color, linewidth=2, marker='o', markersize=3)
+                           color: str = '#3B82F6', figsize=(8, 3), x: list = None,
+                           baseline: dict = None, baseline_key: str = None, events: list = None) -> io.BytesIO:
+        """라인 차트 생성 (x: 시작 기준 경과 초, 생략 시 샘플 순번, baseline: 겹쳐 그릴 베이스라인)"""
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
+        
+        x = list(x) if x is not None else list(range(len(data)))
+        ax.plot(x, data, color=color, linewidth=2, marker='o', markersize=3,
+                label='Current' if baseline else None)
         ax.fill_between(x, data, alpha=0.3, color=color)
+        if baseline:
+            ax.plot(baseline['x'], baseline['series'][baseline_key], color='#9CA3AF',
+                    linewidth=1.5, linestyle='--', label='Baseline')
+            ax.legend(loc='upper right')
+        self._draw_events(ax, events, baseline['events'] if baseline else None)
         
         ax.set_title(title, fontsize=12, fontweight='bold', color='#1F2937')
         ax.set_ylabel(ylabel, fontsize=10, color='#6B7280')
@@ -83,14 +121,13 @@ class PDFGenerator:
         ax.spines['right'].set_visible(False)
         
         # Y축 범위 설정
-        if max(data) <= 100:
+        if data and max(data) <= 100 and (not baseline or max(baseline['series'][baseline_key], default=0) <= 100):
             ax.set_ylim(0, 100)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        plt.close(fig)
+        fig.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
         img_buffer.seek(0)
         
         return img_buffer
@@ -100,13 +137,21 @@ class PDFGenerator:
                                  title: str, ylabel: str,
                                  color1: str = '#3B82F6', 
                                  color2: str = '#10B981',
-                                 figsize=(8, 3)) -> io.BytesIO:
+                                 figsize=(8, 3), x: list = None,
+                                 baseline: dict = None, baseline_keys: tuple = None,
+                                 events: list = None) -> io.BytesIO:
         """이중 라인 차트 생성"""
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
         
-        x = list(range(len(data1)))
+        x = list(x) if x is not None else list(range(len(data1)))
         ax.plot(x, data1, color=color1, linewidth=2, label=label1, marker='o', markersize=2)
         ax.plot(x, data2, color=color2, linewidth=2, label=label2, marker='s', markersize=2)
+        if baseline:
+            for key, label, color in zip(baseline_keys, (label1, label2), (color1, color2)):
+                ax.plot(baseline['x'], baseline['series'][key], color=color, alpha=0.5,
+                        linewidth=1.5, linestyle='--', label=f"{label} (baseline)")
+        self._draw_events(ax, events, baseline['events'] if baseline else None)
         
         ax.set_title(title, fontsize=12, fontweight='bold', color='#1F2937')
         ax.set_ylabel(ylabel, fontsize=10, color='#6B7280')
@@ -119,11 +164,10 @@ class PDFGenerator:
         ax.spines['right'].set_visible(False)
         ax.legend(loc='upper right')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        plt.close(fig)
+        fig.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
         img_buffer.seek(0)
         
         return img_buffer
@@ -132,7 +176,8 @@ class PDFGenerator:
                           title: str, ylabel: str,
                           figsize=(8, 3)) -> io.BytesIO:
         """바 차트 생성"""
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
         
         # 값에 따른 색상 결정
         bar_colors = []
@@ -160,11 +205,10 @@ class PDFGenerator:
             ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 2,
                    f'{val:.1f}%', ha='center', va='bottom', fontsize=9)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        plt.close(fig)
+        fig.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
         img_buffer.seek(0)
         
         return img_buffer
@@ -177,8 +221,148 @@ class PDFGenerator:
             return self.colors['warning']
         return self.colors['primary']
     
+    def summarize(self, monitoring_data: dict) -> dict:
+        """지표별 Min/Max/Average (리포트 요약 테이블 입력)"""
+        stats = {}
+        for key in SUMMARY_METRICS:
+            values = monitoring_data.get(key)
+            if values:
+                stats[key] = {"min": min(values), "max": max(values), "avg": sum(values) / len(values)}
+        return stats
+    
+    def render_chart(self, name: str, series: dict, x: list = None,
+                     events: list = None, baseline: dict = None) -> bytes:
+        """리포트 차트 하나를 PNG 로 렌더링 (series: monitoring_data 형식의 값 목록)
+
+        events: [{"offset", "label"}], baseline: {"x", "series": {키: 값 목록}, "events"} (라인 차트만)
+        """
+        if name == "cpu":
+            chart = self._create_line_chart(series['cpu'], "CPU Usage (%)", "Usage (%)",
+                                            self.colors['primary'], x=x, baseline=baseline,
+                                            baseline_key='cpu', events=events)
+        elif name == "memory":
+            chart = self._create_line_chart(series['memory'], "Memory Usage (%)", "Usage (%)",
+                                            '#10B981', x=x, baseline=baseline,
+                                            baseline_key='memory', events=events)
+        elif name == "network":
+            chart = self._create_dual_line_chart(
+                series['network_upload'],
+                series['network_download'],
+                "Upload",
+                "Download",
+                "Network Traffic (KB/s)",
+                "Speed (KB/s)",
+                '#3B82F6',
+                '#10B981',
+                x=x,
+                baseline=baseline,
+                baseline_keys=CHART_INPUTS['network'],
+                events=events
+            )
+        elif name == "disk":
+            chart = self._create_bar_chart(
+                [d['mountpoint'] for d in series['disk']],
+                [d['percent'] for d in series['disk']],
+                "Disk Usage by Partition",
+                "Usage (%)"
+            )
+        else:
+            raise ValueError(f"Unknown chart: {name}")
+        return chart.getvalue()
+    
+    def render_charts(self, monitoring_data: dict) -> dict:
+        """데이터가 있는 차트 전체 렌더링"""
+        charts = {}
+        for name, keys in CHART_INPUTS.items():
+            if all(monitoring_data.get(key) for key in keys):
+                charts[name] = self.render_chart(name, monitoring_data)
+        return charts
+    
     def generate(self, monitoring_data: dict, duration_minutes: int = 5) -> str:
         """PDF 리포트 생성"""
+        return self.build(self.summarize(monitoring_data), self.render_charts(monitoring_data),
+                          monitoring_data.get('system_info'), duration_minutes)
+    
+    def _comparison_section(self, comparison: dict) -> list:
+        """베이스라인 대비 중앙값/p95 변화와 유의성 테이블"""
+        verdicts = {"regression": "🔴 Regression", "improvement": "🟢 Improvement", "unchanged": "⚪ No change"}
+        
+        def delta(d):
+            return f"{d['abs']:+.1f}" + (f" ({d['pct']:+.0f}%)" if d['pct'] is not None else "")
+        
+        rows = [["Metric", "Median (base/now)", "Change", "p95 (base/now)", "Change", "p-value", "Result"]]
+        for m in comparison['metrics']:
+            rows.append([
+                m['label'],
+                f"{m['baseline']['median']:.1f} / {m['current']['median']:.1f}",
+                delta(m['median_delta']),
+                f"{m['baseline']['p95']:.1f} / {m['current']['p95']:.1f}",
+                delta(m['p95_delta']),
+                f"{m['p_value']:.3g}" if m['p_value'] is not None else "-",
+                verdicts[m['verdict']]
+            ])
+        table = Table(rows, colWidths=[3.2*cm, 2.7*cm, 2.3*cm, 2.7*cm, 2.3*cm, 1.6*cm, 2.8*cm])
+        style = [
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3B82F6')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F9FAFB')),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]
+        for row, m in enumerate(comparison['metrics'], start=1):
+            if m['verdict'] == 'regression':
+                style.append(('TEXTCOLOR', (-1, row), (-1, row), colors.HexColor(self.colors['danger'])))
+        table.setStyle(TableStyle(style))
+        return [
+            Paragraph(f"📈 Baseline Comparison: {comparison['baseline']}", self.styles['CustomSubtitle']),
+            Paragraph(
+                f"Mann-Whitney U test (alpha={comparison['alpha']}); a metric is flagged when the shift is "
+                f"significant and the median or p95 moved by at least {comparison['min_change_pct']:.0f}%.",
+                self.styles['CustomBody']
+            ),
+            table,
+            Spacer(1, 25)
+        ]
+    
+    def _watched_section(self, watched: list) -> list:
+        """감시 프로세스별 평균/최대 테이블"""
+        def value(stats, key, field, fmt="{:.1f}"):
+            return fmt.format(stats[key][field]) if key in stats else "-"
+        
+        rows = [["Process", "CPU avg/max (%)", "RSS max (MB)", "PSS max (MB)", "FDs max", "Sockets max", "Ctx sw/s", "I/O MB/s"]]
+        for w in watched:
+            rows.append([
+                f"{w['name'][:16]} ({w['pid']})",
+                f"{value(w, 'cpu', 'avg')} / {value(w, 'cpu', 'max')}",
+                value(w, 'rss', 'max'),
+                value(w, 'pss', 'max'),
+                value(w, 'fds', 'max', "{:.0f}"),
+                value(w, 'sockets', 'max', "{:.0f}"),
+                value(w, 'ctx', 'avg', "{:.0f}"),
+                value(w, 'io', 'avg', "{:.2f}")
+            ])
+        table = Table(rows, colWidths=[3.6*cm, 2.6*cm, 1.9*cm, 1.9*cm, 1.5*cm, 1.7*cm, 1.6*cm, 1.8*cm])
+        table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3B82F6')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 7),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F9FAFB')),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]))
+        return [Paragraph("🔍 Watched Processes", self.styles['CustomSubtitle']), table, Spacer(1, 25)]
+    
+    def build(self, stats: dict, charts: dict, system_info: dict = None, duration_minutes: int = 5,
+              comparison: dict = None, events: list = None, watched: list = None) -> str:
+        """미리 계산한 요약과 렌더링된 차트(PNG)로 PDF 조립
+
+        comparison: baselines.compare 결과, watched: ReportBuilder 의 감시 프로세스 요약
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"system_report_{timestamp}.pdf"
         filepath = os.path.join(self.output_dir, filename)
@@ -209,44 +393,18 @@ class PDFGenerator:
             ["Metric", "Min", "Max", "Average", "Status"]
         ]
         
-        # CPU 요약
-        if 'cpu' in monitoring_data and monitoring_data['cpu']:
-            cpu_data = monitoring_data['cpu']
-            avg_cpu = sum(cpu_data) / len(cpu_data) if cpu_data else 0
-            status = "🔴 Critical" if avg_cpu >= 85 else ("🟡 Warning" if avg_cpu >= 60 else "🔵 Normal")
-            summary_data.append([
-                "CPU Usage (%)",
-                f"{min(cpu_data):.1f}",
-                f"{max(cpu_data):.1f}",
-                f"{avg_cpu:.1f}",
-                status
-            ])
-        
-        # 메모리 요약
-        if 'memory' in monitoring_data and monitoring_data['memory']:
-            mem_data = monitoring_data['memory']
-            avg_mem = sum(mem_data) / len(mem_data) if mem_data else 0
-            status = "🔴 Critical" if avg_mem >= 90 else ("🟡 Warning" if avg_mem >= 70 else "🔵 Normal")
-            summary_data.append([
-                "Memory Usage (%)",
-                f"{min(mem_data):.1f}",
-                f"{max(mem_data):.1f}",
-                f"{avg_mem:.1f}",
-                status
-            ])
-        
-        # GPU 요약
-        if 'gpu' in monitoring_data and monitoring_data['gpu']:
-            gpu_data = monitoring_data['gpu']
-            avg_gpu = sum(gpu_data) / len(gpu_data) if gpu_data else 0
-            status = "🔴 Critical" if avg_gpu >= 90 else ("🟡 Warning" if avg_gpu >= 70 else "🔵 Normal")
-            summary_data.append([
-                "GPU Usage (%)",
-                f"{min(gpu_data):.1f}",
-                f"{max(gpu_data):.1f}",
-                f"{avg_gpu:.1f}",
-                status
-            ])
+        for key, label, thresholds in SUMMARY_ROWS:
+            if key in stats:
+                stat = stats[key]
+                avg = stat['avg']
+                status = "🔴 Critical" if avg >= thresholds[1] else ("🟡 Warning" if avg >= thresholds[0] else "🔵 Normal")
+                summary_data.append([
+                    label,
+                    f"{stat['min']:.1f}",
+                    f"{stat['max']:.1f}",
+                    f"{avg:.1f}",
+                    status
+                ])
         
         # 테이블 스타일
         table = Table(summary_data, colWidths=[3*cm, 2.5*cm, 2.5*cm, 2.5*cm, 3*cm])
@@ -268,66 +426,42 @@ class PDFGenerator:
         story.append(table)
         story.append(Spacer(1, 25))
         
-        # CPU 그래프
-        if 'cpu' in monitoring_data and monitoring_data['cpu']:
-            story.append(Paragraph("🖥️ CPU Usage Over Time", self.styles['CustomSubtitle']))
-            cpu_chart = self._create_line_chart(
-                monitoring_data['cpu'], 
-                "CPU Usage (%)", 
-                "Usage (%)",
-                self.colors['primary']
-            )
-            story.append(Image(cpu_chart, width=16*cm, height=6*cm))
-            story.append(Spacer(1, 15))
-        
-        # 메모리 그래프
-        if 'memory' in monitoring_data and monitoring_data['memory']:
-            story.append(Paragraph("💾 Memory Usage Over Time", self.styles['CustomSubtitle']))
-            mem_chart = self._create_line_chart(
-                monitoring_data['memory'], 
-                "Memory Usage (%)", 
-                "Usage (%)",
-                '#10B981'
-            )
-            story.append(Image(mem_chart, width=16*cm, height=6*cm))
-            story.append(Spacer(1, 15))
-        
-        # 네트워크 그래프
-        if 'network_upload' in monitoring_data and 'network_download' in monitoring_data:
-            story.append(Paragraph("🌐 Network Traffic Over Time", self.styles['CustomSubtitle']))
-            net_chart = self._create_dual_line_chart(
-                monitoring_data['network_upload'],
-                monitoring_data['network_download'],
-                "Upload",
-                "Download",
-                "Network Traffic (KB/s)",
-                "Speed (KB/s)",
-                '#3B82F6',
-                '#10B981'
-            )
-            story.append(Image(net_chart, width=16*cm, height=6*cm))
-            story.append(Spacer(1, 15))
-        
-        # 디스크 사용량
-        if 'disk' in monitoring_data and monitoring_data['disk']:
-            story.append(Paragraph("💿 Disk Usage", self.styles['CustomSubtitle']))
-            disk_info = monitoring_data['disk']
-            labels = [d['mountpoint'] for d in disk_info]
-            values = [d['percent'] for d in disk_info]
-            
-            disk_chart = self._create_bar_chart(
-                labels, values,
-                "Disk Usage by Partition",
-                "Usage (%)"
-            )
-            story.append(Image(disk_chart, width=16*cm, height=6*cm))
-            story.append(Spacer(1, 15))
+        # 베이스라인 비교
+        if comparison and comparison['metrics']:
+            story.extend(self._comparison_section(comparison))
+        
+        # 이벤트 목록
+        if events:
+            story.append(Paragraph("📌 Events", self.styles['CustomSubtitle']))
+            event_table = Table([["Time (s)", "Event"]] + [[f"{e['offset']:.0f}", e['label']] for e in events],
+                                colWidths=[3*cm, 13*cm])
+            event_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1F2937')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F9FAFB')),
+                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
+            ]))
+            story.append(event_table)
+            story.append(Spacer(1, 25))
+        
+        # 감시 프로세스 요약
+        if watched:
+            story.extend(self._watched_section(watched))
+        
+        # 그래프 (CPU, 메모리, 네트워크, 디스크 순)
+        for name, heading in CHART_HEADINGS:
+            if name in charts:
+                story.append(Paragraph(heading, self.styles['CustomSubtitle']))
+                story.append(Image(io.BytesIO(charts[name]), width=16*cm, height=6*cm))
+                story.append(Spacer(1, 15))
         
         # 시스템 정보 테이블
-        if 'system_info' in monitoring_data:
+        if system_info:
             story.append(Paragraph("ℹ️ System Information", self.styles['CustomSubtitle']))
             
-            sys_info = monitoring_data['system_info']
+            sys_info = system_info
             info_data = [
                 ["Property", "Value"],
             ]
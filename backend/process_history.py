@@ -0,0 +1,165 @@
+from collections import OrderedDict, deque
+
+# 기록 대상 선정 기준 지표 (프로세스 표 컬럼)
+SKETCH_METRICS = ("cpu_percent", "rss_mb")
+
+
+class SpaceSaving:
+    """Space-Saving 상위 빈도 요약 (가중치 + 지수 감쇠)
+
+    최대 capacity 개 카운터만 유지한다. 새 키가 들어오면 가장 작은 카운터를 대체하고
+    그 값을 오차로 물려받으므로, 실제 상위 키는 프로세스 수와 관계없이 항상 남는다.
+    감쇠를 적용해 오래전에만 컸던 키는 점차 밀려난다.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+
+    def decay(self, factor: float):
+        for key in self.counts:
+            self.counts[key] *= factor
+            self.errors[key] *= factor
+
+    def add(self, key, weight: float):
+        if key in self.counts:
+            self.counts[key] += weight
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[key] = weight
+            self.errors[key] = 0.0
+            return
+        smallest = min(self.counts, key=self.counts.get)
+        floor = self.counts.pop(smallest)
+        del self.errors[smallest]
+        self.counts[key] = floor + weight
+        self.errors[key] = floor
+
+    def discard(self, key):
+        self.counts.pop(key, None)
+        self.errors.pop(key, None)
+
+    def top(self, limit: int) -> list:
+        """보장 하한(count - error) 기준 상위 키"""
+        return sorted(self.counts, key=lambda k: self.counts[k] - self.errors[k], reverse=True)[:limit]
+
+
+class ProcessHistory:
+    """상위 프로세스별 시계열 보존
+
+    프로세스 표가 갱신될 때마다 CPU/메모리 Space-Saving 요약을 갱신하고,
+    각 요약의 상위 tracked 개 프로세스에 대해서만 (시각, CPU, RSS, I/O) 를 기록한다.
+    상위에서 밀려났거나 종료된 프로세스의 시계열은 retired 에 옮겨 두었다가
+    retired_capacity 를 넘으면 가장 오래된 것부터 버리므로 메모리는 프로세스 변동과 무관하게 일정하다.
+    """
+
+    def __init__(self, capacity: int = 64, tracked: int = 16, max_points: int = 1440,
+                 retired_capacity: int = 64, half_life: float = 600.0):
+        self.tracked = tracked
+        self.max_points = max_points
+        self.retired_capacity = retired_capacity
+        self.half_life = half_life
+        self.sketches = {metric: SpaceSaving(capacity) for metric in SKETCH_METRICS}
+        self.active = {}
+        self.retired = OrderedDict()
+        self.time = None
+
+    @staticmethod
+    def key(row: dict) -> str:
+        """PID 재사용과 구분하기 위해 생성 시각 포함 (예: '1234:1760000000')"""
+        return f"{row['pid']}:{int(row['create_time'] or 0)}"
+
+    def update(self, snapshot: dict):
+        """ProcessMonitor.snapshot ({"time", "rows"}) 반영"""
+        now = snapshot["time"]
+        rows = snapshot["rows"]
+        if not rows or (self.time is not None and now <= self.time):
+            return
+        elapsed = now - self.time if self.time is not None else 0.0
+        self.time = now
+
+        # 가중치는 값 × 경과 시간 (주기가 달라도 같은 기준으로 누적)
+        factor = 0.5 ** (elapsed / self.half_life) if elapsed else 1.0
+        by_key = {}
+        for row in rows:
+            key = self.key(row)
+            by_key[key] = row
+            for metric, sketch in self.sketches.items():
+                value = row[metric]
+                if value > 0:
+                    sketch.add(key, value * (elapsed or 1.0))
+        for sketch in self.sketches.values():
+            sketch.decay(factor)
+            # 종료된 프로세스는 요약에서 제거 (시계열은 retired 로)
+            for key in [k for k in sketch.counts if k not in by_key]:
+                sketch.discard(key)
+
+        heavy = set()
+        for sketch in self.sketches.values():
+            heavy.update(sketch.top(self.tracked))
+
+        for key in [k for k in self.active if k not in heavy]:
+            self._retire(key)
+        for key in heavy:
+            row = by_key[key]
+            series = self.active.get(key)
+            if series is None:
+                series = self.retired.pop(key, None) or {
+                    "pid": row["pid"], "name": row["name"], "command": row["command"],
+                    "user": row["user"], "points": deque(maxlen=self.max_points)
+                }
+                self.active[key] = series
+            series["points"].append((round(now, 3), row["cpu_percent"], row["rss_mb"], row["io_mb"]))
+
+    def _retire(self, key: str):
+        self.retired[key] = self.active.pop(key)
+        while len(self.retired) > self.retired_capacity:
+            self.retired.popitem(last=False)
+
+    def query(self, start: float = None, end: float = None, metric: str = "cpu",
+              limit: int = 10, pid: int = None, include_points: bool = True) -> dict:
+        """기간 내 시계열이 있는 프로세스를 기간 중 최대값 순으로 반환"""
+        column = {"cpu": 1, "memory": 2, "io": 3}.get(metric)
+        if column is None:
+            raise ValueError("metric must be one of cpu, memory, io")
+        results = []
+        for key, series in list(self.active.items()) + list(self.retired.items()):
+            if pid is not None and series["pid"] != pid:
+                continue
+            points = [p for p in list(series["points"])
+                      if (start is None or p[0] >= start) and (end is None or p[0] <= end)]
+            if not points:
+                continue
+            cpu = [p[1] for p in points]
+            rss = [p[2] for p in points]
+            entry = {
+                "id": key,
+                "pid": series["pid"],
+                "name": series["name"],
+                "command": series["command"],
+                "user": series["user"],
+                "active": key in self.active,
+                "first": points[0][0],
+                "last": points[-1][0],
+                "cpu_peak": max(cpu),
+                "cpu_avg": round(sum(cpu) / len(cpu), 1),
+                "rss_peak_mb": max(rss),
+                "io_mb": round(points[-1][3] - points[0][3], 2),
+                "_rank": max(p[column] for p in points) if column != 3 else points[-1][3] - points[0][3],
+            }
+            if include_points:
+                entry["points"] = points
+            results.append(entry)
+        results.sort(key=lambda e: e["_rank"], reverse=True)
+        for entry in results:
+            del entry["_rank"]
+        return {
+            "start": start,
+            "end": end,
+            "metric": metric,
+            "fields": ["time", "cpu_percent", "rss_mb", "io_mb"],
+            "tracked": len(self.active),
+            "retired": len(self.retired),
+            "processes": results[:limit],
+        }
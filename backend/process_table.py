@@ -0,0 +1,103 @@
+import heapq
+from typing import Dict, List
+
+# 정렬/조회 가능한 컬럼 (ProcessMonitor 프로세스 표 행의 키)
+COLUMNS = ("pid", "ppid", "name", "user", "status", "cpu_percent", "memory_percent", "rss_mb",
+           "threads", "io_mb", "connections", "cgroup", "create_time", "command", "app")
+NUMERIC_COLUMNS = {"pid", "ppid", "cpu_percent", "memory_percent", "rss_mb", "threads",
+                   "io_mb", "connections", "create_time"}
+
+# 일치(정확히 같음) 필터 컬럼, name 은 이름/명령줄 부분 일치
+EXACT_FILTERS = ("user", "status", "cgroup", "app")
+
+DEFAULT_QUERY = {"sort": "cpu_percent", "order": "desc", "offset": 0, "limit": 50}
+MAX_LIMIT = 500
+
+
+def parse_query(params: dict) -> dict:
+    """쿼리 파라미터 검증 (잘못된 값은 ValueError)"""
+    query = dict(DEFAULT_QUERY)
+    sort = params.get("sort", query["sort"])
+    if sort not in COLUMNS:
+        raise ValueError(f"Unknown sort column: {sort}")
+    order = params.get("order", query["order"])
+    if order not in ("asc", "desc"):
+        raise ValueError("order must be 'asc' or 'desc'")
+    try:
+        offset = int(params.get("offset", query["offset"]))
+        limit = int(params.get("limit", query["limit"]))
+    except (TypeError, ValueError):
+        raise ValueError("offset/limit must be integers")
+    if offset < 0 or not 1 <= limit <= MAX_LIMIT:
+        raise ValueError(f"offset must be >= 0 and limit between 1 and {MAX_LIMIT}")
+    query.update(sort=sort, order=order, offset=offset, limit=limit)
+    for key in ("name",) + EXACT_FILTERS:
+        value = params.get(key)
+        if value not in (None, ""):
+            query[key] = str(value)
+    return query
+
+
+def _sort_key(column: str):
+    """None 값이 항상 뒤로 가도록 하는 정렬 키"""
+    if column in NUMERIC_COLUMNS:
+        return lambda row: (row[column] is not None, row[column] or 0)
+    return lambda row: (row[column] is not None, str(row[column] or "").lower())
+
+
+def query_rows(rows: List[dict], query: dict) -> dict:
+    """필터 → 정렬 → 페이지 (전체 정렬 대신 필요한 만큼만 heapq 선택)"""
+    name = query.get("name")
+    if name:
+        name = name.lower()
+    filters = [(key, query[key]) for key in EXACT_FILTERS if key in query]
+
+    matched = rows
+    if name or filters:
+        matched = [
+            row for row in rows
+            if (not name or name in row["name"].lower() or name in row["command"].lower())
+            and all(str(row[key]) == value for key, value in filters)
+        ]
+
+    key = _sort_key(query["sort"])
+    end = query["offset"] + query["limit"]
+    if query["order"] == "desc":
+        ordered = heapq.nlargest(end, matched, key=key)
+    else:
+        # 오름차순에서도 None 은 뒤로
+        ordered = heapq.nsmallest(end, matched, key=lambda row: (not key(row)[0], key(row)[1]))
+
+    return {
+        "total": len(rows),
+        "matched": len(matched),
+        "sort": query["sort"],
+        "order": query["order"],
+        "offset": query["offset"],
+        "limit": query["limit"],
+        "rows": ordered[query["offset"]:end]
+    }
+
+
+def diff_page(previous: List[dict], page: List[dict]) -> Dict[str, list]:
+    """이전에 보낸 페이지 대비 변경분 (바뀐 필드만 담은 행, 빠진 PID, 순서가 바뀌면 pids)"""
+    before = {row["pid"]: row for row in previous}
+    updated = []
+    for row in page:
+        old = before.get(row["pid"])
+        if old is None:
+            updated.append(row)
+            continue
+        changes = {k: v for k, v in row.items() if old.get(k) != v}
+        if changes:
+            changes["pid"] = row["pid"]
+            updated.append(changes)
+    current = {row["pid"] for row in page}
+    diff = {
+        "update": updated,
+        "remove": [pid for pid in before if pid not in current]
+    }
+    pids = [row["pid"] for row in page]
+    if pids != [row["pid"] for row in previous]:
+        diff["pids"] = pids
+    return diff
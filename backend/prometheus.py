@@ -0,0 +1,115 @@
+from typing import List
+
+# /metrics 스크레이프에 필요한 토픽
+METRICS_TOPICS = ("cpu", "memory", "disk", "network", "connections", "cgroups", "interrupts", "limits")
+
+
+def _escape_label(value: str) -> str:
+    """Prometheus 라벨 값 이스케이프"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _gauge(lines: List[str], name: str, help_text: str, samples: list):
+    """gauge 메트릭 블록 추가 (samples: [(labels dict, value)])"""
+    if not samples:
+        return
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} gauge")
+    for labels, value in samples:
+        if labels:
+            label_str = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+            lines.append(f"{name}{{{label_str}}} {value}")
+        else:
+            lines.append(f"{name} {value}")
+
+
+def render_metrics(snapshot: dict) -> str:
+    """스냅샷을 Prometheus 텍스트 포맷으로 변환"""
+    lines = []
+    cpu = snapshot.get("cpu")
+    if cpu:
+        _gauge(lines, "sysmon_cpu_percent", "Total CPU usage (%)",
+               [({}, cpu["usage"]["percent"])])
+        _gauge(lines, "sysmon_cpu_core_percent", "Per-core CPU usage (%)",
+               [({"core": i}, v) for i, v in enumerate(cpu["usage"]["per_core"])])
+        if cpu["temperature"]["available"]:
+            _gauge(lines, "sysmon_cpu_temperature_celsius", "CPU temperature",
+                   [({}, cpu["temperature"]["value"])])
+
+    memory = snapshot.get("memory")
+    if memory:
+        _gauge(lines, "sysmon_memory_percent", "Memory usage (%)",
+               [({}, memory["virtual"]["percent"])])
+        _gauge(lines, "sysmon_memory_used_bytes", "Used memory (bytes)",
+               [({}, memory["virtual"]["used_bytes"])])
+        _gauge(lines, "sysmon_swap_percent", "Swap usage (%)",
+               [({}, memory["swap"]["percent"])])
+        pressure = memory.get("pressure") or {}
+        if pressure.get("available"):
+            _gauge(lines, "sysmon_pressure_avg10", "PSI stall average over 10s (%)",
+                   [({"resource": resource, "kind": kind}, values["avg10"])
+                    for resource, kinds in pressure["psi"].items()
+                    for kind, values in kinds.items()])
+            _gauge(lines, "sysmon_vmstat_rate", "Page fault/swap/reclaim events per second",
+                   [({"counter": name}, value) for name, value in pressure["reclaim"].items()])
+
+    network = snapshot.get("network")
+    if network:
+        speed = network["speed"]
+        _gauge(lines, "sysmon_network_upload_bytes_per_second", "Upload speed",
+               [({}, speed["upload_speed"])])
+        _gauge(lines, "sysmon_network_download_bytes_per_second", "Download speed",
+               [({}, speed["download_speed"])])
+
+    connections = snapshot.get("connections")
+    if connections:
+        _gauge(lines, "sysmon_connections", "Network connections by status",
+               [({"status": status}, count) for status, count in connections["by_status"].items()])
+
+    disk = snapshot.get("disk")
+    if disk:
+        _gauge(lines, "sysmon_disk_usage_percent", "Disk usage by mountpoint (%)",
+               [({"mountpoint": p["mountpoint"]}, p["percent"]) for p in disk["partitions"]])
+
+    cgroups = snapshot.get("cgroups")
+    if cgroups and cgroups.get("available"):
+        groups = cgroups["cgroups"]
+        _gauge(lines, "sysmon_cgroup_cpu_percent", "Per-cgroup CPU usage (% of host)",
+               [({"cgroup": c["path"]}, c["cpu_percent"]) for c in groups])
+        _gauge(lines, "sysmon_cgroup_throttled_percent", "Per-cgroup throttled CFS periods (%)",
+               [({"cgroup": c["path"]}, c["throttled_percent"]) for c in groups])
+        _gauge(lines, "sysmon_cgroup_memory_bytes", "Per-cgroup memory.current (bytes)",
+               [({"cgroup": c["path"]}, c["memory_bytes"]) for c in groups if c["memory_bytes"] is not None])
+
+    interrupts = snapshot.get("interrupts")
+    if interrupts and interrupts.get("available"):
+        _gauge(lines, "sysmon_cpu_irq_per_second", "Per-core hardware interrupts per second",
+               [({"cpu": c["cpu"]}, c["irq_rate"]) for c in interrupts["per_core"]])
+        _gauge(lines, "sysmon_cpu_softirq_per_second", "Per-core softirqs per second",
+               [({"cpu": c["cpu"]}, c["softirq_rate"]) for c in interrupts["per_core"]
+                if c["softirq_rate"] is not None])
+        _gauge(lines, "sysmon_irq_imbalance", "Busiest core rate / mean core rate",
+               [({"kind": kind}, value) for kind, value in interrupts["imbalance"].items() if value is not None])
+        if interrupts["context_switches_per_sec"] is not None:
+            _gauge(lines, "sysmon_context_switches_per_second", "Context switches per second",
+                   [({}, interrupts["context_switches_per_sec"])])
+        if interrupts["procs_running"] is not None:
+            _gauge(lines, "sysmon_procs_running", "Runnable tasks (/proc/stat procs_running)",
+                   [({}, interrupts["procs_running"])])
+        load = interrupts["load"]
+        if load:
+            _gauge(lines, "sysmon_load_average", "Load average",
+                   [({"period": period}, load[f"load{period}"]) for period in ("1", "5", "15")])
+
+    limits = snapshot.get("limits")
+    if limits and limits.get("available"):
+        resources = limits["resources"]
+        _gauge(lines, "sysmon_resource_used", "Kernel resource usage (file handles, pids, conntrack, ports, inodes, fds)",
+               [({"resource": r["resource"]}, r["used"]) for r in resources])
+        _gauge(lines, "sysmon_resource_limit", "Kernel resource limit",
+               [({"resource": r["resource"]}, r["limit"]) for r in resources])
+        _gauge(lines, "sysmon_resource_exhaustion_seconds", "Estimated seconds until the resource limit is reached",
+               [({"resource": r["resource"]}, r["time_to_exhaustion"]) for r in resources
+                if r["time_to_exhaustion"] is not None])
+
+    return "\n".join(lines) + "\n"
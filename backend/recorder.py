@@ -0,0 +1,269 @@
+import bisect
+import json
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+# 파일 형식: MAGIC 뒤에 청크 반복
+#   청크 헤더 <ddII: 첫 프레임 시각, 마지막 프레임 시각, 프레임 수, 압축 길이>
+#   청크 본문: 프레임별 [시각, 스냅샷] JSON 한 줄씩을 zlib 으로 묶어 압축
+# 인덱스(<이름>.idx.json)는 청크별 [첫 시각, 마지막 시각, 프레임 수, 파일 오프셋] 목록.
+# 비정상 종료로 인덱스가 없으면 청크 헤더만 건너뛰며 읽어 재구성한다.
+MAGIC = b"SYSREC1\n"
+CHUNK_HEADER = struct.Struct("<ddII")
+EXTENSION = ".sysrec"
+
+_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+
+def _default_dir() -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "recordings")
+
+
+def validate_name(name: str) -> str:
+    """경로 탈출 방지용 기록 이름 검증"""
+    if not isinstance(name, str) or not _NAME_PATTERN.match(name) or name.startswith("."):
+        raise ValueError("Recording name must be 1-64 characters of [A-Za-z0-9_.-]")
+    return name
+
+
+class RecordingWriter:
+    """스냅샷 스트림을 청크 단위로 압축 기록"""
+
+    def __init__(self, path: str, chunk_frames: int = 30, chunk_seconds: float = 30.0):
+        self.path = path
+        self.chunk_frames = chunk_frames
+        self.chunk_seconds = chunk_seconds
+        self.file = open(path, "wb")
+        self.file.write(MAGIC)
+        self.file.flush()
+        self.buffer = []
+        self.index = []
+        self.frames = 0
+        self.start = None
+        self.end = None
+
+    def write(self, timestamp: float, snapshot: dict):
+        line = json.dumps([timestamp, snapshot], separators=(",", ":"))
+        self.buffer.append((timestamp, line))
+        self.frames += 1
+        if self.start is None:
+            self.start = timestamp
+        self.end = timestamp
+        if len(self.buffer) >= self.chunk_frames or timestamp - self.buffer[0][0] >= self.chunk_seconds:
+            self.flush()
+
+    def flush(self):
+        """버퍼의 프레임을 청크 하나로 압축해 기록"""
+        if not self.buffer:
+            return
+        body = zlib.compress("\n".join(line for _, line in self.buffer).encode("utf-8"), 6)
+        offset = self.file.tell()
+        first, last = self.buffer[0][0], self.buffer[-1][0]
+        self.file.write(CHUNK_HEADER.pack(first, last, len(self.buffer), len(body)))
+        self.file.write(body)
+        self.file.flush()
+        self.index.append([first, last, len(self.buffer), offset])
+        self.buffer = []
+
+    def close(self) -> dict:
+        self.flush()
+        self.file.close()
+        with open(self.path[:-len(EXTENSION)] + ".idx.json", "w") as f:
+            json.dump({"frames": self.frames, "start": self.start, "end": self.end,
+                       "chunks": self.index}, f)
+        return {"frames": self.frames, "start": self.start, "end": self.end}
+
+
+class RecordingReader:
+    """기록 파일 읽기 (인덱스 기반 탐색)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.index = self._load_index()
+        self.chunk_starts = [chunk[0] for chunk in self.index]
+
+    def _load_index(self) -> list:
+        index_path = self.path[:-len(EXTENSION)] + ".idx.json"
+        if os.path.exists(index_path) and os.path.getmtime(index_path) >= os.path.getmtime(self.path):
+            with open(index_path, "r") as f:
+                return json.load(f)["chunks"]
+        # 인덱스가 없거나 오래됨 (기록 중 또는 비정상 종료) → 청크 헤더 스캔
+        index = []
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a recording file: {self.path}")
+            while True:
+                offset = f.tell()
+                header = f.read(CHUNK_HEADER.size)
+                if len(header) < CHUNK_HEADER.size:
+                    break
+                first, last, count, length = CHUNK_HEADER.unpack(header)
+                if offset + CHUNK_HEADER.size + length > os.path.getsize(self.path):
+                    break
+                index.append([first, last, count, offset])
+                f.seek(length, os.SEEK_CUR)
+        return index
+
+    @property
+    def frames(self) -> int:
+        return sum(chunk[2] for chunk in self.index)
+
+    @property
+    def start(self) -> Optional[float]:
+        return self.index[0][0] if self.index else None
+
+    @property
+    def end(self) -> Optional[float]:
+        return self.index[-1][1] if self.index else None
+
+    def _read_chunk(self, f, position: int) -> List[list]:
+        offset = self.index[position][3]
+        f.seek(offset)
+        _, _, _, length = CHUNK_HEADER.unpack(f.read(CHUNK_HEADER.size))
+        body = zlib.decompress(f.read(length)).decode("utf-8")
+        return [json.loads(line) for line in body.split("\n")]
+
+    def iter_frames(self, start: float = None) -> Iterator[tuple]:
+        """(시각, 스냅샷) 순회 - start 지정 시 해당 시각 이후 프레임부터 (인덱스로 청크 탐색)"""
+        position = 0
+        if start is not None:
+            position = max(bisect.bisect_right(self.chunk_starts, start) - 1, 0)
+        with open(self.path, "rb") as f:
+            for i in range(position, len(self.index)):
+                for timestamp, snapshot in self._read_chunk(f, i):
+                    if start is not None and timestamp < start:
+                        continue
+                    yield timestamp, snapshot
+
+
+class SnapshotRecorder:
+    """수집기 스냅샷 기록 관리 (동시에 하나의 기록)"""
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or _default_dir()
+        self.lock = threading.Lock()
+        self.writer = None
+        self.name = None
+        self.stop_at = None
+        # 기록 대상 토픽 (None 이면 모든 수집 주기 기록)
+        self.topics = None
+
+    @property
+    def active(self) -> bool:
+        return self.writer is not None
+
+    def path_for(self, name: str) -> str:
+        return os.path.join(self.directory, validate_name(name) + EXTENSION)
+
+    def start(self, name: str = None, duration: float = None, topics=None) -> dict:
+        name = name or datetime.now().strftime("rec_%Y%m%d_%H%M%S")
+        path = self.path_for(name)
+        if duration is not None and duration <= 0:
+            raise ValueError("duration must be positive")
+        with self.lock:
+            if self.writer:
+                raise RuntimeError(f"Recording already in progress: {self.name}")
+            if os.path.exists(path):
+                raise ValueError(f"Recording already exists: {name}")
+            os.makedirs(self.directory, exist_ok=True)
+            self.writer = RecordingWriter(path)
+            self.name = name
+            self.stop_at = time.time() + duration if duration else None
+            self.topics = set(topics) if topics else None
+        return self.status()
+
+    def write(self, snapshot: dict, topics=None) -> Optional[dict]:
+        """수집 주기마다 호출 (기록 중이 아니면 무시, 지정 시간이 지나 종료되면 기록 정보 반환)
+
+        topics: 이번 주기에 수집된 토픽 - 기록 대상 토픽이 하나도 없는 주기 (다른 소비자의 watch,
+        alerts 수집 등) 는 건너뛰고, 프레임에 _collected 로 남겨 내보내기에서 이전 값을 반복하지 않음
+        """
+        if self.writer is None:
+            return None
+        now = time.time()
+        with self.lock:
+            if self.writer is None:
+                return None
+            if topics is not None:
+                collected = set(topics) & self.topics if self.topics else set(topics)
+                if collected:
+                    self.writer.write(now, dict(snapshot, _collected=sorted(collected)))
+            else:
+                self.writer.write(now, snapshot)
+            if self.stop_at and now >= self.stop_at:
+                return self._close()
+        return None
+
+    def _close(self) -> dict:
+        info = self.writer.close()
+        info["name"] = self.name
+        self.writer = None
+        self.name = None
+        self.stop_at = None
+        self.topics = None
+        return info
+
+    def stop(self) -> Optional[dict]:
+        with self.lock:
+            if self.writer is None:
+                return None
+            return self._close()
+
+    def status(self) -> dict:
+        with self.lock:
+            if self.writer is None:
+                return {"recording": False}
+            return {
+                "recording": True,
+                "name": self.name,
+                "frames": self.writer.frames,
+                "start": self.writer.start,
+                "stop_at": self.stop_at
+            }
+
+    def open(self, name: str) -> RecordingReader:
+        path = self.path_for(name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(name)
+        return RecordingReader(path)
+
+    def list(self) -> list:
+        recordings = []
+        if not os.path.isdir(self.directory):
+            return recordings
+        for filename in sorted(os.listdir(self.directory)):
+            if not filename.endswith(EXTENSION):
+                continue
+            name = filename[:-len(EXTENSION)]
+            try:
+                reader = RecordingReader(os.path.join(self.directory, filename))
+            except (OSError, ValueError):
+                continue
+            writer = self.writer if name == self.name else None
+            recordings.append({
+                "name": name,
+                # 기록 중이면 아직 청크로 기록되지 않은 프레임 포함
+                "frames": writer.frames if writer else reader.frames,
+                "start": writer.start if writer else reader.start,
+                "end": writer.end if writer else reader.end,
+                "size": os.path.getsize(reader.path),
+                "recording": writer is not None
+            })
+        return recordings
+
+    def delete(self, name: str):
+        path = self.path_for(name)
+        if name == self.name:
+            raise RuntimeError("Cannot delete a recording in progress")
+        if not os.path.exists(path):
+            raise FileNotFoundError(name)
+        os.remove(path)
+        index_path = path[:-len(EXTENSION)] + ".idx.json"
+        if os.path.exists(index_path):
+            os.remove(index_path)
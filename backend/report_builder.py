@@ -0,0 +1,310 @@
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+from baselines import align_offset, compare
+from pdf_generator import PDFGenerator, SUMMARY_METRICS, CHART_INPUTS
+
+# 모니터링 중 누적하는 시계열 (monitoring_data 키와 동일)
+SERIES_KEYS = ("cpu", "memory", "gpu", "cpu_temp", "gpu_temp", "network_upload", "network_download")
+LINE_CHARTS = ("cpu", "memory", "network")
+# 감시 프로세스 요약 지표 (watch 토픽 항목 → 값)
+WATCH_METRICS = {
+    "cpu": lambda p: p["cpu_percent"],
+    "rss": lambda p: p["rss_mb"],
+    "pss": lambda p: p["pss_mb"],
+    "fds": lambda p: p["fds"],
+    "sockets": lambda p: p["sockets"],
+    "ctx": lambda p: None if p["ctx_switches_per_sec"]["voluntary"] is None else
+    p["ctx_switches_per_sec"]["voluntary"] + p["ctx_switches_per_sec"]["involuntary"],
+    "io": lambda p: None if p["io"]["read_mb_s"] is None else p["io"]["read_mb_s"] + p["io"]["write_mb_s"],
+}
+MAX_WATCHED = 32
+
+
+class RunningStats:
+    """Min/Max/Average 누적 (표본 저장 없이)"""
+
+    __slots__ = ("count", "total", "minimum", "maximum")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def as_dict(self) -> dict:
+        return {"min": self.minimum, "max": self.maximum, "avg": self.total / self.count}
+
+
+class DecimatedSeries:
+    """점진적 솎아내기 시계열
+
+    max_points 에 도달하면 인접한 두 점을 평균으로 합치고 이후 버킷 크기를 두 배로 늘린다.
+    기록 길이와 관계없이 점 수는 max_points/2 ~ max_points 사이로 유지된다.
+    """
+
+    def __init__(self, max_points: int = 300):
+        self.max_points = max_points
+        self.bucket = 1
+        self.times = []
+        self.values = []
+        self.pending_time = 0.0
+        self.pending_value = 0.0
+        self.pending_count = 0
+
+    def add(self, offset: float, value: float):
+        self.pending_time += offset
+        self.pending_value += value
+        self.pending_count += 1
+        if self.pending_count < self.bucket:
+            return
+        self.times.append(self.pending_time / self.pending_count)
+        self.values.append(self.pending_value / self.pending_count)
+        self.pending_time = self.pending_value = 0.0
+        self.pending_count = 0
+        if len(self.values) >= self.max_points:
+            self.times = [(a + b) / 2 for a, b in zip(self.times[0::2], self.times[1::2])]
+            self.values = [(a + b) / 2 for a, b in zip(self.values[0::2], self.values[1::2])]
+            self.bucket *= 2
+
+    def points(self) -> tuple:
+        """(경과 초 목록, 값 목록) - 채우는 중인 버킷 포함"""
+        if not self.pending_count:
+            return list(self.times), list(self.values)
+        return (self.times + [self.pending_time / self.pending_count],
+                self.values + [self.pending_value / self.pending_count])
+
+
+class SampleReservoir:
+    """분포 비교용 원본 표본 (capacity 초과 시 균등 저수지 표본 추출)"""
+
+    def __init__(self, capacity: int = 3600):
+        self.capacity = capacity
+        self.values = []
+        self.seen = 0
+
+    def add(self, value: float):
+        self.seen += 1
+        if len(self.values) < self.capacity:
+            self.values.append(value)
+            return
+        slot = random.randrange(self.seen)
+        if slot < self.capacity:
+            self.values[slot] = value
+
+
+class ReportBuilder:
+    """모니터링 중 리포트를 점진적으로 조립
+
+    샘플마다 요약 통계와 솎아낸 차트 시계열만 갱신하고, 백그라운드 스레드가
+    정적 섹션(시스템 정보, 디스크 차트)과 라인 차트를 미리 렌더링한다.
+    중지 시에는 마지막 렌더링 이후 바뀐 라인 차트만 다시 그린 뒤 PDF 를 조립하므로
+    소요 시간이 기록 길이와 무관하다.
+    베이스라인이 지정되면 라인 차트에 베이스라인 시계열을 겹쳐 그리고, 종료 시 분포 비교 섹션을 추가한다.
+    """
+
+    def __init__(self, generator: PDFGenerator, static_sections: Callable[[], dict],
+                 max_points: int = 300, render_interval: float = 10.0):
+        self.generator = generator
+        # {"disk": 파티션 목록, "system_info": dict} 를 반환하는 함수
+        self.static_sections = static_sections
+        self.max_points = max_points
+        self.render_interval = render_interval
+        self.lock = threading.Lock()
+        self.render_lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        # 마지막으로 완료된 실행 (베이스라인 저장용)
+        self.last_run = None
+        self.reset()
+
+    def reset(self):
+        self.start_time = None
+        self.stats = {key: RunningStats() for key in SUMMARY_METRICS}
+        self.series = {key: DecimatedSeries(self.max_points) for key in SERIES_KEYS}
+        self.samples = {key: SampleReservoir() for key in SERIES_KEYS}
+        self.events = []
+        self.watched = {}
+        self.version = 0
+        self.charts = {}
+        self.rendered_version = {}
+        self.system_info = None
+        self.baseline = None
+        self.align = None
+        self.comparison = None
+
+    def start(self, baseline: Optional[dict] = None, align: Optional[str] = None):
+        """새 리포트 시작 및 백그라운드 렌더링 스레드 실행
+
+        baseline: BaselineStore.load() 결과, align: 두 실행의 시각을 맞출 이벤트 라벨
+        """
+        self.finish_rendering()
+        with self.lock:
+            self.reset()
+            self.baseline = baseline
+            self.align = align
+            self.start_time = time.time()
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._render_loop, daemon=True)
+        self.thread.start()
+
+    def add(self, values: dict, timestamp: float = None):
+        """샘플 반영 (수집 스레드에서 호출, {monitoring_data 키: 값})"""
+        with self.lock:
+            if self.start_time is None:
+                return
+            offset = (timestamp or time.time()) - self.start_time
+            for key, value in values.items():
+                if value is None:
+                    continue
+                if key in self.stats:
+                    self.stats[key].add(value)
+                if key in self.series:
+                    self.series[key].add(offset, value)
+                    self.samples[key].add(value)
+            self.version += 1
+
+    def add_watch(self, processes: list):
+        """감시 프로세스 샘플 반영 (watch 토픽이 수집된 주기에만 호출)"""
+        with self.lock:
+            if self.start_time is None:
+                return
+            for process in processes:
+                entry = self.watched.get(process["pid"])
+                if entry is None:
+                    if len(self.watched) >= MAX_WATCHED:
+                        continue
+                    entry = self.watched[process["pid"]] = {
+                        "pid": process["pid"], "name": process["name"],
+                        "stats": {key: RunningStats() for key in WATCH_METRICS}
+                    }
+                for key, value in WATCH_METRICS.items():
+                    value = value(process)
+                    if value is not None:
+                        entry["stats"][key].add(value)
+
+    def _watch_summary(self) -> list:
+        summary = []
+        for entry in self.watched.values():
+            stats = {key: s.as_dict() for key, s in entry["stats"].items() if s.count}
+            if "rss" in stats:
+                summary.append({"pid": entry["pid"], "name": entry["name"], **stats})
+        return summary
+
+    def mark(self, label: str, timestamp: float = None) -> dict:
+        """타임라인 이벤트 표시 (예: "load test start")"""
+        with self.lock:
+            if self.start_time is None:
+                raise RuntimeError("No report in progress")
+            event = {"offset": round(max((timestamp or time.time()) - self.start_time, 0.0), 2), "label": label}
+            self.events.append(event)
+            self.events.sort(key=lambda e: e["offset"])
+            self.version += 1
+        return event
+
+    def export(self) -> dict:
+        """베이스라인 저장/비교용 실행 데이터 (분포 표본, 솎아낸 시계열, 이벤트)"""
+        with self.lock:
+            series = {}
+            for key, s in self.series.items():
+                x, y = s.points()
+                if y:
+                    series[key] = [[round(t, 2) for t in x], y]
+            return {
+                "start": self.start_time,
+                "duration": round(time.time() - self.start_time, 1) if self.start_time else 0,
+                "samples": {key: list(r.values) for key, r in self.samples.items() if r.values},
+                "series": series,
+                "events": list(self.events)
+            }
+
+    @property
+    def data_points(self) -> int:
+        return self.stats["cpu"].count
+
+    def _snapshot_series(self) -> tuple:
+        with self.lock:
+            version = self.version
+            data, times = {}, {}
+            for key, series in self.series.items():
+                times[key], data[key] = series.points()
+            events = list(self.events)
+        return version, data, times, events
+
+    def _overlay(self, name: str, events: list) -> Optional[dict]:
+        """차트에 겹칠 베이스라인 시계열 (align 이벤트 기준으로 시각 이동)"""
+        if not self.baseline:
+            return None
+        keys = CHART_INPUTS[name]
+        series = self.baseline.get("series", {})
+        if not all(key in series for key in keys):
+            return None
+        shift = align_offset(self.baseline, {"events": events}, self.align)
+        return {
+            "x": [t + shift for t in series[keys[0]][0]],
+            "series": {key: series[key][1] for key in keys},
+            "events": [dict(e, offset=e["offset"] + shift) for e in self.baseline.get("events", [])]
+        }
+
+    def _render_static(self):
+        sections = self.static_sections()
+        self.system_info = sections.get("system_info")
+        if sections.get("disk"):
+            self.charts["disk"] = self.generator.render_chart("disk", sections)
+
+    def _render_lines(self):
+        """마지막 렌더링 이후 샘플이 추가된 라인 차트만 다시 렌더링"""
+        with self.render_lock:
+            version, data, times, events = self._snapshot_series()
+            for name in LINE_CHARTS:
+                if self.rendered_version.get(name) == version:
+                    continue
+                if not all(data.get(key) for key in CHART_INPUTS[name]):
+                    continue
+                # 지표마다 자기 토픽이 수집된 시각으로 기록되므로 차트의 첫 지표 시각 축 사용
+                x = times[CHART_INPUTS[name][0]]
+                self.charts[name] = self.generator.render_chart(name, data, x=x, events=events,
+                                                                baseline=self._overlay(name, events))
+                self.rendered_version[name] = version
+
+    def _render_loop(self):
+        try:
+            with self.render_lock:
+                self._render_static()
+        except Exception as e:
+            print(f"Report static section error: {e}")
+        while not self.stop_event.wait(self.render_interval):
+            try:
+                self._render_lines()
+            except Exception as e:
+                print(f"Report chart render error: {e}")
+
+    def finish_rendering(self):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def finish(self, duration_minutes: int = 5) -> str:
+        """백그라운드 렌더링 종료 후 남은 차트만 갱신해 PDF 조립"""
+        self.finish_rendering()
+        if self.system_info is None:
+            # 시작 직후 중지된 경우 정적 섹션이 아직 없을 수 있음
+            self._render_static()
+        self._render_lines()
+        with self.lock:
+            stats = {key: s.as_dict() for key, s in self.stats.items() if s.count}
+            events = list(self.events)
+            watched = self._watch_summary()
+        self.last_run = self.export()
+        self.comparison = compare(self.baseline, self.last_run) if self.baseline else None
+        return self.generator.build(stats, dict(self.charts), self.system_info, duration_minutes,
+                                    comparison=self.comparison, events=events, watched=watched)
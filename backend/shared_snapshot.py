@@ -0,0 +1,122 @@
+import json
+import mmap
+import os
+import struct
+import time
+from typing import Any, Optional
+
+# 공유 스냅샷 파일 레이아웃 (seqlock)
+#   0  magic (8B)
+#   8  seq (u64) - 기록 중 홀수, 기록 완료 시 짝수
+#   16 length (u32) - 데이터 길이
+#   20 capacity (u32)
+#   64 데이터 (JSON UTF-8)
+# 단일 기록자(수집 프로세스)가 seq 를 홀수로 올린 뒤 데이터를 쓰고 다시 짝수로 올린다.
+# 독자는 잠금 없이 seq → 데이터 → seq 를 읽어 두 값이 같은 짝수일 때만 채택한다.
+MAGIC = b"SYSMSNP1"
+HEADER_SIZE = 64
+DEFAULT_CAPACITY = 16 * 1024 * 1024
+
+_SEQ = struct.Struct("<Q")
+_LEN = struct.Struct("<I")
+
+
+class SnapshotPublisher:
+    """수집 프로세스 측 - 최신 값을 공유 메모리 버퍼에 게시"""
+
+    def __init__(self, path: str, capacity: int = DEFAULT_CAPACITY):
+        self.path = path
+        self.capacity = capacity
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            os.ftruncate(fd, HEADER_SIZE + capacity)
+            self.mm = mmap.mmap(fd, HEADER_SIZE + capacity)
+        finally:
+            os.close(fd)
+        if self.mm[0:8] == MAGIC:
+            # 수집 프로세스 재시작 - 독자가 기존 매핑을 유지하므로 seq 를 이어서 사용
+            self.seq = _SEQ.unpack_from(self.mm, 8)[0]
+            self.seq += self.seq & 1
+        else:
+            self.seq = 0
+            self.mm[0:8] = MAGIC
+        _SEQ.pack_into(self.mm, 8, self.seq)
+        struct.pack_into("<I", self.mm, 20, capacity)
+
+    def publish_bytes(self, data: bytes) -> bool:
+        if len(data) > self.capacity:
+            print(f"Shared snapshot too large ({len(data)} > {self.capacity} bytes): {self.path}")
+            return False
+        _SEQ.pack_into(self.mm, 8, self.seq + 1)
+        self.mm[HEADER_SIZE:HEADER_SIZE + len(data)] = data
+        _LEN.pack_into(self.mm, 16, len(data))
+        self.seq += 2
+        _SEQ.pack_into(self.mm, 8, self.seq)
+        return True
+
+    def publish(self, value: Any) -> bool:
+        return self.publish_bytes(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+    def close(self):
+        self.mm.close()
+
+
+class SnapshotReader:
+    """API 워커 측 - 잠금 없이 최신 값 읽기 (seq 가 바뀐 경우에만 디코딩)"""
+
+    def __init__(self, path: str, retries: int = 100):
+        self.path = path
+        self.retries = retries
+        self.mm = None
+        self.seq = None
+        self.value = None
+
+    def _open(self) -> bool:
+        try:
+            with open(self.path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+        if mm[0:8] != MAGIC:
+            mm.close()
+            return False
+        self.mm = mm
+        return True
+
+    def read_bytes(self) -> Optional[tuple]:
+        """(seq, 데이터) - 아직 게시된 값이 없거나 계속 기록 중이면 None"""
+        if self.mm is None and not self._open():
+            return None
+        for _ in range(self.retries):
+            before = _SEQ.unpack_from(self.mm, 8)[0]
+            if before & 1:
+                # 기록 중 - 잠깐 양보 후 재시도
+                time.sleep(0)
+                continue
+            if before == 0:
+                return None
+            length = _LEN.unpack_from(self.mm, 16)[0]
+            data = self.mm[HEADER_SIZE:HEADER_SIZE + length]
+            if _SEQ.unpack_from(self.mm, 8)[0] == before:
+                return before, data
+        return None
+
+    def get(self) -> Any:
+        """최신 값 (seq 가 그대로면 이전에 디코딩한 객체 재사용)"""
+        if self.mm is not None:
+            current = _SEQ.unpack_from(self.mm, 8)[0]
+            if current == self.seq:
+                return self.value
+        result = self.read_bytes()
+        if result is None:
+            return self.value
+        seq, data = result
+        if seq != self.seq:
+            self.value = json.loads(data)
+            self.seq = seq
+        return self.value
+
+    def close(self):
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
@@ -0,0 +1,46 @@
+import re
+from typing import Dict, Iterable
+
+# 수집/구독 가능한 토픽 (스냅샷 최상위 키와 동일)
+TOPICS = ("cpu", "gpu", "memory", "disk", "network", "connections", "processes", "cgroups", "interrupts", "watch", "limits")
+
+# 토픽별 최소 수집 주기 (초) - 1초 미만은 등록한 프로세스만 읽는 watch 토픽만 허용
+MIN_INTERVALS = {topic: 1.0 for topic in TOPICS}
+MIN_INTERVALS["processes"] = 3.0
+MIN_INTERVALS["cgroups"] = 2.0
+MIN_INTERVALS["watch"] = 0.25
+# 소켓 테이블과 프로세스별 fd 수를 읽으므로 5초 이상
+MIN_INTERVALS["limits"] = 5.0
+
+# 구독 메시지를 보내지 않은 기존 클라이언트용 기본 구독
+DEFAULT_SUBSCRIPTION = [
+    "cpu@1s", "gpu@1s", "memory@1s", "disk@1s",
+    "network@1s", "connections@1s", "processes@3s"
+]
+
+_SPEC_PATTERN = re.compile(r"^([a-z_]+)(?:@(\d+(?:\.\d+)?)(ms|s|m)?)?$")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, None: 1.0}
+
+
+def parse_topic_spec(spec: str) -> tuple:
+    """'cpu@1s', 'processes@5s', 'disk' 형식의 구독 문자열을 (토픽, 주기) 로 변환"""
+    if not isinstance(spec, str):
+        raise ValueError(f"Invalid topic spec: {spec!r}")
+    match = _SPEC_PATTERN.match(spec.strip().lower())
+    if not match:
+        raise ValueError(f"Invalid topic spec: {spec}")
+    topic, value, unit = match.groups()
+    if topic not in TOPICS:
+        raise ValueError(f"Unknown topic: {topic}")
+    interval = float(value) * _UNIT_SECONDS[unit] if value else MIN_INTERVALS[topic]
+    return topic, max(interval, MIN_INTERVALS[topic])
+
+
+def parse_subscription(specs: Iterable[str]) -> Dict[str, float]:
+    """구독 문자열 목록을 {토픽: 주기} 로 변환 (같은 토픽은 짧은 주기 우선)"""
+    result = {}
+    for spec in specs:
+        topic, interval = parse_topic_spec(spec)
+        result[topic] = min(interval, result.get(topic, interval))
+    return result
+
@@ -2,13 +2,31 @@
  * Chart.js 실시간 차트 컴포넌트
  */
 
+// 샘플 행 구성 (ws-worker.js 와 동일): 0 cpu, 1 memory, 2 upload KB/s, 3 download KB/s, 4 프레임 시각 (epoch 초)
+const SAMPLE_FIELDS = 5;
+const TIME_FIELD = 4;
+const CHART_COLUMNS = { cpu: [0], memory: [1], network: [2, 3] };
+
 class ChartManager {
     constructor() {
         this.charts = {};
         this.maxDataPoints = 60; // 60초 데이터
+        this.ring = this.createRing();
+        // 새 샘플이 들어와 다시 그려야 하는 차트
+        this.dirty = new Set();
         this.init();
     }
 
+    createRing() {
+        return {
+            values: new Float64Array(this.maxDataPoints * SAMPLE_FIELDS),
+            // x 축 라벨 (수집 주기/재생 배속과 무관하게 프레임 시각 기준, 추가 시 1회 포맷)
+            labels: new Array(this.maxDataPoints).fill(''),
+            head: 0,
+            count: 0
+        };
+    }
+
     init() {
         // Chart.js 기본 설정
         Chart.defaults.font.family = "'Inter', sans-serif";
@@ -184,41 +202,50 @@ class ChartManager {
         };
     }
 
-    updateChart(chartName, value, label) {
-        const chart = this.charts[chartName];
-        if (!chart) return;
-
-        chart.data.labels.push(label);
-        chart.data.datasets[0].data.push(value);
-
-        // 최대 데이터 포인트 유지
-        if (chart.data.labels.length > this.maxDataPoints) {
-            chart.data.labels.shift();
-            chart.data.datasets[0].data.shift();
+    /**
+     * 프레임 샘플 추가 (samples: [cpu, memory, upload, download, time] 반복 Float64Array)
+     * 고정 크기 링 버퍼에만 기록하고 차트 반영은 render() 에서 일괄 처리
+     */
+    pushSamples(samples) {
+        const ring = this.ring;
+        for (let i = 0; i + SAMPLE_FIELDS <= samples.length; i += SAMPLE_FIELDS) {
+            const slot = ring.head;
+            ring.values.set(samples.subarray(i, i + SAMPLE_FIELDS), slot * SAMPLE_FIELDS);
+            ring.labels[slot] = new Date(samples[i + TIME_FIELD] * 1000).toLocaleTimeString();
+            ring.head = (slot + 1) % this.maxDataPoints;
+            if (ring.count < this.maxDataPoints) ring.count++;
         }
-
-        chart.update(); // 애니메이션 적용
+        if (samples.length) this.dirty = new Set(Object.keys(this.charts));
     }
 
-    updateNetworkChart(uploadSpeed, downloadSpeed, label) {
-        const chart = this.charts.network;
-        if (!chart) return;
-
-        chart.data.labels.push(label);
-        chart.data.datasets[0].data.push(uploadSpeed);
-        chart.data.datasets[1].data.push(downloadSpeed);
-
-        // 최대 데이터 포인트 유지
-        if (chart.data.labels.length > this.maxDataPoints) {
-            chart.data.labels.shift();
-            chart.data.datasets[0].data.shift();
-            chart.data.datasets[1].data.shift();
+    /**
+     * 링 버퍼 → 차트 데이터 배열 복사 (배열 재사용, 보이는 차트만)
+     */
+    render(isVisible) {
+        const ring = this.ring;
+        const start = (ring.head - ring.count + this.maxDataPoints) % this.maxDataPoints;
+        for (const name of this.dirty) {
+            const chart = this.charts[name];
+            if (!chart || (isVisible && !isVisible(chart.canvas))) continue;
+            const columns = CHART_COLUMNS[name];
+            const labels = chart.data.labels;
+            labels.length = ring.count;
+            chart.data.datasets.forEach(dataset => { dataset.data.length = ring.count; });
+            for (let n = 0; n < ring.count; n++) {
+                const slot = (start + n) % this.maxDataPoints;
+                labels[n] = ring.labels[slot];
+                columns.forEach((column, d) => {
+                    const value = ring.values[slot * SAMPLE_FIELDS + column];
+                    chart.data.datasets[d].data[n] = Number.isNaN(value) ? null : value;
+                });
+            }
+            chart.update('none');
+            this.dirty.delete(name);
         }
-
-        chart.update(); // 애니메이션 적용
     }
 
     resetAllCharts() {
+        this.ring = this.createRing();
         Object.values(this.charts).forEach(chart => {
             chart.data.labels = [];
             chart.data.datasets.forEach(dataset => {
@@ -226,6 +253,7 @@ class ChartManager {
             });
             chart.update('none');
         });
+        this.dirty = new Set();
     }
 }
 
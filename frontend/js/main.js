@@ -6,11 +6,88 @@ document.addEventListener('DOMContentLoaded', () => {
     initApp();
 });
 
+// 대시보드가 표시하는 토픽과 갱신 주기
+const DASHBOARD_TOPICS = [
+    'cpu@1s', 'gpu@1s', 'memory@1s', 'network@1s',
+    'connections@5s', 'disk@10s', 'processes@3s'
+];
+
+// 토픽별 렌더러와 해당 카드/표 요소 (화면에 보이는 요소가 있을 때만 갱신)
+const TOPIC_VIEWS = {
+    cpu: { render: data => updateCPU(data), elements: ['cpuCard'] },
+    gpu: { render: data => updateGPU(data), elements: ['gpuCard'] },
+    memory: { render: data => updateMemory(data), elements: ['memoryCard'] },
+    network: { render: data => updateNetwork(data), elements: ['networkCard'] },
+    connections: { render: data => updateConnections(data), elements: ['networkCard'] },
+    disk: { render: data => updateDisk(data), elements: ['diskGrid'] },
+    processes: {
+        render: data => updateProcesses(data),
+        elements: ['cpuProcessTable', 'memoryProcessTable', 'networkProcessTable', 'diskProcessTable']
+    },
+    monitoring: { render: data => updateMonitoringStatus(data), elements: null }
+};
+
+// 렌더링 상태: 토픽별 최신 값, 다시 그려야 하는 토픽, 화면에 보이는 요소
+const view = { latest: {}, dirty: new Set(), visible: new Set(), observer: null, frameRequested: false };
+
+function initVisibilityTracking() {
+    if (!('IntersectionObserver' in window)) return;
+    view.observer = new IntersectionObserver(entries => {
+        entries.forEach(e => e.isIntersecting ? view.visible.add(e.target) : view.visible.delete(e.target));
+        scheduleRender();
+    });
+    const ids = new Set(Object.values(TOPIC_VIEWS).flatMap(v => v.elements || []));
+    ids.forEach(id => { const el = document.getElementById(id); if (el) view.observer.observe(el); });
+    Object.values(chartManager.charts).forEach(chart => view.observer.observe(chart.canvas));
+    // 숨겨진 탭에서 돌아오면 밀린 내용을 한 번에 반영
+    document.addEventListener('visibilitychange', () => { if (!document.hidden) scheduleRender(); });
+}
+
+function isVisible(el) {
+    return !view.observer || view.visible.has(el);
+}
+
+function scheduleRender() {
+    if (view.frameRequested) return;
+    view.frameRequested = true;
+    requestAnimationFrame(renderFrame);
+}
+
+/**
+ * requestAnimationFrame 마다 한 번, 바뀐 토픽 중 보이는 카드만 갱신
+ */
+function renderFrame() {
+    view.frameRequested = false;
+    if (document.hidden) return;
+    for (const topic of [...view.dirty]) {
+        const topicView = TOPIC_VIEWS[topic];
+        const visible = !topicView.elements || topicView.elements.some(id => {
+            const el = document.getElementById(id);
+            return el && isVisible(el);
+        });
+        if (!visible) continue;
+        topicView.render(view.latest[topic]);
+        view.dirty.delete(topic);
+    }
+    chartManager.render(isVisible);
+    // 다음 배치 요청 (그동안 도착한 프레임은 워커에서 병합)
+    wsManager.ack();
+}
+
 function initApp() {
     wsManager.onConnectionChange(handleConnectionChange);
     wsManager.onData(handleData);
+    // ?replay=<기록 이름>&speed=10 이면 실시간 대신 기록 재생
+    const params = new URLSearchParams(window.location.search);
+    if (params.get('replay')) {
+        const query = new URLSearchParams({ name: params.get('replay'), speed: params.get('speed') || '1' });
+        wsManager.path = `/ws/replay?${query}`;
+    } else {
+        wsManager.subscribe(DASHBOARD_TOPICS);
+    }
     wsManager.connect();
     setupEventListeners();
+    initVisibilityTracking();
 }
 
 function setupEventListeners() {
@@ -28,16 +105,28 @@ function handleConnectionChange(connected) {
     textEl.textContent = connected ? 'Connected' : 'Disconnected';
 }
 
-function handleData(data) {
-    updateCPU(data.cpu);
-    updateGPU(data.gpu);
-    updateMemory(data.memory);
-    updateNetwork(data.network);
-    updateDisk(data.disk);
-    updateProcesses(data.processes);
-    updateCharts(data);
-    if (data.monitoring) updateMonitoringStatus(data.monitoring);
+/**
+ * 프레임(또는 워커가 병합한 배치) 수신 - 최신 값만 저장하고 렌더링은 rAF 로 미룸
+ */
+function handleData(data, samples) {
+    for (const topic in TOPIC_VIEWS) {
+        if (data[topic]) {
+            view.latest[topic] = data[topic];
+            view.dirty.add(topic);
+        }
+    }
+    chartManager.pushSamples(samples);
+    if (data.error) console.error('Subscription error:', data.error);
+    if (data.replay) updateReplayStatus(data.replay);
+    if (data.alerts) handleAlerts(data.alerts);
     if (data.monitoring_complete) handleMonitoringComplete(data);
+    scheduleRender();
+}
+
+function updateReplayStatus(replay) {
+    const textEl = document.getElementById('connectionStatus').querySelector('.status-text');
+    const time = new Date(replay.time * 1000).toLocaleTimeString();
+    textEl.textContent = replay.finished ? `Replay finished (${replay.name})` : `Replay ${replay.speed}x · ${time}`;
 }
 
 function updateCPU(cpu) {
@@ -83,7 +172,11 @@ function updateNetwork(net) {
     document.getElementById('downloadSpeed').textContent = net.speed.download_speed_formatted;
     document.getElementById('totalSent').textContent = net.io.bytes_sent_formatted;
     document.getElementById('totalReceived').textContent = net.io.bytes_recv_formatted;
-    document.getElementById('networkConnections').textContent = `${net.connections.total} connections`;
+}
+
+function updateConnections(connections) {
+    if (!connections) return;
+    document.getElementById('networkConnections').textContent = `${connections.total} connections`;
 }
 
 function updateDisk(disk) {
@@ -103,19 +196,6 @@ function updateDisk(disk) {
     lucide.createIcons();
 }
 
-let dataCounter = 0;
-function updateCharts(data) {
-    dataCounter++;
-    const label = `${dataCounter}s`;
-    if (data.cpu) chartManager.updateChart('cpu', data.cpu.usage.percent, label);
-    if (data.memory) chartManager.updateChart('memory', data.memory.virtual.percent, label);
-    if (data.network) {
-        const up = data.network.speed.upload_speed / 1024;
-        const down = data.network.speed.download_speed / 1024;
-        chartManager.updateNetworkChart(up, down, label);
-    }
-}
-
 function updateRing(id, percent) {
     const ring = document.getElementById(id);
     if (!ring) return;
@@ -187,6 +267,13 @@ function handleMonitoringComplete(data) {
     loadReports();
 }
 
+function handleAlerts(alerts) {
+    alerts.forEach(a => {
+        const type = a.status === 'resolved' ? 'success' : (a.severity === 'critical' ? 'error' : 'info');
+        showToast(a.message, type);
+    });
+}
+
 async function loadReports() {
     try {
         const res = await fetch('/api/reports');
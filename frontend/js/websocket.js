@@ -1,38 +1,74 @@
 /**
  * WebSocket 연결 관리
+ *
+ * Web Worker 를 지원하면 연결/JSON 파싱/프레임 병합을 ws-worker.js 에서 처리하고,
+ * 메인 스레드는 배치(data + 차트 샘플)만 받는다. 미지원 환경은 직접 연결.
  */
+const WS_WORKER_URL = document.currentScript
+    ? new URL('ws-worker.js', document.currentScript.src).href
+    : '/static/js/ws-worker.js';
+
+/**
+ * 프레임에서 차트 샘플 추출 [cpu, memory, upload KB/s, download KB/s, 시각] (워커 미사용 시)
+ */
+function frameSamples(data) {
+    if (!data.cpu && !data.memory && !data.network) return new Float64Array(0);
+    return Float64Array.of(
+        data.cpu ? data.cpu.usage.percent : NaN,
+        data.memory ? data.memory.virtual.percent : NaN,
+        data.network ? data.network.speed.upload_speed / 1024 : NaN,
+        data.network ? data.network.speed.download_speed / 1024 : NaN,
+        data.replay ? data.replay.time : (data.sent_at || Date.now() / 1000)
+    );
+}
+
 class WebSocketManager {
     constructor() {
         this.ws = null;
+        this.worker = null;
         this.reconnectAttempts = 0;
         this.maxReconnectAttempts = 10;
         this.reconnectDelay = 2000;
         this.isConnected = false;
         this.onDataCallback = null;
         this.onConnectionChangeCallback = null;
+        this.subscription = null;
+        // 연결 경로 (기록 재생 시 '/ws/replay?name=...')
+        this.path = '/ws';
     }
 
     connect() {
         const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-        const wsUrl = `${protocol}//${window.location.host}/ws`;
+        const wsUrl = `${protocol}//${window.location.host}${this.path}`;
+
+        if (window.Worker && !this.worker) {
+            try {
+                this.worker = new Worker(WS_WORKER_URL);
+                this.worker.onmessage = (event) => this.handleWorkerMessage(event.data);
+                this.worker.postMessage({ type: 'connect', url: wsUrl, subscription: this.subscription });
+                return;
+            } catch (e) {
+                console.warn('Worker unavailable, decoding on main thread:', e);
+                this.worker = null;
+            }
+        }
 
         try {
             this.ws = new WebSocket(wsUrl);
             this.ws.onopen = () => {
-                this.isConnected = true;
+                this.setConnected(true);
                 this.reconnectAttempts = 0;
-                if (this.onConnectionChangeCallback) this.onConnectionChangeCallback(true);
+                if (this.subscription) this.send({ subscribe: this.subscription });
             };
             this.ws.onclose = () => {
-                this.isConnected = false;
-                if (this.onConnectionChangeCallback) this.onConnectionChangeCallback(false);
+                this.setConnected(false);
                 this.scheduleReconnect();
             };
             this.ws.onerror = (e) => console.error('WebSocket error:', e);
             this.ws.onmessage = (event) => {
                 try {
                     const data = JSON.parse(event.data);
-                    if (this.onDataCallback) this.onDataCallback(data);
+                    if (this.onDataCallback) this.onDataCallback(data, frameSamples(data));
                 } catch (e) { console.error('Parse error:', e); }
             };
         } catch (error) {
@@ -40,6 +76,21 @@ class WebSocketManager {
         }
     }
 
+    handleWorkerMessage(msg) {
+        if (msg.type === 'batch') {
+            if (this.onDataCallback) this.onDataCallback(msg.data, msg.samples);
+        } else if (msg.type === 'connection') {
+            this.setConnected(msg.connected);
+        } else if (msg.type === 'error') {
+            console.error(msg.message);
+        }
+    }
+
+    setConnected(connected) {
+        this.isConnected = connected;
+        if (this.onConnectionChangeCallback) this.onConnectionChangeCallback(connected);
+    }
+
     scheduleReconnect() {
         if (this.reconnectAttempts < this.maxReconnectAttempts) {
             this.reconnectAttempts++;
@@ -47,7 +98,31 @@ class WebSocketManager {
         }
     }
 
-    disconnect() { if (this.ws) { this.ws.close(); this.ws = null; } }
+    /**
+     * 토픽 구독 (예: ['cpu@1s', 'processes@5s']) - 재연결 시 자동 재구독
+     */
+    subscribe(topics) {
+        this.subscription = topics;
+        if (this.worker) this.worker.postMessage({ type: 'subscribe', topics });
+        else if (this.isConnected) this.send({ subscribe: topics });
+    }
+
+    send(message) {
+        if (this.worker) this.worker.postMessage({ type: 'send', message });
+        else if (this.ws && this.ws.readyState === WebSocket.OPEN) this.ws.send(JSON.stringify(message));
+    }
+
+    /**
+     * 배치를 화면에 반영했음을 워커에 알림 (그동안 도착한 프레임은 워커가 합쳐서 보관)
+     */
+    ack() {
+        if (this.worker) this.worker.postMessage({ type: 'ack' });
+    }
+
+    disconnect() {
+        if (this.worker) { this.worker.postMessage({ type: 'disconnect' }); this.worker.terminate(); this.worker = null; }
+        if (this.ws) { this.ws.close(); this.ws = null; }
+    }
     onData(callback) { this.onDataCallback = callback; }
     onConnectionChange(callback) { this.onConnectionChangeCallback = callback; }
 }
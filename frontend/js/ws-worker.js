@@ -0,0 +1,130 @@
+/**
+ * WebSocket 수신 & 디코딩 워커
+ *
+ * 메인 스레드 대신 JSON 을 파싱하고, 메인 스레드가 이전 배치를 그릴 때까지(ack)
+ * 도착한 프레임을 하나의 배치로 합쳐서 전달한다.
+ * 차트용 값은 프레임마다 Float64Array 샘플로 모아 전송(transfer)한다.
+ */
+
+// 차트 샘플 필드 (프레임당 1행)
+const SAMPLE_FIELDS = 5; // cpu, memory, upload KB/s, download KB/s, 프레임 시각 (epoch 초)
+const MAX_PENDING_SAMPLES = 600;
+
+let ws = null;
+let url = null;
+let reconnectAttempts = 0;
+const maxReconnectAttempts = 10;
+const reconnectDelay = 2000;
+let subscription = null;
+
+let pending = null;       // 합쳐진 프레임 데이터
+let pendingSamples = [];  // 아직 보내지 않은 차트 샘플
+let awaitingAck = false;
+
+function connect() {
+    try {
+        ws = new WebSocket(url);
+    } catch (e) {
+        scheduleReconnect();
+        return;
+    }
+    ws.onopen = () => {
+        reconnectAttempts = 0;
+        if (subscription) send({ subscribe: subscription });
+        postMessage({ type: 'connection', connected: true });
+    };
+    ws.onclose = () => {
+        postMessage({ type: 'connection', connected: false });
+        scheduleReconnect();
+    };
+    ws.onerror = () => postMessage({ type: 'error', message: 'WebSocket error' });
+    ws.onmessage = (event) => {
+        let data;
+        try {
+            data = JSON.parse(event.data);
+        } catch (e) {
+            postMessage({ type: 'error', message: 'Parse error: ' + e.message });
+            return;
+        }
+        merge(data);
+        flush();
+    };
+}
+
+function scheduleReconnect() {
+    if (url && reconnectAttempts < maxReconnectAttempts) {
+        reconnectAttempts++;
+        setTimeout(connect, reconnectDelay);
+    }
+}
+
+function send(message) {
+    if (ws && ws.readyState === WebSocket.OPEN) ws.send(JSON.stringify(message));
+}
+
+/**
+ * 프레임 합치기 - 토픽 값은 최신 값으로 덮어쓰고, 이벤트성 필드는 누적
+ */
+function merge(data) {
+    if (!pending) pending = {};
+    for (const key in data) {
+        if (key === 'alerts') {
+            pending.alerts = (pending.alerts || []).concat(data.alerts);
+        } else if (key === 'process_table') {
+            // 변경분은 순서대로 적용해야 하므로 누적
+            (pending.process_table = pending.process_table || []).push(data.process_table);
+        } else {
+            pending[key] = data[key];
+        }
+    }
+    if (data.cpu || data.memory || data.network) {
+        pendingSamples.push(
+            data.cpu ? data.cpu.usage.percent : NaN,
+            data.memory ? data.memory.virtual.percent : NaN,
+            data.network ? data.network.speed.upload_speed / 1024 : NaN,
+            data.network ? data.network.speed.download_speed / 1024 : NaN,
+            // 재생 중에는 기록 시각, 실시간은 서버 전송 시각
+            data.replay ? data.replay.time : (data.sent_at || Date.now() / 1000)
+        );
+        // 메인 스레드가 오래 멈춘 경우(숨김 탭) 차트 창 크기만큼만 유지
+        const excess = pendingSamples.length - MAX_PENDING_SAMPLES * SAMPLE_FIELDS;
+        if (excess > 0) pendingSamples.splice(0, excess);
+    }
+}
+
+function flush() {
+    if (awaitingAck || !pending) return;
+    const samples = new Float64Array(pendingSamples);
+    postMessage({ type: 'batch', data: pending, samples }, [samples.buffer]);
+    pending = null;
+    pendingSamples = [];
+    awaitingAck = true;
+}
+
+onmessage = (event) => {
+    const msg = event.data;
+    switch (msg.type) {
+        case 'connect':
+            url = msg.url;
+            subscription = msg.subscription;
+            connect();
+            break;
+        case 'subscribe':
+            subscription = msg.topics;
+            send({ subscribe: msg.topics });
+            break;
+        case 'send':
+            send(msg.message);
+            break;
+        case 'ack':
+            // 메인 스레드가 이전 배치를 그림 → 쌓인 프레임 전송
+            awaitingAck = false;
+            flush();
+            break;
+        case 'disconnect':
+            url = null;
+            if (ws) ws.close();
+            ws = null;
+            break;
+    }
+};